@@ -0,0 +1,6 @@
+"""Performance benchmarks for the Lost and Found Application.
+
+Each module is a standalone script run from the repository root, e.g.
+``python -m benchmarks.bench_http_api --help``.  Benchmarks are not part of
+the pytest suite.
+"""
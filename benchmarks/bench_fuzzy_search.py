@@ -0,0 +1,49 @@
+"""Benchmark typo-tolerant search latency on a large database.
+
+Seeds a temporary database and times :meth:`AppController.fuzzy_search` for a
+set of misspelt keywords, reporting latency percentiles per query.
+
+Usage::
+
+    python -m benchmarks.bench_fuzzy_search --items 100000 --repeat 5
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.common import percentile, seed_database
+from src.controllers.app_controller import AppController
+from src.models.database import DatabaseManager
+
+TYPOS = ["samsng", "jackit", "umbrela", "libary", "macbok pro", "cafetria", "walet"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000, help="rows to seed")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per keyword")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "bench.db"))
+        seed_database(db, args.items)
+        controller = AppController(db)
+
+        for keyword in TYPOS:
+            latencies = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                results = controller.fuzzy_search(keyword)
+                latencies.append(time.perf_counter() - started)
+            latencies.sort()
+            print(
+                f"{keyword:<12} results={len(results):<4} "
+                f"p50={percentile(latencies, 0.50) * 1000:7.2f}ms "
+                f"max={latencies[-1] * 1000:7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark the JSON HTTP API under concurrent clients.
+
+Starts the API server in-process on a free port, backed by a freshly seeded
+temporary database, then runs N client threads for a fixed duration.  Each
+client keeps one persistent HTTP/1.1 connection and issues a mix of search
+page, item lookup and stats requests.  Reports requests per second and
+latency percentiles.
+
+Usage::
+
+    python -m benchmarks.bench_http_api --clients 1 8 32 --duration 5
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from http.client import HTTPConnection
+from typing import List
+
+from benchmarks.common import KEYWORDS, percentile, seed_database
+from src.api.server import create_server
+
+
+def _client(
+    port: int,
+    item_ids: List[int],
+    deadline: float,
+    latencies: List[float],
+    errors: List[int],
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    conn = HTTPConnection("127.0.0.1", port, timeout=30)
+    while time.perf_counter() < deadline:
+        roll = rng.random()
+        if roll < 0.6:
+            path = f"/items?q={rng.choice(KEYWORDS)}&limit=50"
+        elif roll < 0.9:
+            path = f"/items/{rng.choice(item_ids)}"
+        else:
+            path = "/stats"
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            json.loads(response.read())
+            if response.status >= 400:
+                errors.append(response.status)
+        except OSError:
+            errors.append(0)
+            conn.close()
+            conn = HTTPConnection("127.0.0.1", port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run(clients: int, duration: float, port: int, item_ids: List[int]) -> None:
+    """Runs one benchmark round and prints its results."""
+    latencies: List[float] = []
+    errors: List[int] = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(
+            target=_client, args=(port, item_ids, deadline, latencies, errors, n)
+        )
+        for n in range(clients)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"clients={clients:<4} requests={len(latencies):<7} "
+        f"rps={len(latencies) / elapsed:9.1f} "
+        f"p50={percentile(latencies, 0.50) * 1000:7.2f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:7.2f}ms "
+        f"errors={len(errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000, help="rows to seed")
+    parser.add_argument(
+        "--clients", type=int, nargs="+", default=[1, 8, 32], help="client counts"
+    )
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per round")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = create_server(os.path.join(tmp, "bench.db"), port=0)
+        item_ids = seed_database(server.controller.db, args.items)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            for clients in args.clients:
+                run(clients, args.duration, server.server_port, item_ids)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
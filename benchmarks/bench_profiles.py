@@ -0,0 +1,90 @@
+"""Compare the SQLite performance profiles on read- and write-heavy workloads.
+
+For every profile a fresh temporary database is seeded and three workloads
+are timed against it:
+
+- ``bulk``: inserting rows in large transactions with ``add_items``;
+- ``writes``: single-row ``add_item``/``update_item`` calls, one commit each;
+- ``reads``: a mix of ``get_item`` lookups and keyword ``search_page`` calls.
+
+Usage::
+
+    python -m benchmarks.bench_profiles --items 50000 --ops 2000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.common import KEYWORDS, random_item, seed_database
+from src.controllers.app_controller import AppController
+from src.models.database import DatabaseManager
+from src.models.profiles import PROFILES
+
+
+def timed(operation: Callable[[], None]) -> float:
+    """Returns the wall-clock seconds taken by a call."""
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+
+def run(profile: str, items: int, ops: int) -> None:
+    """Runs every workload against a fresh database and prints the rates."""
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "bench.db"), profile=profile)
+        controller = AppController(db)
+        ids = []
+        bulk = timed(lambda: ids.extend(seed_database(db, items)))
+
+        def writes() -> None:
+            for n in range(ops):
+                if n % 2:
+                    item = random_item(rng)
+                    controller.add_item(item)
+                else:
+                    item = db.get_item(rng.choice(ids))
+                    item.status = rng.choice(["Lost", "Found", "Claimed"])
+                    controller.update_item(item)
+
+        def reads() -> None:
+            for n in range(ops):
+                if n % 4:
+                    controller.get_item(rng.choice(ids))
+                else:
+                    controller.search_page(rng.choice(KEYWORDS), limit=50)
+
+        write_time = timed(writes)
+        read_time = timed(reads)
+        db.close()
+
+    print(
+        f"{profile:<10} bulk={items / bulk:9.0f} rows/s "
+        f"writes={ops / write_time:8.0f} ops/s "
+        f"reads={ops / read_time:8.0f} ops/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50000, help="rows to seed")
+    parser.add_argument("--ops", type=int, default=2000, help="operations per workload")
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=list(PROFILES),
+        choices=list(PROFILES),
+        help="profiles to compare",
+    )
+    args = parser.parse_args()
+
+    for profile in args.profiles:
+        run(profile, args.items, args.ops)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark search throughput of the process-pool query service.
+
+Seeds a temporary database, then issues a fixed batch of concurrent keyword
+searches first in-process (single core, the baseline) and then through a
+:class:`QueryPool` with increasing worker counts.  Reports queries per second
+and the speed-up over the baseline for each configuration.
+
+Usage::
+
+    python -m benchmarks.bench_query_pool --items 50000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import KEYWORDS, seed_database
+from src.controllers.app_controller import AppController
+from src.controllers.query_pool import QueryPool
+from src.models.database import DatabaseManager
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000, help="rows to seed")
+    parser.add_argument("--queries", type=int, default=200, help="searches per round")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, os.cpu_count() or 1],
+        help="worker process counts",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    keywords = [rng.choice(KEYWORDS) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "bench.db")
+        db = DatabaseManager(db_name)
+        seed_database(db, args.items)
+        controller = AppController(db)
+
+        started = time.perf_counter()
+        for keyword in keywords:
+            controller.search_items(keyword)
+        baseline = args.queries / (time.perf_counter() - started)
+        print(f"in-process    qps={baseline:8.1f}")
+
+        for workers in args.workers:
+            with QueryPool(db_name, workers=workers) as pool:
+                # Warm every worker up so process start-up is not measured.
+                for future in [pool.submit_search("warmup") for _ in range(workers)]:
+                    future.result()
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=workers * 2) as clients:
+                    list(clients.map(pool.search_rows, keywords))
+                qps = args.queries / (time.perf_counter() - started)
+            print(f"workers={workers:<5} qps={qps:8.1f} speedup={qps / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark concurrent item submissions with and without group commit.
+
+For each producer count, every producer thread inserts items as fast as it
+can for a fixed duration, either calling ``DatabaseManager.add_item``
+directly (one transaction and commit per write, producers contend for the
+write lock) or through a :class:`WriteQueue` (one writer, batched commits).
+Reports writes per second, p99 latency and ``database is locked`` errors.
+
+Usage::
+
+    python -m benchmarks.bench_write_queue --producers 1 8 64 --duration 3
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Callable, List
+
+from benchmarks.common import percentile, random_item
+from src.models.database import DatabaseManager
+from src.models.write_queue import WriteQueue
+
+
+def _produce(
+    write: Callable,
+    deadline: float,
+    latencies: List[float],
+    errors: List[str],
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        item = random_item(rng)
+        start = time.perf_counter()
+        try:
+            write(item)
+        except sqlite3.OperationalError as e:
+            errors.append(str(e))
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def run(mode: str, producers: int, duration: float, tmp: str) -> None:
+    """Runs one benchmark round and prints its results."""
+    db = DatabaseManager(os.path.join(tmp, f"{mode}-{producers}.db"))
+    write_queue = WriteQueue(db) if mode == "queue" else None
+    if write_queue is not None:
+
+        def write(item):
+            return write_queue.submit_add(item).result()
+
+    else:
+        write = db.add_item
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=_produce, args=(write, deadline, latencies, errors, n))
+        for n in range(producers)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if write_queue is not None:
+        write_queue.close()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"{mode:<7} producers={producers:<3} "
+        f"writes/s={len(latencies) / elapsed:9.1f} "
+        f"p99={percentile(latencies, 0.99) * 1000:8.2f}ms "
+        f"errors={len(errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--producers", type=int, nargs="+", default=[1, 8, 64], help="producer counts"
+    )
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds per round")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for producers in args.producers:
+            for mode in ("direct", "queue"):
+                run(mode, producers, args.duration, tmp)
+
+
+if __name__ == "__main__":
+    main()
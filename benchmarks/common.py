@@ -0,0 +1,74 @@
+"""Helpers shared by the benchmark scripts."""
+
+import random
+from typing import List, Sequence
+
+from src.models.database import DatabaseManager
+from src.models.item import Item
+
+NAMES = [
+    "Black iPhone 13",
+    "MacBook Pro",
+    "Green Jacket",
+    "Samsung Galaxy 8",
+    "Blue Umbrella",
+    "Water Bottle",
+    "Student ID Card",
+    "Car Keys",
+    "Calculus Textbook",
+    "Wireless Earbuds",
+    "Grey Hoodie",
+    "Leather Wallet",
+]
+CATEGORIES = ["Electronics", "Clothing", "Books", "Misc"]
+LOCATIONS = ["Library", "Cafeteria", "Gym", "Main Hall", "Lecture Theatre A"]
+STATUSES = ["Lost", "Found", "Claimed"]
+KEYWORDS = ["book", "library", "jacket", "keys", "gym", "samsung", "wallet"]
+
+
+def random_item(rng: random.Random) -> Item:
+    """Builds a plausible random item."""
+    return Item(
+        name=f"{rng.choice(NAMES)} {rng.randint(1, 9999)}",
+        category=rng.choice(CATEGORIES),
+        date=(
+            f"20{rng.randint(20, 25)}-{rng.randint(1, 12):02d}"
+            f"-{rng.randint(1, 28):02d}"
+        ),
+        location=rng.choice(LOCATIONS),
+        status=rng.choice(STATUSES),
+        contact_info=f"user{rng.randint(1, 5000)}@university.ac.uk",
+    )
+
+
+def seed_database(db: DatabaseManager, count: int, seed: int = 42) -> List[int]:
+    """
+    Inserts ``count`` random items and returns their IDs.
+
+    Args:
+        db (DatabaseManager): The database to populate.
+        count (int): The number of items to insert.
+        seed (int, optional): Seed for the random generator. Defaults to 42.
+
+    Returns:
+        List[int]: The IDs of the inserted items.
+    """
+    rng = random.Random(seed)
+    return db.add_items([random_item(rng) for _ in range(count)])
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Returns a percentile of pre-sorted values using the nearest-rank method.
+
+    Args:
+        sorted_values (Sequence[float]): The values, sorted ascending.
+        fraction (float): The percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        float: The value at the requested rank, or 0.0 for no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
@@ -0,0 +1,257 @@
+"""Load-test the controller with concurrent simulated desk and web clients.
+
+Seeds a database (a temporary one unless ``--db`` is given), then runs N
+clients as threads or processes for a fixed duration.  Each client owns its
+own :class:`DatabaseManager` and :class:`AppController`, like a separate desk
+application or web worker, and issues a weighted random mix of operations:
+
+- ``add``: insert a random item;
+- ``search``: a keyword search page of 50 results;
+- ``filter``: all items of a random category and status;
+- ``update``: read a random item and update it with its version;
+- ``delete``: delete a random item.
+
+The report gives the overall throughput, latency percentiles per operation,
+the errors by kind (``locked`` for SQLite lock contention, ``conflict`` for
+version conflicts) and a per-interval time series of throughput, p99 latency
+and errors, which shows when contention builds up.
+
+Usage::
+
+    python -m benchmarks.load_test --clients 16 --mode process --duration 10 \\
+        --mix add=10 search=50 filter=20 update=15 delete=5 --busy-timeout 100
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import (
+    CATEGORIES,
+    KEYWORDS,
+    STATUSES,
+    percentile,
+    random_item,
+    seed_database,
+)
+from src.controllers.app_controller import AppController
+from src.models.database import ConflictError, DatabaseManager
+
+OPERATIONS = ("add", "search", "filter", "update", "delete")
+DEFAULT_MIX = {"add": 10, "search": 50, "filter": 20, "update": 15, "delete": 5}
+
+# (seconds since start, operation, latency in seconds, outcome)
+Sample = Tuple[float, str, float, str]
+
+
+def parse_mix(entries: List[str]) -> Dict[str, int]:
+    """
+    Parses ``op=weight`` pairs into an operation mix.
+
+    Args:
+        entries (List[str]): Pairs such as ``["add=10", "search=90"]``.
+
+    Returns:
+        Dict[str, int]: The weight of each listed operation.
+
+    Raises:
+        argparse.ArgumentTypeError: If an entry is malformed or unknown.
+    """
+    mix = {}
+    for entry in entries:
+        name, _, weight = entry.partition("=")
+        if name not in OPERATIONS or not weight.isdigit():
+            raise argparse.ArgumentTypeError(
+                f"invalid mix entry '{entry}'; expected op=weight with op in "
+                f"{', '.join(OPERATIONS)}"
+            )
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("the mix needs a positive weight")
+    return mix
+
+
+def classify(error: Exception) -> str:
+    """Names the kind of a failed operation for the report."""
+    if isinstance(error, ConflictError):
+        return "conflict"
+    if isinstance(error, sqlite3.OperationalError) and (
+        "locked" in str(error) or "busy" in str(error)
+    ):
+        return "locked"
+    return f"error:{type(error).__name__}"
+
+
+def run_client(
+    db_name: str,
+    mix: Dict[str, int],
+    max_id: int,
+    start: float,
+    deadline: float,
+    seed: int,
+    busy_timeout: Optional[int],
+) -> List[Sample]:
+    """
+    Runs one simulated client until the deadline and returns its samples.
+
+    Times are measured with ``time.time`` so that samples from separate
+    processes share a clock.
+    """
+    rng = random.Random(seed)
+    pragmas = {"busy_timeout": busy_timeout} if busy_timeout is not None else None
+    controller = AppController(DatabaseManager(db_name, pragmas=pragmas))
+    operations = list(mix)
+    weights = [mix[name] for name in operations]
+
+    def update() -> None:
+        item = controller.get_item(rng.randint(1, max_id))
+        if item is not None:
+            item.status = rng.choice(STATUSES)
+            controller.update_item(item, expected_version=item.version)
+
+    actions: Dict[str, Callable[[], object]] = {
+        "add": lambda: controller.add_item(random_item(rng)),
+        "search": lambda: controller.search_page(rng.choice(KEYWORDS), limit=50),
+        "filter": lambda: controller.filter_items(
+            rng.choice(CATEGORIES), rng.choice(STATUSES)
+        ),
+        "update": update,
+        "delete": lambda: controller.delete_item(rng.randint(1, max_id)),
+    }
+
+    samples: List[Sample] = []
+    while True:
+        began = time.time()
+        if began >= deadline:
+            break
+        operation = rng.choices(operations, weights)[0]
+        try:
+            actions[operation]()
+            outcome = "ok"
+        except Exception as e:
+            outcome = classify(e)
+        samples.append((began - start, operation, time.time() - began, outcome))
+    controller.db.close()
+    return samples
+
+
+def report(samples: List[Sample], duration: float, interval: float) -> None:
+    """Prints the summary tables for the collected samples."""
+    print(f"\noperations={len(samples)} throughput={len(samples) / duration:.1f} ops/s")
+
+    print(
+        f"\n{'operation':<10}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'max ms':>10}{'errors':>8}"
+    )
+    for operation in OPERATIONS:
+        latencies = sorted(s[2] for s in samples if s[1] == operation)
+        if not latencies:
+            continue
+        errors = sum(1 for s in samples if s[1] == operation and s[3] != "ok")
+        print(
+            f"{operation:<10}{len(latencies):>8}"
+            f"{percentile(latencies, 0.50) * 1000:>10.2f}"
+            f"{percentile(latencies, 0.95) * 1000:>10.2f}"
+            f"{percentile(latencies, 0.99) * 1000:>10.2f}"
+            f"{latencies[-1] * 1000:>10.2f}{errors:>8}"
+        )
+
+    outcomes = Counter(s[3] for s in samples if s[3] != "ok")
+    print("\nerrors: " + (", ".join(f"{k}={v}" for k, v in outcomes.items()) or "none"))
+
+    buckets: Dict[int, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        buckets[int(sample[0] // interval)].append(sample)
+    print(f"\n{'t (s)':>8}{'ops/s':>10}{'p99 ms':>10}{'locked':>8}{'other':>8}")
+    for index in sorted(buckets):
+        bucket = buckets[index]
+        latencies = sorted(s[2] for s in bucket)
+        locked = sum(1 for s in bucket if s[3] == "locked")
+        other = sum(1 for s in bucket if s[3] not in ("ok", "locked"))
+        print(
+            f"{index * interval:>8.1f}{len(bucket) / interval:>10.1f}"
+            f"{percentile(latencies, 0.99) * 1000:>10.2f}{locked:>8}{other:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", help="existing database to load (default: temporary)")
+    parser.add_argument("--items", type=int, default=10000, help="rows to seed")
+    parser.add_argument("--clients", type=int, default=8, help="simulated clients")
+    parser.add_argument(
+        "--mode",
+        choices=("thread", "process"),
+        default="thread",
+        help="run clients as threads or processes",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument(
+        "--mix",
+        nargs="+",
+        default=None,
+        metavar="OP=WEIGHT",
+        help=(
+            "operation weights "
+            "(default: add=10 search=50 filter=20 update=15 delete=5)"
+        ),
+    )
+    parser.add_argument(
+        "--busy-timeout",
+        type=int,
+        default=None,
+        help="override SQLite's busy timeout (ms); lower values expose contention",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="time series step (s)"
+    )
+    args = parser.parse_args()
+    mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = args.db or os.path.join(tmp, "load.db")
+        db = DatabaseManager(db_name)
+        if not args.db:
+            seed_database(db, args.items)
+        db.close()
+        with closing(sqlite3.connect(db_name)) as conn:
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 1) FROM items").fetchone()[
+                0
+            ]
+
+        print(
+            f"clients={args.clients} mode={args.mode} "
+            f"duration={args.duration}s mix={mix}"
+        )
+        executor_class = (
+            ThreadPoolExecutor if args.mode == "thread" else ProcessPoolExecutor
+        )
+        start = time.time()
+        deadline = start + args.duration
+        with executor_class(max_workers=args.clients) as executor:
+            futures = [
+                executor.submit(
+                    run_client,
+                    db_name,
+                    mix,
+                    max_id,
+                    start,
+                    deadline,
+                    n,
+                    args.busy_timeout,
+                )
+                for n in range(args.clients)
+            ]
+            samples = [sample for future in futures for sample in future.result()]
+        report(samples, args.duration, args.interval)
+
+
+if __name__ == "__main__":
+    main()
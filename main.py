@@ -6,8 +6,10 @@ It initializes the database, controller, and GUI components, then starts the
 application event loop.
 """
 
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add src directory to Python path for proper imports
 src_path = Path(__file__).parent / "src"
@@ -16,8 +18,14 @@ if str(src_path) not in sys.path:
 
 from src.models.database import DatabaseManager
 from src.controllers.app_controller import AppController
+from src.controllers.archiver import Archiver
 from src.views.view import AppView
 
+ARCHIVE_AFTER_DAYS = 365
+ARCHIVE_DAYS_ENV = "LOSTFOUND_ARCHIVE_DAYS"
+SNAPSHOT_PATH = "lost_and_found.view.json"
+STALL_LOG_ENV = "LOSTFOUND_STALL_LOG"
+
 
 def main() -> None:
     """
@@ -26,8 +34,12 @@ def main() -> None:
     This function:
     1. Creates a DatabaseManager instance with the default database
     2. Initializes the AppController with the database manager
-    3. Creates the main application window (AppView)
-    4. Starts the GUI event loop
+    3. Starts archiving old Claimed items in the background, after the number
+       of days in LOSTFOUND_ARCHIVE_DAYS (365 by default, "off" to disable)
+    4. Creates the main application window (AppView), restoring the view
+       saved on the last exit and logging event loop stalls to the file named
+       by LOSTFOUND_STALL_LOG if it is set
+    5. Starts the GUI event loop
     """
     # Initialize the database manager
     db_manager = DatabaseManager("lost_and_found.db")
@@ -35,9 +47,53 @@ def main() -> None:
     # Initialize the application controller
     controller = AppController(db_manager)
 
+    # Move old Claimed items out of the live table unless disabled
+    archive_days = archive_after_days(os.environ.get(ARCHIVE_DAYS_ENV))
+    archiver = None
+    if archive_days is not None:
+        archiver = Archiver(controller, max_age_days=archive_days)
+        archiver.start()
+
     # Create and run the main application window
-    app = AppView(controller)
-    app.mainloop()
+    app = AppView(
+        controller,
+        stall_log=os.environ.get(STALL_LOG_ENV),
+        snapshot_path=SNAPSHOT_PATH,
+    )
+    try:
+        app.mainloop()
+    finally:
+        if archiver is not None:
+            archiver.stop()
+
+
+def archive_after_days(setting: Optional[str]) -> Optional[int]:
+    """
+    Parses the LOSTFOUND_ARCHIVE_DAYS setting.
+
+    Args:
+        setting (Optional[str]): The variable's value, or None if it is unset.
+
+    Returns:
+        Optional[int]: The age in days after which Claimed items are
+        archived, or None if automatic archiving is turned off.
+
+    Raises:
+        SystemExit: If the setting is neither "off" nor a non-negative number.
+    """
+    if setting is None or not setting.strip():
+        return ARCHIVE_AFTER_DAYS
+    if setting.strip().lower() == "off":
+        return None
+    try:
+        days = int(setting)
+    except ValueError:
+        days = -1
+    if days < 0:
+        raise SystemExit(
+            f"{ARCHIVE_DAYS_ENV} must be a number of days or 'off', not {setting!r}"
+        )
+    return days
 
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+"""HTTP interface for the Lost and Found Application.
+
+This package exposes the back end over a JSON HTTP API so that a web front
+end can be used in place of the desktop GUI.
+
+.. autosummary::
+   :toctree: ../api
+
+   ApiServer
+   create_server
+"""
+
+from .server import ApiServer, create_server
+
+__all__ = ["ApiServer", "create_server"]
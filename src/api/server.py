@@ -0,0 +1,422 @@
+"""Multithreaded JSON HTTP API over :class:`AppController`.
+
+The service exposes the same back end as the desktop GUI, so a web front end
+can replace the Tk interface without touching the models or controller.
+
+Routes:
+
+- ``GET /items`` - search, filter and paginate items.  Query parameters:
+  ``q`` (keyword), ``category``, ``status``, ``from`` and ``to`` (YYYY-MM-DD),
+  ``after`` (ID of the last item of the previous page), ``limit`` and
+  ``archived=1`` to include archived items.  The
+  response is ``{"items": [...], "next_after": id | null}`` and is streamed
+  with chunked transfer encoding, so large listings never sit in memory.
+- ``POST /items`` - create an item from a JSON object.
+- ``GET /items/<id>``, ``PUT /items/<id>``, ``DELETE /items/<id>``.  A GET
+  also finds archived items when ``archived=1`` is given.  A PUT
+  body may include the ``version`` it was based on; if the item has changed
+  since, the update is rejected with ``409 Conflict``.
+- ``GET /stats`` - counts by status, category and day.
+- ``GET /changes`` - items changed after the cursor ``since`` (default 0),
+  at most ``limit`` log entries at a time.  The response is
+  ``{"changes": [{"seq": n, "id": id, "item": {...} | null, "archived": bool},
+  ...], "next_since": n, "has_more": bool}``.  ``item`` is the current state,
+  or null once the item is deleted.  Archiving is not a deletion: archived
+  items keep their ``item`` and have ``archived`` set, and syncing from 0
+  includes the archive, so mirrors hold every item ``archived=1`` can fetch.
+  A cursor older than the pruned change log is answered with ``410 Gone``
+  and the client must reload every item.
+
+Listing and stats responses carry an ``ETag`` built from the database's data
+version and the query.  A request whose ``If-None-Match`` header matches the
+current tag is answered with ``304 Not Modified`` without running the query,
+so polling clients only download the data when it has changed.
+
+Each request handler thread talks to the database through its own
+connection (see :class:`~src.models.database.DatabaseManager`).
+
+Run with ``python -m src.api.server --port 8000``.
+"""
+
+import argparse
+import json
+import logging
+import re
+from dataclasses import asdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.controllers.app_controller import AppController
+from src.models.database import ChangeLogExpiredError, ConflictError, DatabaseManager
+from src.models.item import Item, ValidationError
+from src.models.profiles import PROFILES
+
+ITEM_FIELDS = ("name", "category", "date", "location", "status", "contact_info")
+MAX_PAGE_SIZE = 1000
+STREAM_CHUNK_BYTES = 64 * 1024
+
+_ITEM_PATH = re.compile(r"^/items/(\d+)$")
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    """Raised by request handlers to produce a JSON error response."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ApiServer(ThreadingHTTPServer):
+    """
+    A threading HTTP server bound to an application controller.
+
+    Attributes:
+        controller (AppController): The controller serving every request.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], controller: AppController) -> None:
+        super().__init__(address, ItemApiHandler)
+        self.controller = controller
+
+
+class ItemApiHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the :class:`AppController` of the server."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: ApiServer
+
+    def do_GET(self) -> None:
+        self._dispatch(self._handle_get)
+
+    def do_POST(self) -> None:
+        self._dispatch(self._handle_post)
+
+    def do_PUT(self) -> None:
+        self._dispatch(self._handle_put)
+
+    def do_DELETE(self) -> None:
+        self._dispatch(self._handle_delete)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silences the default per-request logging to stderr."""
+
+    @property
+    def controller(self) -> AppController:
+        return self.server.controller
+
+    def send_response(self, code: int, message: Optional[str] = None) -> None:
+        self._responded = True
+        super().send_response(code, message)
+
+    def _dispatch(self, handler) -> None:
+        """Runs a route handler, turning errors into JSON responses."""
+        url = urlsplit(self.path)
+        self._responded = False
+        try:
+            handler(url.path, parse_qs(url.query))
+        except ApiError as e:
+            self._send_json(e.status, {"error": e.message})
+        except (ValidationError, ValueError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except Exception:
+            # E.g. "database is locked" under load. A streamed response
+            # cannot be replaced anymore, so its connection is dropped.
+            logger.exception("%s %s failed", self.command, self.path)
+            if self._responded:
+                self.close_connection = True
+            else:
+                self._send_json(
+                    HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+                )
+
+    def _handle_get(self, path: str, query: Dict[str, List[str]]) -> None:
+        if path == "/items":
+            self._list_items(query)
+        elif path == "/changes":
+            self._list_changes(query)
+        elif path == "/stats":
+            etag = self.controller.make_etag("stats")
+            if not self._not_modified(etag):
+                self._send_json(
+                    HTTPStatus.OK, asdict(self.controller.stats()), etag=etag
+                )
+        else:
+            item = self._find_item(path, _param(query, "archived") == "1")
+            self._send_json(HTTPStatus.OK, asdict(item))
+
+    def _handle_post(self, path: str, query: Dict[str, List[str]]) -> None:
+        if path != "/items":
+            raise ApiError(HTTPStatus.NOT_FOUND, "Not found")
+        item = self._item_from_data(self._read_json_object())
+        self.controller.add_item(item)
+        self._send_json(HTTPStatus.CREATED, asdict(item))
+
+    def _handle_put(self, path: str, query: Dict[str, List[str]]) -> None:
+        item_id = self._item_id(path)
+        data = self._read_json_object()
+        item = self._item_from_data(data)
+        item.id = item_id
+        expected_version = data.get("version")
+        if expected_version is not None and not isinstance(expected_version, int):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "version must be an integer")
+        try:
+            updated = self.controller.update_item(item, expected_version)
+        except ConflictError as e:
+            raise ApiError(HTTPStatus.CONFLICT, str(e))
+        if not updated:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Item {item_id} not found")
+        self._send_json(HTTPStatus.OK, asdict(item))
+
+    def _handle_delete(self, path: str, query: Dict[str, List[str]]) -> None:
+        item_id = self._item_id(path)
+        if not self.controller.delete_item(item_id):
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Item {item_id} not found")
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _list_items(self, query: Dict[str, List[str]]) -> None:
+        """Streams one page of search results as a chunked JSON document."""
+        after = _int_param(query, "after")
+        limit = _int_param(query, "limit")
+        if limit is not None and not 0 < limit <= MAX_PAGE_SIZE:
+            raise ApiError(
+                HTTPStatus.BAD_REQUEST, f"limit must be between 1 and {MAX_PAGE_SIZE}"
+            )
+
+        params = {
+            "keyword": _param(query, "q") or "",
+            "category": _param(query, "category"),
+            "status": _param(query, "status"),
+            "start_date": _param(query, "from"),
+            "end_date": _param(query, "to"),
+            "after_id": after,
+            "include_archive": _param(query, "archived") == "1",
+        }
+        etag = self.controller.make_etag("items", limit=limit, **params)
+        if self._not_modified(etag):
+            return
+
+        results = self.controller.iter_search(**params)
+        # Pull the first result before sending headers so that invalid
+        # filters still produce a proper 400 response.
+        first = next(results, None)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self._write_chunks(_encode_listing(first, results, limit))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _list_changes(self, query: Dict[str, List[str]]) -> None:
+        """Sends one page of the change log after the ``since`` cursor."""
+        since = _int_param(query, "since") or 0
+        limit = _int_param(query, "limit") or MAX_PAGE_SIZE
+        if not 0 < limit <= MAX_PAGE_SIZE:
+            raise ApiError(
+                HTTPStatus.BAD_REQUEST, f"limit must be between 1 and {MAX_PAGE_SIZE}"
+            )
+        try:
+            change_set = self.controller.changes_since(since, limit)
+        except ChangeLogExpiredError as e:
+            raise ApiError(HTTPStatus.GONE, str(e))
+        self._send_json(
+            HTTPStatus.OK,
+            {
+                "changes": [
+                    {
+                        "seq": change.seq,
+                        "id": change.item_id,
+                        "item": None if change.item is None else asdict(change.item),
+                        "archived": change.archived,
+                    }
+                    for change in change_set.changes
+                ],
+                "next_since": change_set.next_seq,
+                "has_more": change_set.has_more,
+            },
+        )
+
+    def _not_modified(self, etag: str) -> bool:
+        """
+        Answers a conditional request with 304 if the client's copy is current.
+
+        Args:
+            etag (str): The entity tag of the current representation.
+
+        Returns:
+            bool: True if a 304 response was sent and the query can be skipped.
+        """
+        header = self.headers.get("If-None-Match")
+        if header is None:
+            return False
+        tags = [tag.strip() for tag in header.split(",")]
+        if "*" not in tags and etag not in tags and f"W/{etag}" not in tags:
+            return False
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.end_headers()
+        return True
+
+    def _write_chunks(self, parts: Iterable[str]) -> None:
+        """Buffers encoded parts and writes them as HTTP chunks."""
+        buffer: List[bytes] = []
+        size = 0
+        for part in parts:
+            data = part.encode("utf-8")
+            buffer.append(data)
+            size += len(data)
+            if size >= STREAM_CHUNK_BYTES:
+                self._write_chunk(b"".join(buffer))
+                buffer, size = [], 0
+        if buffer:
+            self._write_chunk(b"".join(buffer))
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data))
+
+    def _find_item(self, path: str, include_archive: bool = False) -> Item:
+        item_id = self._item_id(path)
+        item = self.controller.get_item(item_id, include_archive)
+        if item is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Item {item_id} not found")
+        return item
+
+    @staticmethod
+    def _item_id(path: str) -> int:
+        match = _ITEM_PATH.match(path)
+        if match is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, "Not found")
+        return int(match.group(1))
+
+    def _read_json_object(self) -> Dict[str, Any]:
+        """Reads the request body, which must be a JSON object."""
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            data = json.loads(self.rfile.read(length) or b"null")
+        except json.JSONDecodeError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Request body must be valid JSON")
+        if not isinstance(data, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+        return data
+
+    @staticmethod
+    def _item_from_data(data: Dict[str, Any]) -> Item:
+        """Builds and validates an item from a decoded request body."""
+        for name in ITEM_FIELDS:
+            value = data.get(name)
+            if value is not None and not isinstance(value, str):
+                raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be a string")
+        return Item(**{name: data.get(name) for name in ITEM_FIELDS})
+
+    def _send_json(
+        self, status: HTTPStatus, payload: Any, etag: Optional[str] = None
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _param(query: Dict[str, List[str]], name: str) -> Optional[str]:
+    """Returns the first non-empty value of a query parameter."""
+    values = query.get(name)
+    return values[0] if values and values[0] else None
+
+
+def _int_param(query: Dict[str, List[str]], name: str) -> Optional[int]:
+    value = _param(query, name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer")
+
+
+def _encode_listing(
+    first: Optional[Item], rest: Iterable[Item], limit: Optional[int]
+) -> Iterable[str]:
+    """
+    Yields the JSON text of a listing response piece by piece.
+
+    ``next_after`` is only set when at least one more result exists beyond
+    the page, so clients know when to stop paging.
+    """
+    yield '{"items": ['
+    count = 0
+    next_after = last_id = None
+    if first is not None:
+        for item in chain([first], rest):
+            if limit is not None and count >= limit:
+                next_after = last_id
+                break
+            yield (", " if count else "") + json.dumps(asdict(item))
+            count += 1
+            last_id = item.id
+    yield f'], "next_after": {json.dumps(next_after)}}}'
+
+
+def create_server(
+    db_name: str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    profile: str = "server",
+) -> ApiServer:
+    """
+    Builds an API server for the given database file.
+
+    Args:
+        db_name (str): The path of the SQLite database file.
+        host (str, optional): The interface to bind. Defaults to "127.0.0.1".
+        port (int, optional): The TCP port; 0 picks a free port. Defaults to 8000.
+        profile (str, optional): The SQLite performance profile. Defaults to "server".
+
+    Returns:
+        ApiServer: The bound, not yet serving, server.
+    """
+    controller = AppController(DatabaseManager(db_name, profile=profile))
+    return ApiServer((host, port), controller)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parses command line arguments and serves the API until interrupted."""
+    parser = argparse.ArgumentParser(description="Lost and Found JSON HTTP API")
+    parser.add_argument("--db", default="lost_and_found.db", help="database file")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument(
+        "--profile",
+        default="server",
+        choices=sorted(PROFILES),
+        help="SQLite performance profile",
+    )
+    args = parser.parse_args(argv)
+
+    server = create_server(args.db, args.host, args.port, args.profile)
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
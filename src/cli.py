@@ -0,0 +1,341 @@
+"""Headless command line interface for scripted Lost and Found operations.
+
+The CLI works directly on :class:`AppController` and :class:`DatabaseManager`
+and never imports Tk, so it starts quickly and runs without a display, e.g.
+from cron.  Listings are written row by row as they are read from the
+database.
+
+Examples::
+
+    python -m src.cli add --name "Blue Umbrella" --category Misc \\
+        --date 2025-10-01 --location Library --status Lost --contact a@uni.ac.uk
+    python -m src.cli import nightly.csv
+    python -m src.cli query umbrella --status Lost --format jsonl
+    python -m src.cli export --format csv backup.csv
+    python -m src.cli stats --json
+    python -m src.cli maintenance archive --days 365
+"""
+
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+from dataclasses import asdict
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+from src.controllers.app_controller import AppController
+from src.controllers.archiver import Archiver
+from src.models.database import SORT_KEYS, DatabaseManager
+from src.models.item import Item, ValidationError, validate_batch
+from src.models.profiles import DEFAULT_PROFILE, PROFILES
+
+FIELDS = (
+    "id",
+    "name",
+    "category",
+    "date",
+    "location",
+    "status",
+    "contact_info",
+    "version",
+)
+INPUT_FIELDS = ("name", "category", "date", "location", "status", "contact_info")
+IMPORT_BATCH_SIZE = 1000
+
+
+class CliError(Exception):
+    """Raised for invalid input; reported on stderr with exit status 1."""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser with every subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="lostfound", description="Lost and Found command line interface"
+    )
+    parser.add_argument("--db", default="lost_and_found.db", help="database file")
+    parser.add_argument(
+        "--profile",
+        default=DEFAULT_PROFILE,
+        choices=sorted(PROFILES),
+        help="SQLite performance profile",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="add one item and print its ID")
+    for name in INPUT_FIELDS:
+        flag = "--contact" if name == "contact_info" else f"--{name}"
+        add.add_argument(flag, dest=name, required=True)
+
+    import_ = commands.add_parser(
+        "import", help="bulk import items from CSV or JSON lines"
+    )
+    import_.add_argument("file", help="input file, or - for stdin")
+    import_.add_argument(
+        "--format", choices=("csv", "jsonl"), help="default: by extension"
+    )
+    import_.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="report and skip invalid records instead of aborting",
+    )
+    import_.add_argument(
+        "--skip-duplicates",
+        action="store_true",
+        help="skip records that look like an already stored report",
+    )
+
+    query = commands.add_parser("query", help="search items and stream the matches")
+    query.add_argument("keyword", nargs="?", default="", help="text to search for")
+    _add_filter_arguments(query)
+    query.add_argument(
+        "--sort", default="id", choices=sorted(SORT_KEYS), help="sort key"
+    )
+    query.add_argument("--desc", action="store_true", help="sort descending")
+    query.add_argument("--limit", type=int, help="maximum number of rows")
+    query.add_argument("--format", choices=("tsv", "csv", "jsonl"), default="tsv")
+
+    export = commands.add_parser("export", help="export items as CSV or JSON lines")
+    export.add_argument(
+        "file", nargs="?", default="-", help="output file, or - for stdout"
+    )
+    _add_filter_arguments(export)
+    export.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+
+    stats = commands.add_parser("stats", help="print item counts")
+    stats.add_argument(
+        "--json", action="store_true", help="print the full stats as JSON"
+    )
+
+    maintenance = commands.add_parser("maintenance", help="database upkeep tasks")
+    tasks = maintenance.add_subparsers(dest="task", required=True)
+    archive = tasks.add_parser("archive", help="archive old Claimed items")
+    archive.add_argument("--days", type=int, default=365, help="minimum age in days")
+    archive.add_argument(
+        "--batch-size", type=int, default=500, help="items per transaction"
+    )
+    tasks.add_parser("optimize", help="refresh query planner statistics")
+    tasks.add_parser("vacuum", help="rebuild the database file")
+    tasks.add_parser("checkpoint", help="fold the write-ahead log into the database")
+    tasks.add_parser("check", help="run an integrity check")
+    changes = tasks.add_parser("changes", help="compact the change log")
+    changes.add_argument(
+        "--prune-before",
+        type=int,
+        metavar="SEQ",
+        help="also delete entries up to SEQ; older sync cursors expire",
+    )
+    return parser
+
+
+def _add_filter_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--category", help="exact category")
+    parser.add_argument("--status", help="exact status")
+    parser.add_argument("--from", dest="start_date", help="earliest date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end_date", help="latest date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--archived", action="store_true", help="include archived items"
+    )
+
+
+def main(argv: Optional[List[str]] = None, stdout: Optional[IO[str]] = None) -> int:
+    """
+    Runs the CLI.
+
+    Args:
+        argv (Optional[List[str]], optional): The arguments. Defaults to sys.argv[1:].
+        stdout (Optional[IO[str]], optional): Output stream. Defaults to sys.stdout.
+
+    Returns:
+        int: The process exit status.
+    """
+    args = build_parser().parse_args(argv)
+    out = stdout or sys.stdout
+    handler = {
+        "add": _add,
+        "import": _import,
+        "query": _query,
+        "export": _export,
+        "stats": _stats,
+        "maintenance": _maintenance,
+    }[args.command]
+    controller = None
+    try:
+        controller = AppController(DatabaseManager(args.db, profile=args.profile))
+        return handler(controller, args, out)
+    except (CliError, ValidationError, ValueError, OSError, sqlite3.Error) as e:
+        print(f"lostfound: error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if controller is not None:
+            controller.db.close()
+
+
+def _add(controller: AppController, args: argparse.Namespace, out: IO[str]) -> int:
+    item = Item(**{name: getattr(args, name) for name in INPUT_FIELDS})
+    print(controller.add_item(item), file=out)
+    return 0
+
+
+def _import(controller: AppController, args: argparse.Namespace, out: IO[str]) -> int:
+    # Records are validated a batch at a time with validate_batch. Without
+    # --skip-invalid the first invalid record stops the import, but the rest
+    # of the input is still validated so every invalid record is reported.
+    file_format = args.format or (
+        "jsonl" if args.file.endswith((".jsonl", ".json")) else "csv"
+    )
+    source = (
+        sys.stdin if args.file == "-" else open(args.file, newline="", encoding="utf-8")
+    )
+    imported = skipped = received = 0
+    try:
+        records = _read_records(source, file_format)
+        while True:
+            chunk = list(islice(records, IMPORT_BATCH_SIZE))
+            if not chunk:
+                break
+            rows = [
+                {name: record.get(name) for name in INPUT_FIELDS} for _, record in chunk
+            ]
+            errors = validate_batch(rows)
+            prefix = "skipped record" if args.skip_invalid else "record"
+            for index, message in errors.items():
+                print(
+                    f"lostfound: {prefix} {chunk[index][0]}: {message}", file=sys.stderr
+                )
+            skipped += len(errors)
+            if skipped and not args.skip_invalid:
+                continue
+            batch = [
+                Item(**row) for index, row in enumerate(rows) if index not in errors
+            ]
+            received += len(batch)
+            imported += len(controller.db.add_items(batch, args.skip_duplicates))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    if skipped and not args.skip_invalid:
+        raise CliError(
+            f"{skipped} invalid records; stopped after importing {imported} items"
+        )
+    summary = f"imported {imported} items, skipped {skipped}"
+    if args.skip_duplicates:
+        summary += f", duplicates {received - imported}"
+    print(summary, file=out)
+    return 0
+
+
+def _read_records(source: IO[str], file_format: str) -> Iterator[Any]:
+    """Yields ``(record number, mapping)`` pairs from a CSV or JSON lines stream."""
+    if file_format == "csv":
+        for number, row in enumerate(csv.DictReader(source), 1):
+            yield number, row
+        return
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CliError(f"record {number}: invalid JSON ({e})")
+        if not isinstance(record, dict):
+            raise CliError(f"record {number}: expected a JSON object")
+        yield number, record
+
+
+def _query(controller: AppController, args: argparse.Namespace, out: IO[str]) -> int:
+    items: Iterable[Item] = controller.iter_search(
+        args.keyword,
+        args.category,
+        args.status,
+        args.start_date,
+        args.end_date,
+        include_archive=args.archived,
+        sort_by=args.sort,
+        descending=args.desc,
+    )
+    if args.limit is not None:
+        items = islice(items, args.limit)
+    _write_items(items, args.format, out)
+    return 0
+
+
+def _export(controller: AppController, args: argparse.Namespace, out: IO[str]) -> int:
+    items = controller.db.iter_items(
+        args.category,
+        args.status,
+        args.start_date,
+        args.end_date,
+        include_archive=args.archived,
+    )
+    if args.file == "-":
+        _write_items(items, args.format, out)
+    else:
+        with open(args.file, "w", newline="", encoding="utf-8") as target:
+            _write_items(items, args.format, target)
+    return 0
+
+
+def _write_items(items: Iterable[Item], file_format: str, out: IO[str]) -> None:
+    """Writes items one row at a time in the requested format."""
+    if file_format == "jsonl":
+        for item in items:
+            out.write(json.dumps(asdict(item)) + "\n")
+        return
+    if file_format == "csv":
+        writer = csv.writer(out)
+        writer.writerow(FIELDS)
+        for item in items:
+            writer.writerow([getattr(item, name) for name in FIELDS])
+        return
+    for item in items:
+        out.write("\t".join(str(getattr(item, name)) for name in FIELDS) + "\n")
+
+
+def _stats(controller: AppController, args: argparse.Namespace, out: IO[str]) -> int:
+    stats = controller.stats()
+    if args.json:
+        print(json.dumps(asdict(stats)), file=out)
+        return 0
+    print(f"total\t{stats.total}", file=out)
+    for group in ("by_status", "by_category"):
+        counts: Dict[str, int] = getattr(stats, group)
+        for key, count in sorted(counts.items()):
+            print(f"{group[3:]}:{key}\t{count}", file=out)
+    return 0
+
+
+def _maintenance(
+    controller: AppController, args: argparse.Namespace, out: IO[str]
+) -> int:
+    db = controller.db
+    if args.task == "archive":
+        archiver = Archiver(
+            controller, max_age_days=args.days, batch_size=args.batch_size
+        )
+        print(f"archived {archiver.archive_all()} items", file=out)
+    elif args.task == "optimize":
+        db.optimize()
+    elif args.task == "vacuum":
+        db.vacuum()
+    elif args.task == "checkpoint":
+        frames, checkpointed = db.checkpoint()
+        print(f"checkpointed {checkpointed} of {frames} frames", file=out)
+    elif args.task == "check":
+        problems = db.integrity_check()
+        for problem in problems:
+            print(problem, file=out)
+        if problems:
+            return 1
+        print("ok", file=out)
+    elif args.task == "changes":
+        removed = db.compact_changes()
+        if args.prune_before is not None:
+            removed += db.prune_changes(args.prune_before)
+        print(f"removed {removed} change log entries", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,33 @@
 """Logic controllers for the Lost and Found Application."""
 
-from typing import List, Optional
+import hashlib
+import json
+import threading
+from array import array
+from datetime import date, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
-from src.models.database import DatabaseManager
+from src.models.changes import ChangeSet
+from src.models.database import ChangeLogExpiredError, DatabaseManager
 from src.models.item import Item
+from src.models.matching import MATCH_STATUSES, Match, MatchEngine
+from src.models.search import SEARCH_FIELDS, SearchResult, Span, find_spans, match_spans
+from src.models.stats import ItemStats
+from src.utils.dates import DATE_FORMAT
+from src.utils.fuzzy import best_word_distance
+
+FUZZY_CANDIDATES = 500
 
 
 class AppController:
     """
     Orchestrates application logic, bridging the UI and database.
-    
+
     Attributes:
         db (DatabaseManager): The database manager instance.
     """
-    
+
     def __init__(self, db_manager: DatabaseManager) -> None:
         """
         Initializes the AppController
@@ -22,40 +36,98 @@ class AppController:
             db_manager (DatabaseManager): The database manager instance.
         """
         self.db = db_manager
-    
-    def add_item(self, item: Item) -> int:
+        self._matches: Optional[MatchEngine] = None
+        self._matches_cursor = 0
+        self._matches_lock = threading.Lock()
+
+    def add_item(self, item: Item, allow_duplicates: bool = True) -> int:
         """
         Adds a new item to the database.
 
         Args:
             item (Item): The item to add.
+            allow_duplicates (bool, optional): Store the item even if it looks
+                like an existing report. Defaults to True.
 
         Returns:
             int: The generated database ID.
+
+        Raises:
+            DuplicateError: If duplicates are not allowed and one is stored.
+        """
+        return self.db.add_item(item, allow_duplicates)
+
+    def find_duplicates(self, item: Item) -> List[Item]:
+        """
+        Retrieves stored reports that look like the same item.
+
+        Args:
+            item (Item): The item about to be saved.
+
+        Returns:
+            List[Item]: The likely duplicates, oldest first.
+        """
+        return self.db.find_duplicates(item)
+
+    def get_item(self, item_id: int, include_archive: bool = False) -> Optional[Item]:
         """
-        return self.db.add_item(item)
-    
-    def get_all_items(self) -> List[Item]:
+        Retrieves a single item by its ID.
+
+        Args:
+            item_id (int): The ID of the item.
+            include_archive (bool, optional): Also look in the archive.
+                Defaults to False.
+
+        Returns:
+            Optional[Item]: The item, or None if it does not exist.
+        """
+        return self.db.get_item(item_id, include_archive)
+
+    def archived_ids(self, item_ids: Sequence[int]) -> Set[int]:
+        """
+        Finds which of the given items are archived, and so read-only.
+
+        Args:
+            item_ids (Sequence[int]): The IDs to look up.
+
+        Returns:
+            Set[int]: The IDs of the archived items.
+        """
+        return self.db.archived_ids(item_ids)
+
+    def get_all_items(self, include_archive: bool = False) -> List[Item]:
         """
         Retrieves all items from the database.
 
+        Args:
+            include_archive (bool, optional): Also return archived items.
+                Defaults to False.
+
         Returns:
             List[Item]: A list of all stored items.
         """
-        return self.db.get_all_items()
-    
-    def update_item(self, item: Item) -> bool:
+        return self.db.get_all_items(include_archive)
+
+    def update_item(self, item: Item, expected_version: Optional[int] = None) -> bool:
         """
         Updates an existing item in the database.
 
+        Pass the version the edit is based on as ``expected_version`` to
+        detect concurrent modifications.
+
         Args:
             item (Item): The item with updated details.
+            expected_version (Optional[int], optional): The version the changes
+                are based on. Defaults to None, which overwrites unconditionally.
 
         Returns:
             bool: True if successful, False otherwise.
+
+        Raises:
+            ConflictError: If the item was modified since ``expected_version``.
         """
-        return self.db.update_item(item)
-    
+        return self.db.update_item(item, expected_version)
+
     def delete_item(self, item_id: int) -> bool:
         """
         Deletes an item from the database by its ID.
@@ -67,56 +139,736 @@ class AppController:
             bool: True if successful, False otherwise.
         """
         return self.db.delete_item(item_id)
-    
-    def search_items(self, keyword: str) -> List[Item]:
+
+    def suggest_matches(self, limit: int = 50) -> List[Match]:
+        """
+        Suggests the most likely pairs of Lost reports and Found items.
+
+        The match engine is built from the database on first use, which
+        reads every Lost and Found item; callers on a UI thread should make
+        the first call in the background. Afterwards the engine is brought up
+        to date from the change log, so each call only rescores the items
+        written since the previous one, by this controller or anyone else.
+
+        Args:
+            limit (int, optional): The maximum number of pairs. Defaults to 50.
+
+        Returns:
+            List[Match]: The suggested pairs, best first.
         """
-        Searches for items containing the keyword in their name, 
+        with self._matches_lock:
+            return self._match_engine().best_matches(limit)
+
+    def matches_for(self, item_id: int, limit: int = 10) -> List[Match]:
+        """
+        Suggests the counterparts of a single Lost or Found item.
+
+        Args:
+            item_id (int): The ID of the item.
+            limit (int, optional): The maximum number of matches. Defaults to 10.
+
+        Returns:
+            List[Match]: The matches, best first.
+        """
+        with self._matches_lock:
+            return self._match_engine().matches_for(item_id, limit)
+
+    def _match_engine(self) -> MatchEngine:
+        """
+        Returns the match engine, applying the changes logged since it was used.
+
+        The engine is rebuilt only on first use, or when the changes it missed
+        were already pruned from the log.
+        """
+        if self._matches is not None:
+            try:
+                self._catch_up_matches(self._matches)
+                return self._matches
+            except ChangeLogExpiredError:
+                self._matches = None
+
+        # Changes logged while the items are read are applied again
+        # afterwards; adding an item twice replaces it.
+        self._matches_cursor = self.db.change_cursor()
+        engine = MatchEngine()
+        for status in MATCH_STATUSES:
+            engine.add_all(self.db.iter_items(status=status))
+        self._catch_up_matches(engine)
+        self._matches = engine
+        return engine
+
+    def _catch_up_matches(self, engine: MatchEngine) -> None:
+        """Applies the changes logged after ``_matches_cursor`` to the engine."""
+        while True:
+            change_set = self.db.changes_since(self._matches_cursor)
+            for change in change_set.changes:
+                if change.deleted or change.archived:
+                    engine.remove(change.item_id)
+                else:
+                    engine.add(change.item)
+            self._matches_cursor = change_set.next_seq
+            if not change_set.has_more:
+                return
+
+    def search_items(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_archive: bool = False,
+    ) -> List[Item]:
+        """
+        Searches for items containing the keyword in their name,
         location, or contact info.
-        
-        The search is case-insensitive. If an empty string is provided, 
-        all items are returned.
+
+        The search is case-insensitive. If an empty string is provided,
+        all items are returned. The optional category, status and date
+        filters are applied in the database before the keyword is matched.
+        Archived items are only searched when ``include_archive`` is True.
 
         Args:
             keyword (str): The search term.
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            include_archive (bool, optional): Also search archived items.
+                Defaults to False.
 
         Returns:
             List[Item]: Items matching the search criteria.
         """
-        all_items = self.get_all_items()
-        
-        if not keyword.strip():
-            return all_items
-        
+        return list(
+            self.iter_search(
+                keyword,
+                category,
+                status,
+                start_date,
+                end_date,
+                include_archive=include_archive,
+            )
+        )
+
+    def iter_search(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after_id: Optional[int] = None,
+        include_archive: bool = False,
+        sort_by: str = "id",
+        descending: bool = False,
+        after_value: Any = None,
+    ) -> Iterator[Item]:
+        """
+        Lazily yields the results of :meth:`search_items`, in ID order by default.
+
+        Rows are streamed from the database in batches, so callers can stop
+        early or stream large results without holding them all in memory.
+        The database sorts by ``sort_by`` when given; see
+        :meth:`DatabaseManager.iter_items` for the sort keys and how to resume
+        after an item.
+        Keywords of three or more characters first narrow the candidates with
+        the trigram index, so only rows sharing the keyword's trigrams are
+        read and verified.
+
+        Args:
+            keyword (str): The search term.
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            after_id (Optional[int], optional): Only yield items after the one with this
+                ID. Defaults to None.
+            include_archive (bool, optional): Also search archived items.
+                Defaults to False.
+            sort_by (str, optional): The sort key. Defaults to "id".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+            after_value (Any, optional): The sort value of the ``after_id`` item.
+                Defaults to None.
+
+        Yields:
+            Item: Each matching item.
+        """
+        keyword_lower = keyword.strip().lower()
+        candidates = self._search_candidates(
+            keyword_lower,
+            category,
+            status,
+            start_date,
+            end_date,
+            after_id,
+            include_archive,
+            sort_by,
+            descending,
+            after_value,
+        )
+
+        if not keyword_lower:
+            yield from candidates
+            return
+
+        for item in candidates:
+            if (
+                keyword_lower in item.name.lower()
+                or keyword_lower in item.location.lower()
+                or keyword_lower in item.contact_info.lower()
+            ):
+                yield item
+
+    def search_ids(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_archive: bool = False,
+        sort_by: str = "id",
+        descending: bool = False,
+    ) -> "array[int]":
+        """
+        Runs :meth:`iter_search` but returns only the IDs of the results.
+
+        The IDs are packed in an ``array('q')`` of 8 bytes per result, and
+        only the searched text columns are read to verify keyword matches,
+        so even very large results take little memory. Wrap them in a
+        :class:`~src.models.result_set.ResultSet` fetching :meth:`get_results`
+        to read the items lazily, or use :meth:`search_spans` to highlight
+        the keyword too.
+
+        Args:
+            keyword (str): The search term.
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            include_archive (bool, optional): Also search archived items.
+                Defaults to False.
+            sort_by (str, optional): The sort key. Defaults to "id".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+
+        Returns:
+            array[int]: The IDs of the matching items, in sort order.
+        """
+        ids, _ = self._search_ids(
+            keyword,
+            category,
+            status,
+            start_date,
+            end_date,
+            include_archive,
+            sort_by,
+            descending,
+            keep_spans=False,
+        )
+        return ids
+
+    def search_spans(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_archive: bool = False,
+        sort_by: str = "id",
+        descending: bool = False,
+    ) -> Tuple["array[int]", Dict[int, Dict[str, List[Span]]]]:
+        """
+        Runs :meth:`search_ids` and also reports where the keyword matched.
+
+        The keyword is verified by finding its spans in the searched fields,
+        so the text is scanned once; pass the spans to :meth:`get_results`,
+        which then only scans the fields that are highlighted but not
+        searched. Spans are kept for matching items only, and none at all
+        for an empty keyword.
+
+        Args:
+            keyword (str): The search term.
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            include_archive (bool, optional): Also search archived items.
+                Defaults to False.
+            sort_by (str, optional): The sort key. Defaults to "id".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+
+        Returns:
+            Tuple[array[int], Dict[int, Dict[str, List[Span]]]]: The IDs of
+            the matching items in sort order, and their spans in the searched
+            fields by item ID.
+        """
+        return self._search_ids(
+            keyword,
+            category,
+            status,
+            start_date,
+            end_date,
+            include_archive,
+            sort_by,
+            descending,
+            keep_spans=True,
+        )
+
+    def _search_ids(
+        self,
+        keyword: str,
+        category: Optional[str],
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        include_archive: bool,
+        sort_by: str,
+        descending: bool,
+        keep_spans: bool,
+    ) -> Tuple["array[int]", Dict[int, Dict[str, List[Span]]]]:
+        """Searches for IDs, verifying keywords by their spans if ``keep_spans``."""
+        keyword_lower = keyword.strip().lower()
+        fields = SEARCH_FIELDS if keyword_lower else ()
+        rows = self.db.iter_rows(
+            fields,
+            category,
+            status,
+            start_date,
+            end_date,
+            include_archive=include_archive,
+            contains=keyword_lower or None,
+            sort_by=sort_by,
+            descending=descending,
+        )
+        ids = array("q")
+        spans: Dict[int, Dict[str, List[Span]]] = {}
+        if not keyword_lower:
+            ids.extend(row[0] for row in rows)
+        elif not keep_spans:
+            for item_id, *texts in rows:
+                if any(keyword_lower in text.lower() for text in texts):
+                    ids.append(item_id)
+        else:
+            for item_id, *texts in rows:
+                found = {}
+                for name, text in zip(SEARCH_FIELDS, texts):
+                    field_spans = find_spans(text.lower(), keyword_lower)
+                    if field_spans:
+                        found[name] = field_spans
+                if found:
+                    ids.append(item_id)
+                    spans[item_id] = found
+        return ids, spans
+
+    def get_items(
+        self, item_ids: Sequence[int], include_archive: bool = False
+    ) -> List[Optional[Item]]:
+        """
+        Retrieves several items by ID, e.g. to fill a :meth:`search_ids` window.
+
+        Args:
+            item_ids (Sequence[int]): The IDs.
+            include_archive (bool, optional): Also look in the archive.
+                Defaults to False.
+
+        Returns:
+            List[Optional[Item]]: The items in ID list order, None for missing IDs.
+        """
+        return self.db.get_items(item_ids, include_archive)
+
+    def get_results(
+        self,
+        item_ids: Sequence[int],
+        keyword: str = "",
+        include_archive: bool = False,
+        spans: Optional[Dict[int, Dict[str, List[Span]]]] = None,
+    ) -> List[Optional[SearchResult]]:
+        """
+        Retrieves several items by ID with the spans where ``keyword`` occurs.
+
+        This is the batch fetch of a :meth:`search_spans` result. The spans
+        it found in the searched fields are reused, so only the category and
+        status of each item are scanned, once, as its batch is read.
+
+        Args:
+            item_ids (Sequence[int]): The IDs.
+            keyword (str, optional): The search term to highlight. Defaults to "".
+            include_archive (bool, optional): Also look in the archive.
+                Defaults to False.
+            spans (Optional[Dict[int, Dict[str, List[Span]]]], optional): The
+                spans from :meth:`search_spans`. Defaults to None, which scans
+                every highlighted field.
+
+        Returns:
+            List[Optional[SearchResult]]: The results in ID list order, None
+            for missing IDs.
+        """
         keyword_lower = keyword.strip().lower()
-        
-        return [
-            item for item in all_items
-            if keyword_lower in item.name.lower()
-            or keyword_lower in item.location.lower()
-            or keyword_lower in item.contact_info.lower()
-        ]
-    
+        results: List[Optional[SearchResult]] = []
+        for item in self.db.get_items(item_ids, include_archive):
+            if item is None:
+                results.append(None)
+            elif not keyword_lower:
+                results.append(SearchResult(item))
+            else:
+                searched = None if spans is None else spans.get(item.id, {})
+                results.append(
+                    SearchResult(item, match_spans(item, keyword_lower, searched))
+                )
+        return results
+
+    def _search_candidates(
+        self,
+        keyword_lower: str,
+        category: Optional[str],
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        after_id: Optional[int],
+        include_archive: bool,
+        sort_by: str = "id",
+        descending: bool = False,
+        after_value: Any = None,
+    ) -> Iterator[Item]:
+        """Streams the filtered items that may contain the keyword."""
+        return self.db.iter_items(
+            category,
+            status,
+            start_date,
+            end_date,
+            after_id=after_id,
+            include_archive=include_archive,
+            contains=keyword_lower or None,
+            sort_by=sort_by,
+            descending=descending,
+            after_value=after_value,
+        )
+
+    def search_page(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        include_archive: bool = False,
+        sort_by: str = "id",
+        descending: bool = False,
+        after_value: Any = None,
+    ) -> List[Item]:
+        """
+        Retrieves one page of search results using keyset pagination.
+
+        Pass the ID of the last item of a page as ``after_id`` to fetch the
+        next one; unlike offsets this stays cheap however deep the page is.
+        When sorting by anything but the ID also pass the last item's
+        :meth:`sort_value` as ``after_value``.
+
+        Args:
+            keyword (str): The search term.
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            after_id (Optional[int], optional): ID of the last item of the previous
+                page. Defaults to None.
+            limit (int, optional): The maximum page size. Defaults to 50.
+            include_archive (bool, optional): Also search archived items.
+                Defaults to False.
+            sort_by (str, optional): The sort key. Defaults to "id".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+            after_value (Any, optional): The sort value of the ``after_id`` item.
+                Defaults to None.
+
+        Returns:
+            List[Item]: Up to ``limit`` matching items.
+        """
+        return list(
+            islice(
+                self.iter_search(
+                    keyword,
+                    category,
+                    status,
+                    start_date,
+                    end_date,
+                    after_id,
+                    include_archive,
+                    sort_by,
+                    descending,
+                    after_value,
+                ),
+                limit,
+            )
+        )
+
+    def sort_value(self, item: Item, sort_by: str) -> Any:
+        """
+        Returns the value an item is sorted by, to resume a sorted page after it.
+
+        Args:
+            item (Item): The last item of a page.
+            sort_by (str): The sort key of the listing.
+
+        Returns:
+            Any: The ``after_value`` for :meth:`search_page`.
+        """
+        return self.db.sort_value(item, sort_by)
+
+    def fuzzy_search(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        include_archive: bool = False,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[Item]:
+        """
+        Searches item names and locations tolerating typing mistakes.
+
+        Candidates sharing trigrams with the keyword are fetched from the
+        trigram index, then ranked by the edit distance between the keyword
+        and the closest run of words in the name or location. Items more than
+        roughly one edit per three characters away are dropped, and exact
+        substring matches rank first, so results are always in rank order.
+        The filters, including the date range, are applied before ranking.
+        Keywords shorter than three characters fall back to :meth:`search_page`.
+
+        Args:
+            keyword (str): The search term, e.g. "samsng".
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            limit (int, optional): The maximum number of results. Defaults to 50.
+            include_archive (bool, optional): Also search archived items.
+                Defaults to False.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+
+        Returns:
+            List[Item]: Up to ``limit`` items, closest match first.
+        """
+        keyword_lower = keyword.strip().lower()
+        if len(keyword_lower) < 3:
+            return self.search_page(
+                keyword_lower,
+                category,
+                status,
+                start_date,
+                end_date,
+                limit=limit,
+                include_archive=include_archive,
+            )
+
+        max_distance = max(1, len(keyword_lower) // 3)
+        candidates = self.db.fuzzy_candidates(
+            keyword_lower,
+            FUZZY_CANDIDATES,
+            category,
+            status,
+            include_archive,
+            start_date,
+            end_date,
+        )
+        scored = []
+        for item in candidates:
+            distance = min(
+                best_word_distance(keyword_lower, item.name.lower(), max_distance),
+                best_word_distance(keyword_lower, item.location.lower(), max_distance),
+            )
+            if distance <= max_distance:
+                scored.append((distance, item.id, item))
+        scored.sort(key=lambda entry: entry[:2])
+        return [item for _, _, item in scored[:limit]]
+
     def filter_items(
         self,
         category: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_archive: bool = False,
     ) -> List[Item]:
         """
-        Filters items by exact category and/or status.
-        
+        Filters items by exact category and/or status, and by date range.
+
         If a parameter is omitted (None), it is not used for filtering.
+        Date bounds are inclusive.
 
         Args:
-            category (Optional[str], optional): The exact category to filter by. Defaults to None.
-            status (Optional[str], optional): The exact status to filter by. Defaults to None.
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            include_archive (bool, optional): Also return archived items.
+                Defaults to False.
 
         Returns:
             List[Item]: Items that match the provided filters.
         """
-        all_items = self.get_all_items()
-        
-        return [
-            item for item in all_items
-            if (category is None or item.category == category)
-            and (status is None or item.status == status)
-        ]
\ No newline at end of file
+        return self.db.filter_items(
+            category, status, start_date, end_date, include_archive
+        )
+
+    def get_items_between(self, start_date: str, end_date: str) -> List[Item]:
+        """
+        Retrieves items dated within an inclusive date range.
+
+        Args:
+            start_date (str): Earliest date (YYYY-MM-DD).
+            end_date (str): Latest date (YYYY-MM-DD).
+
+        Returns:
+            List[Item]: Items dated between the two bounds.
+        """
+        return self.db.filter_items(start_date=start_date, end_date=end_date)
+
+    def get_items_from_last_days(
+        self, days: int, status: Optional[str] = None
+    ) -> List[Item]:
+        """
+        Retrieves items dated within the last ``days`` days, including today.
+
+        For example ``get_items_from_last_days(7, status="Found")`` returns
+        the items found in the last week.
+
+        Args:
+            days (int): The size of the window in days.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+
+        Returns:
+            List[Item]: Items dated within the window.
+        """
+        start = date.today() - timedelta(days=max(days, 1) - 1)
+        return self.db.filter_items(
+            status=status, start_date=start.strftime(DATE_FORMAT)
+        )
+
+    def get_recent_items(self, limit: int, status: Optional[str] = None) -> List[Item]:
+        """
+        Retrieves the most recently dated items, newest first.
+
+        Args:
+            limit (int): The maximum number of items to return.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+
+        Returns:
+            List[Item]: Up to ``limit`` items ordered by date, newest first.
+        """
+        return self.db.get_recent_items(limit, status)
+
+    def archive_claimed_items(self, older_than_days: int, limit: int) -> int:
+        """
+        Archives one batch of Claimed items dated more than ``older_than_days`` ago.
+
+        Args:
+            older_than_days (int): The minimum age, in days, of archived items.
+            limit (int): The maximum number of items to move.
+
+        Returns:
+            int: The number of items archived.
+        """
+        cutoff = date.today() - timedelta(days=older_than_days)
+        return self.db.archive_claimed_items(cutoff.strftime(DATE_FORMAT), limit)
+
+    def stats(self) -> ItemStats:
+        """
+        Retrieves item counts by status, category and day.
+
+        Returns:
+            ItemStats: The aggregated counts.
+        """
+        return self.db.stats()
+
+    def data_version(self) -> int:
+        """
+        Retrieves the current data version, which every write increments.
+
+        Returns:
+            int: The current data version.
+        """
+        return self.db.data_version()
+
+    def changes_since(self, since_seq: int, limit: Optional[int] = None) -> ChangeSet:
+        """
+        Retrieves the items changed after a sync cursor, for incremental sync.
+
+        Args:
+            since_seq (int): The cursor returned by the previous call, or 0.
+            limit (Optional[int], optional): The maximum number of log entries
+                to read. Defaults to the database's batch size.
+
+        Returns:
+            ChangeSet: The changes and the cursor for the next call.
+
+        Raises:
+            ChangeLogExpiredError: If the cursor is older than the pruned log.
+        """
+        if limit is None:
+            return self.db.changes_since(since_seq)
+        return self.db.changes_since(since_seq, limit)
+
+    def change_cursor(self) -> int:
+        """
+        Retrieves the sync cursor of the latest change.
+
+        Returns:
+            int: The latest change log sequence number.
+        """
+        return self.db.change_cursor()
+
+    def make_etag(self, resource: str, **params: Any) -> str:
+        """
+        Builds an entity tag for a query result at the current data version.
+
+        The tag combines the data version with a digest of the resource name
+        and query parameters, so it changes whenever the data changes and
+        differs between queries. It is computed without running the query,
+        which lets HTTP layers answer conditional requests cheaply.
+
+        Args:
+            resource (str): The name of the queried resource, e.g. "items".
+            **params (Any): The query parameters; None values are ignored.
+
+        Returns:
+            str: A quoted strong entity tag.
+        """
+        query = json.dumps(
+            [resource, {k: v for k, v in sorted(params.items()) if v is not None}]
+        )
+        digest = hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+        return f'"{self.data_version()}-{digest}"'
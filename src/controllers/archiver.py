@@ -0,0 +1,107 @@
+"""Background archiving of old Claimed items."""
+
+import logging
+import sqlite3
+import threading
+from typing import Any, Optional
+
+from src.controllers.app_controller import AppController
+
+DEFAULT_MAX_AGE_DAYS = 365
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_INTERVAL = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+class Archiver:
+    """
+    Moves Claimed items older than ``max_age_days`` into the archive.
+
+    Items are moved ``batch_size`` at a time, each batch in its own short
+    transaction (see :meth:`DatabaseManager.archive_claimed_items`), so the
+    write lock is released between batches and interactive writes are never
+    held up for long.  :meth:`start` runs the archiver on a daemon thread that
+    drains the backlog and then checks again every ``interval`` seconds.  A
+    failed pass, e.g. while another process holds the database locked, is
+    logged and retried on the next check.
+
+    Attributes:
+        controller (AppController): The controller whose database is archived.
+        max_age_days (int): The age, in days, after which Claimed items are archived.
+        batch_size (int): The maximum number of items moved per transaction.
+        interval (float): The seconds to wait between archiving passes.
+    """
+
+    def __init__(
+        self,
+        controller: AppController,
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        self.controller = controller
+        self.max_age_days = max_age_days
+        self.batch_size = batch_size
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "Archiver":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def archive_batch(self) -> int:
+        """
+        Archives a single batch.
+
+        Returns:
+            int: The number of items archived.
+        """
+        return self.controller.archive_claimed_items(self.max_age_days, self.batch_size)
+
+    def archive_all(self) -> int:
+        """
+        Archives batches until no eligible items remain or :meth:`stop` is called.
+
+        Returns:
+            int: The total number of items archived.
+        """
+        total = 0
+        while not self._stop.is_set():
+            moved = self.archive_batch()
+            total += moved
+            if moved < self.batch_size:
+                break
+        return total
+
+    def start(self) -> None:
+        """Starts archiving on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="lostfound-archiver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread after its current batch."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Background thread main loop."""
+        while not self._stop.is_set():
+            try:
+                self.archive_all()
+            except sqlite3.Error:
+                logger.exception(
+                    "Archiving failed; retrying in %s seconds", self.interval
+                )
+            self._stop.wait(self.interval)
@@ -0,0 +1,281 @@
+"""asyncio facade over :class:`AppController`."""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, List, Optional, TypeVar
+
+from src.controllers.app_controller import AppController
+from src.models.changes import ChangeSet
+from src.models.item import Item
+from src.models.stats import ItemStats
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class AsyncAppController:
+    """
+    Awaitable version of :class:`AppController` for asyncio applications.
+
+    Every blocking controller call runs on a dedicated, bounded thread pool,
+    so the event loop is never blocked by sqlite.  Each worker thread owns its
+    own database connection (see :class:`~src.models.database.DatabaseManager`),
+    which lets many concurrent requests share a small, fixed set of
+    connections safely.
+
+    Calls first wait for a free worker on an asyncio semaphore.  Cancelling a
+    call while it waits therefore guarantees it never runs; a call that has
+    already started finishes in the background and its result is discarded.
+    Streams fetch one page per worker call and stop at the next page boundary
+    when cancelled.
+
+    Attributes:
+        controller (AppController): The wrapped synchronous controller.
+        max_workers (int): The number of worker threads and connections.
+    """
+
+    def __init__(
+        self, controller: AppController, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
+        """
+        Initializes the AsyncAppController.
+
+        Args:
+            controller (AppController): The synchronous controller to wrap.
+            max_workers (int, optional): The size of the worker pool. Defaults to 4.
+        """
+        self.controller = controller
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lostfound-db"
+        )
+        self._slots = asyncio.Semaphore(max_workers)
+
+    async def __aenter__(self) -> "AsyncAppController":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Waits for running calls to finish, closes every worker's database
+        connection and shuts the worker pool down.
+        """
+        # One close task per worker; each waits at the barrier until all of
+        # them run, so no worker can take two and every thread gets one.
+        barrier = threading.Barrier(self.max_workers)
+
+        def close_connection() -> None:
+            self.controller.db.close()
+            barrier.wait()
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, close_connection)
+                for _ in range(self.max_workers)
+            )
+        )
+        await loop.run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a blocking call on the worker pool once a worker is free."""
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def add_item(self, item: Item, allow_duplicates: bool = True) -> int:
+        """Adds a new item; see :meth:`AppController.add_item`."""
+        return await self._run(self.controller.add_item, item, allow_duplicates)
+
+    async def get_item(
+        self, item_id: int, include_archive: bool = False
+    ) -> Optional[Item]:
+        """Retrieves one item; see :meth:`AppController.get_item`."""
+        return await self._run(self.controller.get_item, item_id, include_archive)
+
+    async def get_all_items(self, include_archive: bool = False) -> List[Item]:
+        """Retrieves every item; see :meth:`AppController.get_all_items`."""
+        return await self._run(self.controller.get_all_items, include_archive)
+
+    async def update_item(
+        self, item: Item, expected_version: Optional[int] = None
+    ) -> bool:
+        """Updates an item; see :meth:`AppController.update_item`."""
+        return await self._run(self.controller.update_item, item, expected_version)
+
+    async def delete_item(self, item_id: int) -> bool:
+        """Deletes an item; see :meth:`AppController.delete_item`."""
+        return await self._run(self.controller.delete_item, item_id)
+
+    async def search_items(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_archive: bool = False,
+    ) -> List[Item]:
+        """Searches items; see :meth:`AppController.search_items`."""
+        return await self._run(
+            self.controller.search_items,
+            keyword,
+            category,
+            status,
+            start_date,
+            end_date,
+            include_archive,
+        )
+
+    async def fuzzy_search(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        include_archive: bool = False,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[Item]:
+        """Searches tolerating typos; see :meth:`AppController.fuzzy_search`."""
+        return await self._run(
+            self.controller.fuzzy_search,
+            keyword,
+            category,
+            status,
+            limit,
+            include_archive,
+            start_date,
+            end_date,
+        )
+
+    async def filter_items(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_archive: bool = False,
+    ) -> List[Item]:
+        """Filters items; see :meth:`AppController.filter_items`."""
+        return await self._run(
+            self.controller.filter_items,
+            category,
+            status,
+            start_date,
+            end_date,
+            include_archive,
+        )
+
+    async def search_page(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        include_archive: bool = False,
+        sort_by: str = "id",
+        descending: bool = False,
+        after_value: Any = None,
+    ) -> List[Item]:
+        """Retrieves one page of results; see :meth:`AppController.search_page`."""
+        return await self._run(
+            self.controller.search_page,
+            keyword,
+            category,
+            status,
+            start_date,
+            end_date,
+            after_id,
+            limit,
+            include_archive,
+            sort_by,
+            descending,
+            after_value,
+        )
+
+    async def stream_search(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page_size: int = 100,
+        include_archive: bool = False,
+        sort_by: str = "id",
+        descending: bool = False,
+    ) -> AsyncIterator[Item]:
+        """
+        Streams search results page by page as an async iterator.
+
+        Each page is fetched with a separate keyset-paginated worker call, so
+        at most ``page_size`` items are held at once and other requests can
+        interleave between pages.
+
+        Args:
+            keyword (str): The search term.
+            category (Optional[str], optional): The exact category to filter by.
+                Defaults to None.
+            status (Optional[str], optional): The exact status to filter by.
+                Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            page_size (int, optional): Items fetched per worker call. Defaults to 100.
+            include_archive (bool, optional): Also search archived items.
+                Defaults to False.
+            sort_by (str, optional): The sort key. Defaults to "id".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+
+        Yields:
+            Item: Each matching item, in sort order.
+        """
+        after_id = after_value = None
+        while True:
+            page = await self.search_page(
+                keyword,
+                category,
+                status,
+                start_date,
+                end_date,
+                after_id,
+                page_size,
+                include_archive,
+                sort_by,
+                descending,
+                after_value,
+            )
+            for item in page:
+                yield item
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+            after_value = self.controller.sort_value(page[-1], sort_by)
+
+    async def stats(self) -> ItemStats:
+        """Retrieves aggregate counts; see :meth:`AppController.stats`."""
+        return await self._run(self.controller.stats)
+
+    async def data_version(self) -> int:
+        """Retrieves the data version; see :meth:`AppController.data_version`."""
+        return await self._run(self.controller.data_version)
+
+    async def changes_since(
+        self, since_seq: int, limit: Optional[int] = None
+    ) -> ChangeSet:
+        """Retrieves changed items; see :meth:`AppController.changes_since`."""
+        return await self._run(self.controller.changes_since, since_seq, limit)
@@ -0,0 +1,192 @@
+"""Multi-process query service for search-heavy workloads.
+
+Keyword matching in :meth:`AppController.search_items` is pure Python and so
+runs on a single core under the GIL.  :class:`QueryPool` spreads search and
+filter requests over worker processes instead.  Each worker holds its own
+read-only connection to the same database file; WAL mode lets these readers
+run alongside the application's writer without blocking it.
+
+Requests are sent to the workers as small query tuples and results come back
+as compact row tuples ``(id, name, category, date, location, status,
+contact_info, version)``.  This keeps the pickling cost low, and callers that
+only render rows never pay for building :class:`Item` objects.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+from src.controllers.app_controller import AppController
+from src.models.database import DatabaseManager
+from src.models.item import Item
+
+ItemRow = Tuple[int, str, str, str, str, str, str, int]
+Query = Tuple[str, Tuple[Any, ...]]
+
+_worker_controller: Optional[AppController] = None
+
+
+def _init_worker(db_name: str) -> None:
+    """Opens the worker process's read-only controller."""
+    global _worker_controller
+    _worker_controller = AppController(DatabaseManager(db_name, read_only=True))
+
+
+def _run_query(query: Query) -> List[ItemRow]:
+    """Executes one query tuple inside a worker process."""
+    assert _worker_controller is not None, "worker was not initialized"
+    operation, args = query
+    if operation == "search":
+        keyword, category, status, start_date, end_date, after_id, limit = args
+        if limit is None:
+            items = _worker_controller.search_items(
+                keyword, category, status, start_date, end_date
+            )
+        else:
+            items = _worker_controller.search_page(
+                keyword, category, status, start_date, end_date, after_id, limit
+            )
+    elif operation == "filter":
+        items = _worker_controller.filter_items(*args)
+    else:
+        raise ValueError(f"Unknown query operation '{operation}'")
+    return [
+        (
+            item.id,
+            item.name,
+            item.category,
+            item.date,
+            item.location,
+            item.status,
+            item.contact_info,
+            item.version,
+        )
+        for item in items
+    ]
+
+
+def row_to_item(row: ItemRow) -> Item:
+    """
+    Builds an Item from a compact row tuple returned by the pool.
+
+    Args:
+        row (ItemRow): The row tuple.
+
+    Returns:
+        Item: The corresponding item.
+    """
+    item_id, name, category, date, location, status, contact_info, version = row
+    return Item(
+        name,
+        category,
+        date,
+        location,
+        status,
+        contact_info,
+        id=item_id,
+        version=version,
+    )
+
+
+class QueryPool:
+    """
+    A pool of worker processes serving read-only search and filter queries.
+
+    The database must already exist and be initialized, e.g. by the
+    application's read-write :class:`DatabaseManager`.
+
+    Attributes:
+        db_name (str): The path of the shared database file.
+        workers (int): The number of worker processes.
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        workers: Optional[int] = None,
+        start_method: str = "spawn",
+    ) -> None:
+        """
+        Starts the worker processes.
+
+        Args:
+            db_name (str): The path of the shared database file.
+            workers (Optional[int], optional): The number of processes. Defaults
+                to the number of CPUs.
+            start_method (str, optional): The multiprocessing start method.
+                Defaults to "spawn", which is safe for threaded parents.
+        """
+        self.db_name = db_name
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(db_name,),
+        )
+
+    def __enter__(self) -> "QueryPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Waits for pending queries and stops the worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def submit_search(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> "Future[List[ItemRow]]":
+        """
+        Queues a search on the pool without waiting for it.
+
+        The arguments match :meth:`AppController.search_page`.  Without a
+        ``limit`` every match is returned.
+
+        Returns:
+            Future[List[ItemRow]]: A future resolving to the matching rows.
+        """
+        args = (keyword, category, status, start_date, end_date, after_id, limit)
+        return self._executor.submit(_run_query, ("search", args))
+
+    def search_rows(self, keyword: str, **filters: Any) -> List[ItemRow]:
+        """
+        Searches on the pool and waits for the matching rows.
+
+        Args:
+            keyword (str): The search term.
+            **filters (Any): Keyword arguments of :meth:`submit_search`.
+
+        Returns:
+            List[ItemRow]: The matching rows, in ID order.
+        """
+        return self.submit_search(keyword, **filters).result()
+
+    def search_items(self, keyword: str, **filters: Any) -> List[Item]:
+        """Like :meth:`search_rows`, but returns Item objects."""
+        return [row_to_item(row) for row in self.search_rows(keyword, **filters)]
+
+    def filter_rows(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[ItemRow]:
+        """
+        Filters items on the pool; see :meth:`AppController.filter_items`.
+
+        Returns:
+            List[ItemRow]: The matching rows, in ID order.
+        """
+        args = (category, status, start_date, end_date)
+        return self._executor.submit(_run_query, ("filter", args)).result()
@@ -15,13 +15,46 @@ The public API exposed by this package is:
 
    Item
    ValidationError
+   validate_batch
+   merge_edits
    DatabaseManager
+   ConflictError
+   DuplicateError
+   ChangeLogExpiredError
+   Change
+   ChangeSet
+   ItemStats
+   ResultSet
+   SearchResult
+   WriteQueue
 """
 
-from .item import Item, ValidationError
-from .database import DatabaseManager
+from .item import Item, ValidationError, merge_edits, validate_batch
+from .changes import Change, ChangeSet
+from .database import (
+    ChangeLogExpiredError,
+    ConflictError,
+    DatabaseManager,
+    DuplicateError,
+)
+from .result_set import ResultSet
+from .search import SearchResult
+from .stats import ItemStats
+from .write_queue import WriteQueue
 
 __all__ = [
-    "Item", "ValidationError",
-    "DatabaseManager"
+    "Item",
+    "ValidationError",
+    "validate_batch",
+    "merge_edits",
+    "DatabaseManager",
+    "ConflictError",
+    "DuplicateError",
+    "ChangeLogExpiredError",
+    "Change",
+    "ChangeSet",
+    "ItemStats",
+    "ResultSet",
+    "SearchResult",
+    "WriteQueue",
 ]
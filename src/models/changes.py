@@ -0,0 +1,47 @@
+"""Incremental change sets for mirroring items into other systems."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.models.item import Item
+
+
+@dataclass
+class Change:
+    """
+    The latest state of one changed item.
+
+    Attributes:
+        seq (int): The sequence number of the item's latest logged change.
+        item_id (int): The ID of the changed item.
+        item (Optional[Item]): The item as currently stored, in the live
+            table or the archive, or None if it was deleted.
+        archived (bool): Whether the item is stored in the archive.
+    """
+
+    seq: int
+    item_id: int
+    item: Optional[Item] = None
+    archived: bool = False
+
+    @property
+    def deleted(self) -> bool:
+        """Whether the item no longer exists, live or archived."""
+        return self.item is None
+
+
+@dataclass
+class ChangeSet:
+    """
+    One page of changes after a sync cursor.
+
+    Attributes:
+        changes (List[Change]): The changed items in sequence order, each
+            listed once with its current state.
+        next_seq (int): The cursor to pass to the next call.
+        has_more (bool): Whether more changes may follow ``next_seq``.
+    """
+
+    changes: List[Change] = field(default_factory=list)
+    next_seq: int = 0
+    has_more: bool = False
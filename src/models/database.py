@@ -1,146 +1,1424 @@
 """Database management for Lost and Found application."""
 
+import heapq
 import sqlite3
-from typing import List
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+from src.models.changes import Change, ChangeSet
 from src.models.item import Item
+from src.models.migrations import BATCH_SIZE, CODED_COLUMNS, migrate
+from src.models.profiles import DEFAULT_PROFILE, apply_pragmas, resolve_pragmas
+from src.models.stats import ItemStats
+from src.utils.dates import date_to_day_number, day_number_to_date
+from src.utils.dedupe import duplicate_hash
+from src.utils.fuzzy import trigrams
+
+ITEM_COLUMNS = "id, name, category_id, date, location, status_id, contact_info, version"
+FETCH_BATCH_SIZE = 500
+ROW_FIELDS = ("name", "date", "location", "contact_info")
+"""The text columns :meth:`DatabaseManager.iter_rows` can read."""
+
+WriteOperation = Tuple[str, Tuple[Any, ...]]
+
+SORT_KEYS = {
+    "id": "id",
+    "name": "name COLLATE NOCASE",
+    "category": "category_id",
+    "date": "COALESCE(date_num, 0)",
+    "location": "location COLLATE NOCASE",
+    "status": "status_id",
+    "contact_info": "contact_info COLLATE NOCASE",
+}
+"""SQL sort expressions keyed by sort key; text sorts ignore ASCII case.
+
+Category and status are stored as codes, so :meth:`DatabaseManager.iter_items`
+orders them by name one code at a time rather than by their expression.
+"""
+
+
+class ConflictError(Exception):
+    """
+    Raised when an item was changed by someone else since it was read.
+
+    Attributes:
+        item_id (int): The ID of the conflicting item.
+        expected_version (int): The version the caller based its changes on.
+        current_version (int): The version currently stored.
+    """
+
+    def __init__(
+        self, item_id: int, expected_version: int, current_version: int
+    ) -> None:
+        super().__init__(
+            f"Item {item_id} was modified by someone else "
+            f"(expected version {expected_version}, found {current_version})"
+        )
+        self.item_id = item_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+
+
+class DuplicateError(Exception):
+    """
+    Raised when an item looks like a report that is already stored.
+
+    Attributes:
+        item (Item): The rejected item.
+        duplicate_ids (List[int]): The IDs of the stored look-alikes.
+    """
+
+    def __init__(self, item: Item, duplicate_ids: List[int]) -> None:
+        super().__init__(
+            f"'{item.name}' looks like a duplicate of item "
+            + ", ".join(str(item_id) for item_id in duplicate_ids)
+        )
+        self.item = item
+        self.duplicate_ids = duplicate_ids
+
+
+class ChangeLogExpiredError(Exception):
+    """
+    Raised when a sync cursor points into change log entries already pruned.
+
+    The caller has missed changes and must reload every item, then continue
+    from :meth:`DatabaseManager.change_cursor`.
+
+    Attributes:
+        since_seq (int): The expired cursor.
+        pruned_seq (int): The sequence number the log was pruned up to.
+    """
+
+    def __init__(self, since_seq: int, pruned_seq: int) -> None:
+        super().__init__(
+            f"Change log cursor {since_seq} has expired "
+            f"(entries up to {pruned_seq} were pruned)"
+        )
+        self.since_seq = since_seq
+        self.pruned_seq = pruned_seq
+
+
+class CodeTable:
+    """
+    In-memory cache of a lookup table mapping names to integer codes.
+
+    Codes are never reassigned, so cached entries stay valid for the life of
+    the database and the table is only read again when a name or code is
+    missing, e.g. after another process added a category.  The mappings are
+    replaced as a whole on reload, so concurrent readers need no lock.
+
+    The cache is only ever filled from committed data: codes added inside a
+    write transaction that may still roll back are not cached.
+
+    Attributes:
+        table (str): The lookup table, ``categories`` or ``statuses``.
+    """
+
+    def __init__(self, table: str, connect: Callable[[], sqlite3.Connection]) -> None:
+        self.table = table
+        self._connect = connect
+        self._codes: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+
+    def load(self) -> None:
+        """Reads the whole lookup table into the cache."""
+        rows = self._connect().execute(f"SELECT id, name FROM {self.table}").fetchall()
+        self._names = dict(rows)
+        self._codes = {name: code for code, name in rows}
+
+    def cached_code(self, name: str) -> Optional[int]:
+        """Returns the code of a name if it is cached, without reading the table."""
+        return self._codes.get(name)
+
+    def code(self, name: str) -> Optional[int]:
+        """
+        Returns the code of a name, reloading the table on a cache miss.
+
+        Returns:
+            Optional[int]: The code, or None if no item ever used the name.
+        """
+        if name not in self._codes:
+            self.load()
+        return self._codes.get(name)
+
+    def name(self, code: int) -> str:
+        """Returns the name of a code, reloading the table on a cache miss."""
+        if code not in self._names:
+            self.load()
+        return self._names[code]
+
+    def names(self) -> List[str]:
+        """
+        Returns every known name, freshly read, in case-insensitive order.
+
+        Names differing only in case are ordered by themselves, so the order
+        is total and stable.
+        """
+        self.load()
+        return sorted(self._codes, key=lambda name: (name.casefold(), name))
 
 
 class DatabaseManager:
     """
     Handles all SQLite3 database operations for the application.
-    
+
+    Each thread gets its own connection, opened on first use and reused for
+    every later call from that thread, so a single manager can be shared by
+    the GUI, worker threads and multithreaded servers.  The database runs in
+    WAL mode so readers never block the writer.
+
+    A read-only manager opens its connections with ``mode=ro`` and skips
+    migrations; it is meant for extra reader processes sharing a database
+    that a read-write manager has already initialized.
+
+    Every connection is configured with the pragmas of a named performance
+    profile (see :mod:`src.models.profiles`), optionally with individual
+    pragmas overridden.
+
+    Categories and statuses are stored as small integer codes referencing
+    the ``categories`` and ``statuses`` lookup tables.  The manager encodes
+    and decodes them through a :class:`CodeTable` cache per column, so callers
+    only ever see names.
+
     Attributes:
         db_name (str): The name/path of the SQLite database file.
+        read_only (bool): Whether connections are opened read-only.
+        pragmas (Dict[str, Any]): The pragmas applied to every connection.
     """
-    def __init__(self, db_name: str = "lost_and_found.db") -> None:
+
+    def __init__(
+        self,
+        db_name: str = "lost_and_found.db",
+        migration_batch_size: int = BATCH_SIZE,
+        read_only: bool = False,
+        profile: str = DEFAULT_PROFILE,
+        pragmas: Optional[Mapping[str, Any]] = None,
+    ) -> None:
         self.db_name = db_name
-        self._initialize_db()
-        
+        self.migration_batch_size = migration_batch_size
+        self.read_only = read_only
+        self.pragmas = resolve_pragmas(profile, pragmas)
+        self._local = threading.local()
+        self._code_tables = {
+            column: CodeTable(table, self._connect)
+            for column, table in CODED_COLUMNS.items()
+        }
+        if not read_only:
+            self._initialize_db()
+
     def _initialize_db(self) -> None:
-        """Creates the items table if it does not already exist."""
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    date TEXT NOT NULL,
-                    location TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    contact_info TEXT NOT NULL
-                )
-                """
-            )
-    
-    def add_item(self, item: Item) -> int:
+        """Brings the database schema up to date by applying pending migrations."""
+        conn = sqlite3.connect(self.db_name)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            apply_pragmas(conn, self.pragmas)
+            migrate(conn, self.migration_batch_size)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's connection, opening it on first use.
+
+        The connection is used as a context manager by the callers, which
+        commits (or rolls back) the transaction without closing it.
+
+        Returns:
+            sqlite3.Connection: The connection owned by the current thread.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.read_only:
+                uri = f"{Path(self.db_name).resolve().as_uri()}?mode=ro"
+                conn = sqlite3.connect(uri, uri=True)
+            else:
+                conn = sqlite3.connect(self.db_name)
+            apply_pragmas(conn, self.pragmas)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Closes the calling thread's connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def add_item(self, item: Item, allow_duplicates: bool = True) -> int:
         """
         Adds a new item to the database.
-        
+
         Args:
             item (Item): The validated Item object to store.
-            
+            allow_duplicates (bool, optional): Store the item even if it looks
+                like an existing report (see :meth:`find_duplicates`).
+                Defaults to True.
+
         Returns:
             int: The generated database ID of the newly inserted item.
+
+        Raises:
+            DuplicateError: If duplicates are not allowed and one is stored.
+        """
+        with self._connect() as conn:
+            return self._insert(conn.cursor(), item, allow_duplicates)
+
+    def add_items(
+        self, items: Sequence[Item], skip_duplicates: bool = False
+    ) -> List[int]:
         """
-        with sqlite3.connect(self.db_name) as conn:
+        Adds several items in a single transaction.
+
+        This is much faster than calling :meth:`add_item` in a loop because the
+        transaction is committed, and synced to disk, only once.
+
+        Args:
+            items (Sequence[Item]): The validated Item objects to store.
+            skip_duplicates (bool, optional): Leave out items that look like a
+                stored report or an earlier item of the batch. Skipped items
+                keep an ID of None. Defaults to False.
+
+        Returns:
+            List[int]: The generated database IDs of the stored items, in input order.
+        """
+        ids = []
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            for item in items:
+                try:
+                    ids.append(self._insert(cursor, item, not skip_duplicates))
+                except DuplicateError:
+                    continue
+        return ids
+
+    def find_duplicates(self, item: Item, limit: int = 10) -> List[Item]:
+        """
+        Retrieves stored items that look like the same report as ``item``.
+
+        Items are duplicates when their name, category, date and location
+        agree after normalising case, punctuation and spacing. The check is
+        a single lookup on the indexed ``duplicate_hash`` column.
+
+        Args:
+            item (Item): The item to check; it is never its own duplicate.
+            limit (int, optional): The maximum number of duplicates. Defaults to 10.
+
+        Returns:
+            List[Item]: The look-alikes, oldest first.
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO items (name, category, date, location, status, contact_info) 
-                VALUES (?, ?, ?, ?, ?, ?)
+                f"""
+                SELECT {ITEM_COLUMNS} FROM items
+                WHERE duplicate_hash = ? AND id IS NOT ?
+                ORDER BY id LIMIT ?
                 """,
-                (
-                    item.name,
-                    item.category,
-                    item.date,
-                    item.location,
-                    item.status,
-                    item.contact_info
-                )
+                (self._duplicate_hash(item), item.id, limit),
             )
-            new_id = cursor.lastrowid
-            item.id = new_id
-            return new_id if new_id else 0
-        return 0
-    
-    def get_all_items(self) -> List[Item]:
+            rows = cursor.fetchall()
+        return [self._row_to_item(row) for row in rows]
+
+    @staticmethod
+    def _duplicate_hash(item: Item) -> int:
+        return duplicate_hash(item.name, item.category, item.date, item.location)
+
+    def get_item(self, item_id: int, include_archive: bool = False) -> Optional[Item]:
         """
-        Retrieves all items from teh database.
+        Retrieves a single item by its ID.
+
+        Args:
+            item_id (int): The database ID of the item.
+            include_archive (bool, optional): Also look in the archive.
+                Defaults to False.
 
         Returns:
-            List[Item]: A list of Item objects representing every row in the DB.
+            Optional[Item]: The item, or None if the ID was not found.
         """
-        with sqlite3.connect(self.db_name) as conn:
+        source = self._source(include_archive)
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT id, name, category, date, location, status, contact_info FROM items"
+                f"SELECT {ITEM_COLUMNS} FROM {source} WHERE id = ?", (item_id,)
             )
+            row = cursor.fetchone()
+        return self._row_to_item(row) if row else None
+
+    def get_items(
+        self, item_ids: Sequence[int], include_archive: bool = False
+    ) -> List[Optional[Item]]:
+        """
+        Retrieves several items by ID in one query per batch.
+
+        Args:
+            item_ids (Sequence[int]): The IDs, e.g. a slice of :meth:`iter_rows`.
+            include_archive (bool, optional): Also look in the archive.
+                Defaults to False.
+
+        Returns:
+            List[Optional[Item]]: The items in the order of ``item_ids``, None
+            for IDs no longer found.
+        """
+        source = self._source(include_archive)
+        found: Dict[int, Item] = {}
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(item_ids), FETCH_BATCH_SIZE):
+                chunk = list(item_ids[start : start + FETCH_BATCH_SIZE])
+                cursor.execute(
+                    f"SELECT {ITEM_COLUMNS} FROM {source} "
+                    f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    found[row[0]] = self._row_to_item(row)
+        return [found.get(item_id) for item_id in item_ids]
+
+    def archived_ids(self, item_ids: Sequence[int]) -> Set[int]:
+        """
+        Finds which of the given items are in the archive.
+
+        Args:
+            item_ids (Sequence[int]): The IDs to look up.
+
+        Returns:
+            Set[int]: The IDs stored in ``items_archive``.
+        """
+        archived: Set[int] = set()
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(item_ids), FETCH_BATCH_SIZE):
+                chunk = list(item_ids[start : start + FETCH_BATCH_SIZE])
+                cursor.execute(
+                    f"SELECT id FROM items_archive "
+                    f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                archived.update(row[0] for row in cursor.fetchall())
+        return archived
+
+    def get_all_items(self, include_archive: bool = False) -> List[Item]:
+        """
+        Retrieves all items from teh database.
+
+        Args:
+            include_archive (bool, optional): Also return archived items.
+                Defaults to False.
+
+        Returns:
+            List[Item]: A list of Item objects representing every row in the DB.
+        """
+        source = self._source(include_archive)
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {ITEM_COLUMNS} FROM {source}")
             rows = cursor.fetchall()
-            
-            items = []
+        return [self._row_to_item(row) for row in rows]
+
+    def iter_items(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = FETCH_BATCH_SIZE,
+        include_archive: bool = False,
+        contains: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        after_value: Any = None,
+    ) -> Iterator[Item]:
+        """
+        Lazily yields items matching the filters, in ID order by default.
+
+        Rows are fetched in keyset batches (``id > last_id ... LIMIT n``), each
+        with its own short query, so arbitrarily large results can be streamed
+        with bounded memory and no long-lived cursor.
+
+        With ``sort_by`` the items are ordered by one of :data:`SORT_KEYS`
+        instead, ties broken by ID, and the batches continue from the last
+        ``(sort value, id)`` pair. Each sort key has a matching index, so a
+        page costs the same however deep it is. To resume after an item pass
+        its ID as ``after_id`` and its :meth:`sort_value` as ``after_value``.
+
+        ``contains`` narrows the rows using the trigram index to those whose
+        name, location or contact info may contain the given text. It is a
+        candidate filter only: every item containing the text is yielded, but
+        callers must still verify the match themselves. Texts the index cannot
+        answer exactly (shorter than three characters or non-ASCII) are
+        ignored.
+
+        Args:
+            category (Optional[str], optional): The exact category. Defaults to None.
+            status (Optional[str], optional): The exact status. Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            after_id (Optional[int], optional): Only yield items after the one with this
+                ID. Defaults to None.
+            batch_size (int, optional): Rows fetched per query.
+                Defaults to FETCH_BATCH_SIZE.
+            include_archive (bool, optional): Also yield archived items.
+                Defaults to False.
+            contains (Optional[str], optional): Lowercase text the items should contain.
+                Defaults to None.
+            sort_by (str, optional): The sort key. Defaults to "id".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+            after_value (Any, optional): The sort value of the ``after_id`` item.
+                Defaults to None.
+
+        Yields:
+            Item: Each matching item.
+
+        Raises:
+            ValueError: If a date bound is not in YYYY-MM-DD format, or the
+                sort key is unknown.
+        """
+        for row in self._iter_rows(
+            ITEM_COLUMNS,
+            category,
+            status,
+            start_date,
+            end_date,
+            after_id,
+            batch_size,
+            include_archive,
+            contains,
+            sort_by,
+            descending,
+            after_value,
+        ):
+            yield self._row_to_item(row)
+
+    def iter_rows(
+        self,
+        fields: Sequence[str] = (),
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        batch_size: int = FETCH_BATCH_SIZE,
+        include_archive: bool = False,
+        contains: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Lazily yields the IDs of the items :meth:`iter_items` would yield.
+
+        Only the ID and the requested ``fields`` are read, as ``(id, *fields)``
+        tuples, so listing every match of a large result costs a few bytes
+        per item instead of a full :class:`Item`. Fetch the items themselves
+        with :meth:`get_items` once they are needed.
+
+        Args:
+            fields (Sequence[str], optional): Text columns to read along with
+                the ID, e.g. to verify a ``contains`` match. Defaults to ().
+            category (Optional[str], optional): The exact category. Defaults to None.
+            status (Optional[str], optional): The exact status. Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            batch_size (int, optional): Rows fetched per query.
+                Defaults to FETCH_BATCH_SIZE.
+            include_archive (bool, optional): Also yield archived items.
+                Defaults to False.
+            contains (Optional[str], optional): Lowercase text the items should contain.
+                Defaults to None.
+            sort_by (str, optional): The sort key. Defaults to "id".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+
+        Yields:
+            Tuple[Any, ...]: The ID and fields of each matching item.
+
+        Raises:
+            ValueError: If a field or the sort key is unknown, or a date bound
+                is not in YYYY-MM-DD format.
+        """
+        unknown = set(fields) - set(ROW_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot read fields {sorted(unknown)}")
+        yield from self._iter_rows(
+            ", ".join(("id",) + tuple(fields)),
+            category,
+            status,
+            start_date,
+            end_date,
+            None,
+            batch_size,
+            include_archive,
+            contains,
+            sort_by,
+            descending,
+            None,
+        )
+
+    def _iter_rows(
+        self,
+        columns: str,
+        category: Optional[str],
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        after_id: Optional[int],
+        batch_size: int,
+        include_archive: bool,
+        contains: Optional[str],
+        sort_by: str,
+        descending: bool,
+        after_value: Any,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Yields the ``columns`` of the matching rows; see :meth:`iter_items`."""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Cannot sort by '{sort_by}'")
+        if sort_by in CODED_COLUMNS:
+            yield from self._iter_by_name(
+                columns,
+                sort_by,
+                category,
+                status,
+                start_date,
+                end_date,
+                after_id,
+                batch_size,
+                include_archive,
+                contains,
+                descending,
+                after_value,
+            )
+            return
+        expression = SORT_KEYS[sort_by]
+        direction, op, bound = ("DESC", "<", "<=") if descending else ("ASC", ">", ">=")
+        order = f"{expression} {direction}"
+        if sort_by != "id":
+            order += f", id {direction}"
+
+        conditions, params = self._filter_conditions(
+            category, status, start_date, end_date
+        )
+        phrase = self._trigram_phrase(contains)
+        source = self._source(include_archive)
+        key = None
+        if after_id is not None:
+            key = (after_id if sort_by == "id" else after_value, after_id)
+
+        while True:
+            batch_conditions = list(conditions)
+            batch_params = list(params)
+            if key is not None:
+                value, last_id = key
+                if sort_by == "id":
+                    batch_conditions.append(f"id {op} ?")
+                    batch_params.append(last_id)
+                else:
+                    # The redundant single-column bound lets SQLite seek the
+                    # index instead of scanning it from the start.
+                    batch_conditions.append(
+                        f"{expression} {bound} ? AND ({expression}, id) {op} (?, ?)"
+                    )
+                    batch_params += [value, value, last_id]
+            if phrase is not None:
+                fts_bound = ""
+                if key is not None and sort_by == "id":
+                    fts_bound = f" AND rowid {op} ?"
+                batch_conditions.append(
+                    "id IN (SELECT rowid FROM items_fts "
+                    f"WHERE items_fts MATCH ?{fts_bound})"
+                )
+                batch_params.append(phrase)
+                if fts_bound:
+                    batch_params.append(key[1])
+            where = (
+                f"WHERE {' AND '.join(batch_conditions)}" if batch_conditions else ""
+            )
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    SELECT {columns}, {expression} FROM {source} {where}
+                    ORDER BY {order} LIMIT ?
+                    """,
+                    batch_params + [batch_size],
+                )
+                rows = cursor.fetchall()
             for row in rows:
-                item = Item(
-                    id=row[0],
-                    name=row[1],
-                    category=row[2],
-                    date=row[3],
-                    location=row[4],
-                    status=row[5],
-                    contact_info=row[6]
+                yield row[:-1]
+            if len(rows) < batch_size:
+                return
+            key = (rows[-1][-1], rows[-1][0])
+
+    def _iter_by_name(
+        self,
+        columns: str,
+        column: str,
+        category: Optional[str],
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        after_id: Optional[int],
+        batch_size: int,
+        include_archive: bool,
+        contains: Optional[str],
+        descending: bool,
+        after_value: Any,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yields rows ordered by the name of a dictionary-encoded column.
+
+        Codes are not in name order, so the names are walked in
+        case-insensitive order, like the text columns sorted with
+        ``COLLATE NOCASE``, and the items of each are streamed in ID order as
+        their own segment, which the ``(code, id)`` index serves without
+        sorting.  Names differing only in case share a segment, merged by ID,
+        so the ``(name, id)`` keyset stays unambiguous.
+        """
+        filters = {"category": category, "status": status}
+        groups: Dict[str, List[str]] = {}
+        for name in self._code_tables[column].names():
+            if filters[column] is None or name == filters[column]:
+                groups.setdefault(name.casefold(), []).append(name)
+        after_key = after_value.casefold() if after_id is not None else None
+        for key in sorted(groups, reverse=descending):
+            resume = None
+            if after_key is not None:
+                if key == after_key:
+                    resume = after_id
+                elif (key > after_key) if descending else (key < after_key):
+                    continue
+            segments = [
+                self._iter_rows(
+                    columns,
+                    segment["category"],
+                    segment["status"],
+                    start_date,
+                    end_date,
+                    resume,
+                    batch_size,
+                    include_archive,
+                    contains,
+                    "id",
+                    descending,
+                    None,
+                )
+                for segment in (dict(filters, **{column: name}) for name in groups[key])
+            ]
+            if len(segments) == 1:
+                yield from segments[0]
+            else:
+                yield from heapq.merge(
+                    *segments, key=lambda row: row[0], reverse=descending
                 )
-                items.append(item)
-        return items
-    
-    def update_item(self, item: Item) -> bool:
+
+    @staticmethod
+    def sort_value(item: Item, sort_by: str) -> Any:
         """
-        Updates an existing item in the database.
-        
+        Returns the value an item is ordered by for a sort key.
+
+        Together with the item's ID this is the keyset cursor needed to resume
+        a sorted :meth:`iter_items` after the item.
+
         Args:
-            item (Item): The Item object containing updated data.
-            
+            item (Item): The item.
+            sort_by (str): One of :data:`SORT_KEYS`.
+
         Returns:
-            bool: True if the update was successful, False if the ID was not found.
+            Any: The item's sort value.
         """
-        if item.id is None:
-            return False
-        
-        with sqlite3.connect(self.db_name) as conn:
+        if sort_by == "date":
+            try:
+                return date_to_day_number(item.date)
+            except ValueError:
+                return 0
+        return getattr(item, sort_by)
+
+    def filter_items(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_archive: bool = False,
+    ) -> List[Item]:
+        """
+        Retrieves items matching exact category/status and an inclusive date range.
+
+        Date bounds are compared on the indexed integer day number column, so
+        range queries never parse the stored date strings.
+
+        Args:
+            category (Optional[str], optional): The exact category. Defaults to None.
+            status (Optional[str], optional): The exact status. Defaults to None.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+            include_archive (bool, optional): Also return archived items.
+                Defaults to False.
+
+        Returns:
+            List[Item]: Matching items ordered by ID.
+
+        Raises:
+            ValueError: If a date bound is not in YYYY-MM-DD format.
+        """
+        conditions, params = self._filter_conditions(
+            category, status, start_date, end_date
+        )
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        source = self._source(include_archive)
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {ITEM_COLUMNS} FROM {source} {where} ORDER BY id", params
+            )
+            rows = cursor.fetchall()
+        return [self._row_to_item(row) for row in rows]
+
+    @staticmethod
+    def _source(include_archive: bool) -> str:
+        """Returns the table expression to select items from."""
+        if not include_archive:
+            return "items"
+        return (
+            f"(SELECT {ITEM_COLUMNS}, date_num FROM items "
+            f"UNION ALL SELECT {ITEM_COLUMNS}, date_num FROM items_archive)"
+        )
+
+    @staticmethod
+    def _trigram_phrase(text: Optional[str]) -> Optional[str]:
+        """
+        Builds the items_fts query matching rows that contain ``text``.
+
+        The trigram tokenizer folds case like ``str.lower`` only for ASCII, so
+        non-ASCII texts fall back to scanning to keep matching exact.
+
+        Returns:
+            Optional[str]: The quoted FTS5 phrase, or None if the index cannot be used.
+        """
+        if text is None or len(text) < 3 or not text.isascii():
+            return None
+        return '"' + text.replace('"', '""') + '"'
+
+    def _filter_conditions(
+        self,
+        category: Optional[str],
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Tuple[List[str], List[Any]]:
+        """Builds the SQL conditions and parameters shared by the filter queries."""
+        conditions = []
+        params: List[Any] = []
+        if category is not None:
+            conditions.append("category_id = ?")
+            params.append(self._code("category", category))
+        if status is not None:
+            conditions.append("status_id = ?")
+            params.append(self._code("status", status))
+        if start_date is not None:
+            conditions.append("date_num >= ?")
+            params.append(date_to_day_number(start_date))
+        if end_date is not None:
+            conditions.append("date_num <= ?")
+            params.append(date_to_day_number(end_date))
+        return conditions, params
+
+    def _code(self, column: str, name: str) -> int:
+        """Returns the code to compare a column with; -1 for unknown names."""
+        code = self._code_tables[column].code(name)
+        return -1 if code is None else code
+
+    def get_recent_items(self, limit: int, status: Optional[str] = None) -> List[Item]:
+        """
+        Retrieves the most recently dated items, newest first.
+
+        The query walks the day number index backwards and stops after
+        ``limit`` rows, so its cost does not grow with the table size.
+
+        Args:
+            limit (int): The maximum number of items to return.
+            status (Optional[str], optional): Only consider this status.
+                Defaults to None.
+
+        Returns:
+            List[Item]: Up to ``limit`` items ordered by date, newest first.
+        """
+        conditions, params = self._filter_conditions(None, status, None, None)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._connect() as conn:
             cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {ITEM_COLUMNS} FROM items {where}
+                ORDER BY date_num DESC, id DESC
+                LIMIT ?
+                """,
+                params + [limit],
+            )
+            rows = cursor.fetchall()
+        return [self._row_to_item(row) for row in rows]
+
+    def fuzzy_candidates(
+        self,
+        text: str,
+        limit: int,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        include_archive: bool = False,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[Item]:
+        """
+        Retrieves the items whose name or location share the most trigrams
+        with ``text``.
+
+        The trigram index is queried for rows containing any of the text's
+        trigrams, ranked by BM25, so items close to a misspelt query are found
+        without comparing it against every row. The category, status and date
+        filters are applied before the best ``limit`` rows are taken. The
+        candidates still need to be scored by the caller.
+
+        Args:
+            text (str): The lowercase search text, at least three characters long.
+            limit (int): The maximum number of candidates to rank.
+            category (Optional[str], optional): The exact category. Defaults to None.
+            status (Optional[str], optional): The exact status. Defaults to None.
+            include_archive (bool, optional): Also consider archived items.
+                Defaults to False.
+            start_date (Optional[str], optional): Earliest date (YYYY-MM-DD).
+                Defaults to None.
+            end_date (Optional[str], optional): Latest date (YYYY-MM-DD).
+                Defaults to None.
+
+        Returns:
+            List[Item]: The candidates, best ranked first.
+
+        Raises:
+            ValueError: If a date bound is not in YYYY-MM-DD format.
+        """
+        grams = trigrams(text)
+        if not grams:
+            return []
+        match = "{name location} : (%s)" % " OR ".join(
+            '"' + gram.replace('"', '""') + '"' for gram in grams
+        )
+        conditions, params = self._filter_conditions(
+            category, status, start_date, end_date
+        )
+        where = "".join(f" AND {condition}" for condition in conditions)
+        tables = ("items", "items_archive") if include_archive else ("items",)
+        # The filters run inside each ranked join, before the LIMIT, so the
+        # best ranked rows of other categories cannot crowd out the matches.
+        selects = []
+        for table in tables:
+            columns = ", ".join(
+                f"{table}.{column}" for column in ITEM_COLUMNS.split(", ")
+            )
+            selects.append(f"""
+                SELECT {columns}, items_fts.rank AS rank
+                FROM items_fts JOIN {table} ON {table}.id = items_fts.rowid
+                WHERE items_fts MATCH ?{where}
+            """)
+        ranked = " UNION ALL ".join(selects)
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"{ranked} ORDER BY rank LIMIT ?",
+                [match, *params] * len(tables) + [limit],
+            )
+            rows = cursor.fetchall()
+        return [self._row_to_item(row) for row in rows]
+
+    def archive_claimed_items(self, before_date: str, limit: int) -> int:
+        """
+        Moves up to ``limit`` Claimed items dated before ``before_date`` into
+        the ``items_archive`` table.
+
+        The batch is copied and deleted in one short transaction, found through
+        the (status, date_num) index, so the write lock is only held for the
+        time it takes to move ``limit`` rows. Call repeatedly until it returns
+        0 to archive everything eligible.
+
+        Args:
+            before_date (str): The cutoff date (YYYY-MM-DD), exclusive.
+            limit (int): The maximum number of items to move.
+
+        Returns:
+            int: The number of items archived.
+        """
+        cutoff = date_to_day_number(before_date)
+        claimed = self._code("status", "Claimed")
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 """
-                UPDATE items
-                SET name = ?, category = ?, date = ?, location = ?, status = ?, contact_info = ?
-                WHERE id = ?
+                SELECT id FROM items
+                WHERE status_id = ? AND date_num < ?
+                LIMIT ?
                 """,
-                (
-                    item.name,
-                    item.category,
-                    item.date,
-                    item.location,
-                    item.status,
-                    item.contact_info,
-                    item.id
+                (claimed, cutoff, limit),
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                return 0
+            # Delete first so the trigram index entries move along with the
+            # rows instead of being briefly duplicated.
+            placeholders = ", ".join("?" * len(ids))
+            cursor.execute(
+                f"DELETE FROM items WHERE id IN ({placeholders}) "
+                f"RETURNING {ITEM_COLUMNS}, date_num",
+                ids,
+            )
+            rows = cursor.fetchall()
+            cursor.executemany(
+                f"INSERT INTO items_archive ({ITEM_COLUMNS}, date_num) "
+                f"VALUES ({', '.join('?' * 9)})",
+                rows,
+            )
+        return len(rows)
+
+    def stats(self) -> ItemStats:
+        """
+        Computes item counts by status, category and day.
+
+        The counts are read from the ``item_stats`` summary table, which
+        triggers keep up to date on every write, so the cost depends on the
+        number of distinct groups rather than the number of items. Archived
+        items are included.
+
+        Returns:
+            ItemStats: The aggregated counts.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT status, SUM(count) FROM item_stats GROUP BY status")
+            by_status = dict(cursor.fetchall())
+            cursor.execute(
+                "SELECT category, SUM(count) FROM item_stats GROUP BY category"
+            )
+            by_category = dict(cursor.fetchall())
+            cursor.execute("""
+                SELECT date_num, SUM(count) FROM item_stats
+                WHERE date_num > 0
+                GROUP BY date_num
+                ORDER BY date_num
+                """)
+            by_day = {
+                day_number_to_date(day): count for day, count in cursor.fetchall()
+            }
+        return ItemStats(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_category=by_category,
+            by_day=by_day,
+        )
+
+    def data_version(self) -> int:
+        """
+        Returns the current data version of the items table.
+
+        The version is a counter that triggers increment on every insert,
+        update and delete, so it only ever grows and changes whenever the
+        stored items change.
+
+        Returns:
+            int: The current data version.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT version FROM data_version WHERE id = 1")
+            return cursor.fetchone()[0]
+
+    def change_cursor(self) -> int:
+        """
+        Returns the sequence number of the latest logged change.
+
+        Pass it to :meth:`changes_since` after loading every item to receive
+        only the changes made from then on.
+
+        Returns:
+            int: The latest sequence number, or 0 if nothing was ever logged.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'item_changes'"
+            )
+            row = cursor.fetchone()
+        return row[0] if row else 0
+
+    def changes_since(self, since_seq: int, limit: int = FETCH_BATCH_SIZE) -> ChangeSet:
+        """
+        Retrieves the items changed after a sync cursor.
+
+        Triggers append the ID of every inserted, updated, deleted or
+        archived item to the ``item_changes`` log. A page of up to ``limit``
+        log entries is read in sequence order and each item in it is
+        returned once, with its current state, so a client applies the
+        deltas without replaying every intermediate write. Archived items
+        are returned with ``archived`` set rather than as deletions. The log and the
+        items are read in one transaction and so agree with each other.
+
+        Args:
+            since_seq (int): The cursor; 0 returns every item ever logged.
+            limit (int, optional): The maximum number of log entries to read.
+                Defaults to FETCH_BATCH_SIZE.
+
+        Returns:
+            ChangeSet: The changes and the cursor for the next call.
+
+        Raises:
+            ChangeLogExpiredError: If entries after ``since_seq`` were pruned.
+        """
+        conn = self._connect()
+        conn.commit()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute("SELECT pruned_seq FROM change_log_state WHERE id = 1")
+            pruned_seq = cursor.fetchone()[0]
+            if since_seq < pruned_seq:
+                raise ChangeLogExpiredError(since_seq, pruned_seq)
+            cursor.execute(
+                "SELECT seq, item_id FROM item_changes "
+                "WHERE seq > ? ORDER BY seq LIMIT ?",
+                (since_seq, limit),
+            )
+            entries = cursor.fetchall()
+            latest = dict((item_id, seq) for seq, item_id in entries)
+            found: Dict[str, Dict[int, Item]] = {}
+            missing = list(latest)
+            for table in ("items", "items_archive"):
+                found[table] = {}
+                for start in range(0, len(missing), FETCH_BATCH_SIZE):
+                    chunk = missing[start : start + FETCH_BATCH_SIZE]
+                    cursor.execute(
+                        f"SELECT {ITEM_COLUMNS} FROM {table} "
+                        f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    for row in cursor.fetchall():
+                        found[table][row[0]] = self._row_to_item(row)
+                missing = [
+                    item_id for item_id in missing if item_id not in found[table]
+                ]
+        finally:
+            conn.commit()
+        changes = []
+        for item_id, seq in latest.items():
+            archived = found["items_archive"].get(item_id)
+            item = found["items"].get(item_id, archived)
+            changes.append(Change(seq, item_id, item, archived is not None))
+        changes.sort(key=lambda change: change.seq)
+        return ChangeSet(
+            changes=changes,
+            next_seq=entries[-1][0] if entries else since_seq,
+            has_more=len(entries) == limit,
+        )
+
+    def compact_changes(self, batch_size: int = BATCH_SIZE) -> int:
+        """
+        Removes change log entries superseded by a later entry for the same item.
+
+        :meth:`changes_since` only reports the latest state of each item, so
+        the superseded entries carry no information and cursors stay valid.
+        The log is compacted ``batch_size`` sequence numbers at a time, each
+        in its own short transaction.
+
+        Args:
+            batch_size (int, optional): Sequence numbers per transaction.
+                Defaults to BATCH_SIZE.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        conn = self._connect()
+        low, high = conn.execute(
+            "SELECT MIN(seq), MAX(seq) FROM item_changes"
+        ).fetchone()
+        conn.commit()
+        removed = 0
+        if low is None:
+            return removed
+        for start in range(low - 1, high, batch_size):
+            with conn:
+                cursor = conn.execute(
+                    """
+                    DELETE FROM item_changes
+                    WHERE seq > ? AND seq <= ?
+                      AND EXISTS (
+                          SELECT 1 FROM item_changes AS newer
+                          WHERE newer.item_id = item_changes.item_id
+                            AND newer.seq > item_changes.seq
+                      )
+                    """,
+                    (start, start + batch_size),
                 )
+                removed += cursor.rowcount
+        return removed
+
+    def prune_changes(self, before_seq: int) -> int:
+        """
+        Deletes the change log entries up to and including ``before_seq``.
+
+        Cursors older than ``before_seq`` expire: :meth:`changes_since`
+        raises :class:`ChangeLogExpiredError` for them instead of silently
+        skipping the pruned changes.
+
+        Args:
+            before_seq (int): The last sequence number to delete.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE change_log_state "
+                "SET pruned_seq = MAX(pruned_seq, ?) WHERE id = 1",
+                (before_seq,),
             )
-            return cursor.rowcount > 0
-    
+            cursor.execute("DELETE FROM item_changes WHERE seq <= ?", (before_seq,))
+            return cursor.rowcount
+
+    def optimize(self) -> None:
+        """Refreshes the query planner statistics where they are out of date."""
+        with self._connect() as conn:
+            conn.execute("PRAGMA optimize")
+
+    def vacuum(self) -> None:
+        """Rebuilds the database file to reclaim free pages and defragment it."""
+        conn = self._connect()
+        conn.commit()
+        conn.execute("VACUUM")
+
+    def checkpoint(self) -> Tuple[int, int]:
+        """
+        Copies the write-ahead log into the database file and truncates it.
+
+        Returns:
+            Tuple[int, int]: The number of WAL frames and of frames checkpointed.
+        """
+        conn = self._connect()
+        conn.commit()
+        _, frames, checkpointed = conn.execute(
+            "PRAGMA wal_checkpoint(TRUNCATE)"
+        ).fetchone()
+        return frames, checkpointed
+
+    def integrity_check(self) -> List[str]:
+        """
+        Runs SQLite's integrity check.
+
+        Returns:
+            List[str]: The problems found; empty if the database is intact.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("PRAGMA integrity_check").fetchall()
+        problems = [row[0] for row in rows]
+        return [] if problems == ["ok"] else problems
+
+    def _row_to_item(self, row: Sequence[Any]) -> Item:
+        """Builds an Item from a row selected with ``ITEM_COLUMNS``, decoding codes."""
+        return Item(
+            id=row[0],
+            name=row[1],
+            category=self._code_tables["category"].name(row[2]),
+            date=row[3],
+            location=row[4],
+            status=self._code_tables["status"].name(row[5]),
+            contact_info=row[6],
+            version=row[7],
+        )
+
+    def update_item(self, item: Item, expected_version: Optional[int] = None) -> bool:
+        """
+        Updates an existing item in the database.
+
+        Every update increments the row's version. When ``expected_version``
+        is given the update only applies if the stored version still matches,
+        which makes concurrent edits fail cleanly instead of silently
+        overwriting each other. The check and the write are a single
+        statement, so no lock is held between reading and saving an item.
+
+        Args:
+            item (Item): The Item object containing updated data.
+            expected_version (Optional[int], optional): The version the changes
+                are based on, usually ``item.version`` as read. Defaults to None,
+                which overwrites unconditionally.
+
+        Returns:
+            bool: True if the update was successful, False if the ID was not found.
+
+        Raises:
+            ConflictError: If the stored version differs from ``expected_version``.
+        """
+        if item.id is None:
+            return False
+
+        with self._connect() as conn:
+            return self._update(conn.cursor(), item, expected_version)
+
     def delete_item(self, item_id: int) -> bool:
         """
         Deletes an item from the database by its ID.
-        
+
         Args:
             item_id (int): The database ID of the item to remove.
-            
+
         Returns:
             bool: True if the deletion was successful, False if the ID was not found.
         """
-        with sqlite3.connect(self.db_name) as conn:
+        with self._connect() as conn:
+            return self._delete(conn.cursor(), item_id)
+
+    def write_batch(self, operations: Sequence[WriteOperation]) -> List[Any]:
+        """
+        Applies a batch of writes in one transaction with a single commit.
+
+        Each operation is a ``(kind, args)`` tuple where ``kind`` is "add",
+        "update" or "delete" and ``args`` are the arguments of the matching
+        :meth:`add_item`, :meth:`update_item` or :meth:`delete_item` call.
+        Every operation runs inside its own savepoint, so one failing
+        operation is rolled back on its own without aborting the others.
+
+        Args:
+            operations (Sequence[WriteOperation]): The writes to apply, in order.
+
+        Returns:
+            List[Any]: One entry per operation: its return value, or the
+            exception it raised.
+        """
+        handlers = {"add": self._insert, "update": self._update, "delete": self._delete}
+        results: List[Any] = []
+        with self._connect() as conn:
             cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            for kind, args in operations:
+                cursor.execute("SAVEPOINT write_op")
+                try:
+                    if kind not in handlers:
+                        raise ValueError(f"Unknown write operation '{kind}'")
+                    results.append(handlers[kind](cursor, *args))
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO write_op")
+                    results.append(e)
+                cursor.execute("RELEASE write_op")
+        return results
+
+    def _write_code(self, cursor: sqlite3.Cursor, column: str, name: str) -> int:
+        """
+        Returns the code of a name within the caller's transaction, adding
+        the name to its lookup table if it is new.
+
+        New codes are not cached because the transaction may still roll back.
+        """
+        code = self._code_tables[column].cached_code(name)
+        if code is None:
+            table = CODED_COLUMNS[column]
+            cursor.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+            cursor.execute(f"SELECT id FROM {table} WHERE name = ?", (name,))
+            code = cursor.fetchone()[0]
+        return code
+
+    def _insert(
+        self, cursor: sqlite3.Cursor, item: Item, allow_duplicates: bool = True
+    ) -> int:
+        """Inserts an item within the caller's transaction and sets its ID."""
+        fingerprint = self._duplicate_hash(item)
+        if not allow_duplicates:
             cursor.execute(
-                "DELETE FROM items WHERE id = ?", 
-                (item_id,)
+                "SELECT id FROM items WHERE duplicate_hash = ? ORDER BY id LIMIT 10",
+                (fingerprint,),
+            )
+            duplicate_ids = [row[0] for row in cursor.fetchall()]
+            if duplicate_ids:
+                raise DuplicateError(item, duplicate_ids)
+        cursor.execute(
+            """
+            INSERT INTO items (
+                name, category_id, date, date_num, location, status_id, contact_info,
+                duplicate_hash
             )
-            return cursor.rowcount > 0
\ No newline at end of file
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                item.name,
+                self._write_code(cursor, "category", item.category),
+                item.date,
+                date_to_day_number(item.date),
+                item.location,
+                self._write_code(cursor, "status", item.status),
+                item.contact_info,
+                fingerprint,
+            ),
+        )
+        new_id = cursor.lastrowid
+        item.id = new_id
+        item.version = 1
+        return new_id if new_id else 0
+
+    def _update(
+        self, cursor: sqlite3.Cursor, item: Item, expected_version: Optional[int] = None
+    ) -> bool:
+        """Updates an item within the caller's transaction; see :meth:`update_item`."""
+        if item.id is None:
+            return False
+        version_check = "AND version = ?" if expected_version is not None else ""
+        params: List[Any] = [
+            item.name,
+            self._write_code(cursor, "category", item.category),
+            item.date,
+            date_to_day_number(item.date),
+            item.location,
+            self._write_code(cursor, "status", item.status),
+            item.contact_info,
+            self._duplicate_hash(item),
+            item.id,
+        ]
+        if expected_version is not None:
+            params.append(expected_version)
+        cursor.execute(
+            f"""
+            UPDATE items
+            SET name = ?, category_id = ?, date = ?, date_num = ?, location = ?,
+                status_id = ?, contact_info = ?, duplicate_hash = ?,
+                version = version + 1
+            WHERE id = ? {version_check}
+            RETURNING version
+            """,
+            params,
+        )
+        rows = cursor.fetchall()
+        if rows:
+            item.version = rows[0][0]
+            return True
+
+        if expected_version is not None:
+            cursor.execute("SELECT version FROM items WHERE id = ?", (item.id,))
+            current = cursor.fetchone()
+            if current is not None:
+                raise ConflictError(item.id, expected_version, current[0])
+        return False
+
+    @staticmethod
+    def _delete(cursor: sqlite3.Cursor, item_id: int) -> bool:
+        """Deletes an item within the caller's transaction."""
+        cursor.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        return cursor.rowcount > 0
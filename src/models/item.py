@@ -1,8 +1,16 @@
 """Domain model Item for the Lost and Found Application."""
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional
+import re
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.utils.dates import DATE_FORMAT
+
+REQUIRED_FIELDS = ("name", "category", "date", "location", "status", "contact_info")
+VALID_STATUSES = frozenset({"Lost", "Found", "Claimed"})
+
+_CANONICAL_DATE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
 
 
 class ValidationError(Exception):
@@ -23,6 +31,8 @@ class Item:
         location (str): Where the item was lost or found.
         status (str): The current status of the item.
         contact_info (str): Contact information of the person reporting.
+        id (Optional[int]): The database ID, or None if not yet stored.
+        version (int): The row version, incremented by every stored update.
     """
 
     name: str
@@ -32,6 +42,7 @@ class Item:
     status: str
     contact_info: str
     id: Optional[int] = field(default=None)
+    version: int = field(default=1)
 
     def __post_init__(self) -> None:
         """Automatically called after initialization to validate attributes."""
@@ -42,7 +53,8 @@ class Item:
         Runs all validation rules against the item's properties.
 
         Raises:
-            ValidationError: If any property is invalid, missing, or improperly formatted.
+            ValidationError: If any property is invalid, missing, or improperly
+                formatted.
         """
         self._validate_required_fields()
         self._validate_date()
@@ -50,31 +62,121 @@ class Item:
 
     def _validate_required_fields(self):
         """Checks that no fields are None or empty strings."""
-        fields_to_check = {
-            "name": self.name,
-            "category": self.category,
-            "date": self.date,
-            "location": self.location,
-            "status": self.status,
-            "contact_info": self.contact_info,
-        }
-
-        for field_name, value in fields_to_check.items():
-            if value is None or (isinstance(value, str) and not value.strip()):
-                raise ValidationError(f"Field '{field_name}' cannot be empty")
+        for field_name in REQUIRED_FIELDS:
+            error = _required_error(field_name, getattr(self, field_name))
+            if error:
+                raise ValidationError(error)
 
     def _validate_date(self) -> None:
         """Checks that the date is in the correct format and not in the future."""
-        try:
-            parsed_date = datetime.strptime(self.date, "%Y-%m-%d").date()
-        except ValueError:
-            raise ValidationError("Date must be in YYYY-MM-DD format")
-        
-        if parsed_date > datetime.now().date():
-            raise ValidationError("Date cannot be in the future")
+        error = _date_error(self.date, date.today())
+        if error:
+            raise ValidationError(error)
 
     def _validate_status(self) -> None:
         """Checks that the status is one of the allowed values."""
-        allowed_statuses = {"Lost", "Found", "Claimed"}
-        if self.status not in allowed_statuses:
+        if self.status not in VALID_STATUSES:
             raise ValidationError("Status must be 'Lost', 'Found', or 'Claimed'")
+
+
+def merge_edits(base: Item, edited: Item, latest: Item) -> Tuple[Item, List[str]]:
+    """
+    Merges one user's edits of an item into its latest stored version.
+
+    Fields the user changed from ``base`` keep the user's value and every
+    other field takes the latest stored value, so concurrent edits of
+    different fields are both kept.
+
+    Args:
+        base (Item): The version the user started editing from.
+        edited (Item): The user's version of the item.
+        latest (Item): The version stored meanwhile.
+
+    Returns:
+        Tuple[Item, List[str]]: The merged item, carrying the ID and version
+        of ``latest``, and the fields both sides changed to different values,
+        where the user's value was kept.
+    """
+    changes = {}
+    conflicts = []
+    for name in REQUIRED_FIELDS:
+        mine = getattr(edited, name)
+        original = getattr(base, name)
+        if mine == original:
+            continue
+        changes[name] = mine
+        theirs = getattr(latest, name)
+        if theirs not in (original, mine):
+            conflicts.append(name)
+    return replace(latest, **changes), conflicts
+
+
+def validate_batch(rows: Iterable[Mapping[str, Any]]) -> Dict[int, str]:
+    """
+    Validates many item records in one pass with the rules of :class:`Item`.
+
+    Today's date is read once for the whole batch and every distinct date
+    string is parsed only once, which makes validating large imports much
+    cheaper than constructing an :class:`Item` per record.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): Records keyed by Item field name;
+            missing keys count as empty fields.
+
+    Returns:
+        Dict[int, str]: The error message of every invalid record, keyed by its
+        position in ``rows``; empty if all records are valid.  Each message is
+        the one ``Item`` would raise, i.e. the first rule the record breaks.
+    """
+    today = date.today()
+    date_errors: Dict[str, Optional[str]] = {}
+    report: Dict[int, str] = {}
+    for index, row in enumerate(rows):
+        error = None
+        for field_name in REQUIRED_FIELDS:
+            error = _required_error(field_name, row.get(field_name))
+            if error:
+                break
+        if error is None:
+            value = row["date"]
+            if not isinstance(value, str):
+                error = _date_error(value, today)
+            elif value in date_errors:
+                error = date_errors[value]
+            else:
+                error = date_errors[value] = _date_error(value, today)
+        if error is None and not (
+            isinstance(row["status"], str) and row["status"] in VALID_STATUSES
+        ):
+            error = "Status must be 'Lost', 'Found', or 'Claimed'"
+        if error:
+            report[index] = error
+    return report
+
+
+def _required_error(field_name: str, value: Any) -> Optional[str]:
+    """Returns the error for a missing or blank required field, if any."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return f"Field '{field_name}' cannot be empty"
+    return None
+
+
+def _date_error(value: Any, today: date) -> Optional[str]:
+    """
+    Returns the error for a date that is malformed or after ``today``, if any.
+
+    Canonical ``YYYY-MM-DD`` strings are parsed with a precompiled pattern;
+    anything else falls back to ``strptime``, which also accepts variants such
+    as single digit months, so both paths accept exactly the same dates.
+    """
+    match = _CANONICAL_DATE.fullmatch(value) if isinstance(value, str) else None
+    try:
+        if match:
+            parsed = date(*map(int, match.groups()))
+        else:
+            parsed = datetime.strptime(value, DATE_FORMAT).date()
+    except (TypeError, ValueError):
+        return "Date must be in YYYY-MM-DD format"
+    if parsed > today:
+        return "Date cannot be in the future"
+    return None
@@ -0,0 +1,239 @@
+"""Suggests which Lost reports and Found items are the same object.
+
+Comparing every Lost item with every Found item does not scale, so the
+:class:`MatchEngine` only compares items that share a block: the same
+category, dates within ``window_days`` of each other and at least one word of
+their names.  Blocks are kept in an inverted index keyed by
+``(category, status, date bucket, name token)``, where buckets are
+``window_days`` wide, so the candidates of an item are found by looking up
+its tokens in its own and the two neighbouring buckets.  Words shared by more
+than ``max_block_size`` items of a block, such as "black" or "phone" in a busy
+fortnight, say little about which items match and would make every item in
+the block a candidate of every other, so such blocks are skipped.
+
+The engine is incremental: adding an item scores it against its candidates
+only, and the best pairs overall are maintained as items come and go.
+"""
+
+import heapq
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.item import Item
+from src.utils.dates import date_to_day_number
+
+MATCH_STATUSES = {"Lost": "Found", "Found": "Lost"}
+"""The status each matchable status is paired with."""
+
+DEFAULT_WINDOW_DAYS = 14
+DEFAULT_MIN_SCORE = 0.4
+DEFAULT_MAX_BLOCK_SIZE = 200
+
+NAME_WEIGHT = 0.55
+DATE_WEIGHT = 0.25
+LOCATION_WEIGHT = 0.2
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+BlockKey = Tuple[str, str, int, str]
+
+
+@dataclass(frozen=True)
+class Match:
+    """
+    A suggested pairing of a Lost report with a Found item.
+
+    Attributes:
+        lost (Item): The Lost item.
+        found (Item): The Found item.
+        score (float): The similarity, from 0 to 1.
+    """
+
+    lost: Item
+    found: Item
+    score: float
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Splits a text into its distinct lowercase words.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        Set[str]: The alphanumeric words, ignoring single characters.
+    """
+    return {token for token in _TOKEN.findall(text.lower()) if len(token) > 1}
+
+
+def _similarity(a: Set[str], b: Set[str]) -> float:
+    """Returns the Jaccard similarity of two token sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MatchEngine:
+    """
+    Incrementally maintained Lost/Found match suggestions.
+
+    Only items with a Lost or Found status and a valid date are indexed;
+    adding anything else (such as a Claimed item) removes it from the engine.
+
+    Attributes:
+        window_days (int): The largest date difference of a match, in days.
+        min_score (float): The lowest score suggested.
+        max_block_size (int): The most items a shared word may occur in and
+            still make them candidates of each other.
+    """
+
+    def __init__(
+        self,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+        min_score: float = DEFAULT_MIN_SCORE,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+    ) -> None:
+        self.window_days = window_days
+        self.min_score = min_score
+        self.max_block_size = max_block_size
+        self._items: Dict[int, Item] = {}
+        self._features: Dict[int, Tuple[int, Set[str], Set[str]]] = {}
+        self._blocks: Dict[BlockKey, Set[int]] = {}
+        self._pairs: Dict[Tuple[int, int], Match] = {}
+        self._pairs_by_item: Dict[int, Set[Tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add_all(self, items: Iterable[Item]) -> None:
+        """Adds many items, e.g. when building the engine from the database."""
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Item) -> List[Match]:
+        """
+        Adds or replaces an item and scores it against its candidates.
+
+        Args:
+            item (Item): A stored item; its ID identifies it in the engine.
+
+        Returns:
+            List[Match]: The new item's matches, best first.
+        """
+        self.remove(item.id)
+        if item.status not in MATCH_STATUSES:
+            return []
+        try:
+            day = date_to_day_number(item.date)
+        except ValueError:
+            return []
+
+        name_tokens = tokenize(item.name)
+        features = (day, name_tokens, tokenize(item.location))
+        matches = []
+        for other_id in self._candidates(item, day, name_tokens):
+            match = self._score(item, features, other_id)
+            if match is not None:
+                matches.append(match)
+
+        self._items[item.id] = item
+        self._features[item.id] = features
+        for key in self._block_keys(item.category, item.status, day, name_tokens):
+            self._blocks.setdefault(key, set()).add(item.id)
+        for match in matches:
+            pair = (match.lost.id, match.found.id)
+            self._pairs[pair] = match
+            for item_id in pair:
+                self._pairs_by_item.setdefault(item_id, set()).add(pair)
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches
+
+    def remove(self, item_id: Optional[int]) -> None:
+        """Removes an item and its matches; unknown IDs are ignored."""
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return
+        day, name_tokens, _ = self._features.pop(item_id)
+        for key in self._block_keys(item.category, item.status, day, name_tokens):
+            block = self._blocks[key]
+            block.discard(item_id)
+            if not block:
+                del self._blocks[key]
+        for pair in self._pairs_by_item.pop(item_id, set()):
+            del self._pairs[pair]
+            other = pair[1] if pair[0] == item_id else pair[0]
+            self._pairs_by_item[other].discard(pair)
+
+    def matches_for(self, item_id: int, limit: int = 10) -> List[Match]:
+        """
+        Returns the best matches of one indexed item.
+
+        Args:
+            item_id (int): The item's ID.
+            limit (int, optional): The maximum number of matches. Defaults to 10.
+
+        Returns:
+            List[Match]: The matches, best first; empty for unknown items.
+        """
+        pairs = self._pairs_by_item.get(item_id, ())
+        return heapq.nlargest(
+            limit, (self._pairs[p] for p in pairs), key=lambda m: m.score
+        )
+
+    def best_matches(self, limit: int = 50) -> List[Match]:
+        """
+        Returns the best suggested pairs overall.
+
+        Args:
+            limit (int, optional): The maximum number of pairs. Defaults to 50.
+
+        Returns:
+            List[Match]: The pairs, best first.
+        """
+        return heapq.nlargest(limit, self._pairs.values(), key=lambda m: m.score)
+
+    def _block_keys(
+        self, category: str, status: str, day: int, tokens: Set[str]
+    ) -> List[BlockKey]:
+        bucket = day // max(self.window_days, 1)
+        return [(category, status, bucket, token) for token in tokens]
+
+    def _candidates(self, item: Item, day: int, tokens: Set[str]) -> Set[int]:
+        """
+        Collects the IDs in the item's opposite-status blocks around its date.
+
+        Blocks larger than ``max_block_size`` are skipped; the item's rarer
+        words still find its candidates.
+        """
+        opposite = MATCH_STATUSES[item.status]
+        bucket = day // max(self.window_days, 1)
+        candidates: Set[int] = set()
+        for offset in (-1, 0, 1):
+            for token in tokens:
+                block = self._blocks.get(
+                    (item.category, opposite, bucket + offset, token)
+                )
+                if block and len(block) <= self.max_block_size:
+                    candidates |= block
+        return candidates
+
+    def _score(
+        self, item: Item, features: Tuple[int, Set[str], Set[str]], other_id: int
+    ) -> Optional[Match]:
+        day, name_tokens, location_tokens = features
+        other_day, other_name, other_location = self._features[other_id]
+        distance = abs(day - other_day)
+        if distance > self.window_days:
+            return None
+        score = (
+            NAME_WEIGHT * _similarity(name_tokens, other_name)
+            + DATE_WEIGHT * (1 - distance / (self.window_days + 1))
+            + LOCATION_WEIGHT * _similarity(location_tokens, other_location)
+        )
+        if score < self.min_score:
+            return None
+        other = self._items[other_id]
+        lost, found = (item, other) if item.status == "Lost" else (other, item)
+        return Match(lost, found, round(score, 3))
@@ -0,0 +1,862 @@
+"""Versioned schema migrations for the Lost and Found database.
+
+The schema version is stored in SQLite's ``PRAGMA user_version``.  Each
+:class:`Migration` upgrades the schema by exactly one version and the
+migrations are applied in order whenever a database is opened, so an existing
+``lost_and_found.db`` is brought up to date transparently.
+
+Migrations that rewrite existing rows do so in batches of ``batch_size`` rows,
+committing after each batch.  This keeps every write transaction short on
+large tables, and because each step is idempotent an interrupted migration
+simply resumes where it stopped the next time the database is opened.
+
+Only one process migrates a database at a time: the first to open an
+outdated file claims the ``schema_lock`` row and the others wait for it to
+finish (see :func:`migrate`).
+"""
+
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Sequence, Tuple
+
+from src.utils.dates import date_to_day_number
+from src.utils.dedupe import duplicate_hash
+
+BATCH_SIZE = 5000
+MIGRATION_LOCK_TIMEOUT = 600.0
+"""Seconds without progress after which another process takes over a migration."""
+MIGRATION_LOCK_POLL = 0.1
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    A single schema upgrade step.
+
+    Attributes:
+        version (int): The schema version reached once the step is applied.
+        description (str): A short human readable summary of the change.
+        apply (Callable): Function performing the upgrade; it receives the
+            open connection and the batch size to use for row rewrites.
+    """
+
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection, int], None]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Returns the schema version recorded in the database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _set_schema_version(conn: sqlite3.Connection, version: int) -> None:
+    """Records the schema version in the database header."""
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """Checks whether a table already has the given column."""
+    rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    return any(row[1] == column for row in rows)
+
+
+def iter_id_batches(
+    conn: sqlite3.Connection, table: str, batch_size: int, where: str = "1"
+) -> Iterator[Tuple[int, int]]:
+    """
+    Walks a table in primary key order, yielding half-open id ranges.
+
+    Each yielded ``(low, high)`` pair covers at most ``batch_size`` rows
+    matching ``where`` with ``low < id <= high``.  Ranges are computed with an
+    index seek on the primary key, so every step costs the same regardless of
+    how far into the table it is.  Every batch also refreshes the migration
+    lock, so a long backfill is not mistaken for an abandoned one.
+
+    Args:
+        conn (sqlite3.Connection): The open database connection.
+        table (str): The table to walk.
+        batch_size (int): The maximum number of rows per range.
+        where (str, optional): Extra SQL condition rows must satisfy.
+
+    Yields:
+        Tuple[int, int]: The exclusive lower and inclusive upper id bound.
+    """
+    low = 0
+    while True:
+        high = conn.execute(
+            f"""
+            SELECT MAX(id) FROM (
+                SELECT id FROM {table}
+                WHERE id > ? AND ({where})
+                ORDER BY id
+                LIMIT ?
+            )
+            """,
+            (low, batch_size),
+        ).fetchone()[0]
+        if high is None:
+            return
+        _refresh_migration_lock(conn)
+        yield low, high
+        low = high
+
+
+def _rebuild_without_columns(
+    conn: sqlite3.Connection, table: str, columns: Sequence[str], batch_size: int
+) -> None:
+    """
+    Rebuilds a table without some of its columns, copying rows in batches.
+
+    ``ALTER TABLE ... DROP COLUMN`` rewrites the whole table in a single
+    transaction.  Instead the remaining columns are copied into
+    ``<table>_rebuild`` one committed batch at a time, resuming after the last
+    copied ID if interrupted, and the copy then replaces the table in one
+    short transaction that also recreates the table's indexes and triggers.
+    Indexes and triggers naming the dropped columns must be dropped first.
+    """
+    info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    if not any(row[1] in columns for row in info):
+        return
+    rebuild = f"{table}_rebuild"
+    table_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()[0]
+    autoincrement = "AUTOINCREMENT" in table_sql.upper()
+    kept = [row for row in info if row[1] not in columns]
+    definitions = []
+    for _, name, column_type, not_null, default, primary_key in kept:
+        definition = f"{name} {column_type}"
+        if primary_key:
+            definition += " PRIMARY KEY" + (" AUTOINCREMENT" if autoincrement else "")
+        if not_null:
+            definition += " NOT NULL"
+        if default is not None:
+            definition += f" DEFAULT {default}"
+        definitions.append(definition)
+    names = ", ".join(row[1] for row in kept)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {rebuild} ({', '.join(definitions)})")
+    conn.commit()
+
+    copied = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {rebuild}").fetchone()[0]
+    for low, high in iter_id_batches(conn, table, batch_size, f"id > {int(copied)}"):
+        conn.execute(
+            f"INSERT INTO {rebuild} ({names}) SELECT {names} FROM {table} "
+            "WHERE id > ? AND id <= ?",
+            (low, high),
+        )
+        conn.commit()
+
+    schema = conn.execute(
+        "SELECT sql FROM sqlite_master "
+        "WHERE type IN ('index', 'trigger') AND tbl_name = ? AND sql IS NOT NULL",
+        (table,),
+    ).fetchall()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        sequence = 0
+        if autoincrement:
+            sequence = conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM sqlite_sequence "
+                "WHERE name IN (?, ?)",
+                (table, rebuild),
+            ).fetchone()[0]
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {rebuild} RENAME TO {table}")
+        if autoincrement:
+            # Keeps IDs of deleted items from being handed out again.
+            conn.execute(
+                "DELETE FROM sqlite_sequence WHERE name IN (?, ?)", (table, rebuild)
+            )
+            conn.execute(
+                "INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)",
+                (table, sequence),
+            )
+        for (statement,) in schema:
+            conn.execute(statement)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def _create_items_table(conn: sqlite3.Connection, batch_size: int) -> None:
+    """Creates the original items table (no-op for pre-migration databases)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            date TEXT NOT NULL,
+            location TEXT NOT NULL,
+            status TEXT NOT NULL,
+            contact_info TEXT NOT NULL
+        )
+        """)
+
+
+def _add_date_num_column(conn: sqlite3.Connection, batch_size: int) -> None:
+    """Adds the indexed integer day number column and backfills it."""
+    if not _column_exists(conn, "items", "date_num"):
+        conn.execute("ALTER TABLE items ADD COLUMN date_num INTEGER")
+        conn.commit()
+
+    for low, high in iter_id_batches(conn, "items", batch_size, "date_num IS NULL"):
+        rows = conn.execute(
+            "SELECT id, date FROM items WHERE id > ? AND id <= ? AND date_num IS NULL",
+            (low, high),
+        ).fetchall()
+        updates = []
+        for item_id, value in rows:
+            try:
+                updates.append((date_to_day_number(value), item_id))
+            except (TypeError, ValueError):
+                # Leave unparseable legacy dates NULL; they sort before all
+                # valid dates and never match a date range.
+                continue
+        conn.executemany("UPDATE items SET date_num = ? WHERE id = ?", updates)
+        conn.commit()
+
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_items_date_num ON items (date_num)")
+
+
+def _create_item_stats(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Creates the item_stats summary table and the triggers maintaining it.
+
+    The table holds one count per (status, category, day) group, so aggregate
+    statistics are read from a handful of summary rows instead of scanning
+    items.  Undated legacy rows are counted under day number 0.  The table is
+    rebuilt from scratch in batches before the triggers are installed, which
+    keeps the step safe to re-run after an interruption.
+    """
+    conn.execute("DROP TABLE IF EXISTS item_stats")
+    conn.execute("""
+        CREATE TABLE item_stats (
+            status TEXT NOT NULL,
+            category TEXT NOT NULL,
+            date_num INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (status, category, date_num)
+        ) WITHOUT ROWID
+        """)
+    conn.commit()
+
+    for low, high in iter_id_batches(conn, "items", batch_size):
+        conn.execute(
+            """
+            INSERT INTO item_stats (status, category, date_num, count)
+            SELECT status, category, COALESCE(date_num, 0), COUNT(*)
+            FROM items
+            WHERE id > ? AND id <= ?
+            GROUP BY status, category, COALESCE(date_num, 0)
+            ON CONFLICT (status, category, date_num)
+            DO UPDATE SET count = count + excluded.count
+            """,
+            (low, high),
+        )
+        conn.commit()
+
+    conn.executescript("""
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_insert
+        AFTER INSERT ON items
+        BEGIN
+            INSERT INTO item_stats (status, category, date_num, count)
+            VALUES (NEW.status, NEW.category, COALESCE(NEW.date_num, 0), 1)
+            ON CONFLICT (status, category, date_num)
+            DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_delete
+        AFTER DELETE ON items
+        BEGIN
+            UPDATE item_stats SET count = count - 1
+            WHERE status = OLD.status AND category = OLD.category
+            AND date_num = COALESCE(OLD.date_num, 0);
+            DELETE FROM item_stats
+            WHERE status = OLD.status AND category = OLD.category
+            AND date_num = COALESCE(OLD.date_num, 0) AND count <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_update
+        AFTER UPDATE OF status, category, date_num ON items
+        BEGIN
+            UPDATE item_stats SET count = count - 1
+            WHERE status = OLD.status AND category = OLD.category
+            AND date_num = COALESCE(OLD.date_num, 0);
+            DELETE FROM item_stats
+            WHERE status = OLD.status AND category = OLD.category
+            AND date_num = COALESCE(OLD.date_num, 0) AND count <= 0;
+            INSERT INTO item_stats (status, category, date_num, count)
+            VALUES (NEW.status, NEW.category, COALESCE(NEW.date_num, 0), 1)
+            ON CONFLICT (status, category, date_num)
+            DO UPDATE SET count = count + 1;
+        END;
+        """)
+
+
+def _create_data_version(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Creates the single-row data_version counter and the triggers bumping it.
+
+    Every row inserted, updated or deleted in items increments the counter in
+    the same transaction, so readers can tell whether anything changed since
+    they last looked with a single primary key lookup.
+    """
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
+
+        CREATE TRIGGER IF NOT EXISTS trg_data_version_insert
+        AFTER INSERT ON items
+        BEGIN
+            UPDATE data_version SET version = version + 1 WHERE id = 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_data_version_update
+        AFTER UPDATE ON items
+        BEGIN
+            UPDATE data_version SET version = version + 1 WHERE id = 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_data_version_delete
+        AFTER DELETE ON items
+        BEGIN
+            UPDATE data_version SET version = version + 1 WHERE id = 1;
+        END;
+        """)
+
+
+def _add_version_column(conn: sqlite3.Connection, batch_size: int) -> None:
+    """Adds the row version column used for optimistic concurrency control."""
+    if not _column_exists(conn, "items", "version"):
+        # A constant default is stored in the schema, not in each row, so this
+        # is instant regardless of the table size.
+        conn.execute("ALTER TABLE items ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+
+
+def _create_items_archive(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Creates the items_archive table for cold, long-claimed items.
+
+    Archived rows keep their original IDs, which AUTOINCREMENT never reuses,
+    and stay counted in item_stats.  The (status, date_num) index on items
+    lets the archiver find old claimed rows without scanning the table.
+    """
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS items_archive (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            date TEXT NOT NULL,
+            date_num INTEGER,
+            location TEXT NOT NULL,
+            status TEXT NOT NULL,
+            contact_info TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 1,
+            archived_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_items_status_date_num
+        ON items (status, date_num);
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_archive_insert
+        AFTER INSERT ON items_archive
+        BEGIN
+            INSERT INTO item_stats (status, category, date_num, count)
+            VALUES (NEW.status, NEW.category, COALESCE(NEW.date_num, 0), 1)
+            ON CONFLICT (status, category, date_num)
+            DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_archive_delete
+        AFTER DELETE ON items_archive
+        BEGIN
+            UPDATE item_stats SET count = count - 1
+            WHERE status = OLD.status AND category = OLD.category
+            AND date_num = COALESCE(OLD.date_num, 0);
+            DELETE FROM item_stats
+            WHERE status = OLD.status AND category = OLD.category
+            AND date_num = COALESCE(OLD.date_num, 0) AND count <= 0;
+        END;
+        """)
+
+
+def _create_trigram_index(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Creates the items_fts trigram index over name, location and contact_info.
+
+    ``items_fts`` is a contentless FTS5 table using the trigram tokenizer,
+    keyed by item ID and covering both live and archived items.  A quoted
+    phrase of three or more characters matches exactly the rows containing
+    it as a case-insensitive substring, so "contains" searches intersect
+    trigram posting lists instead of scanning every row.  The index is
+    rebuilt in batches before the triggers maintaining it are installed.
+    """
+    conn.execute("DROP TABLE IF EXISTS items_fts")
+    conn.execute("""
+        CREATE VIRTUAL TABLE items_fts USING fts5 (
+            name, location, contact_info, content='', tokenize='trigram'
+        )
+        """)
+    conn.commit()
+
+    for table in ("items", "items_archive"):
+        for low, high in iter_id_batches(conn, table, batch_size):
+            conn.execute(
+                f"""
+                INSERT INTO items_fts (rowid, name, location, contact_info)
+                SELECT id, name, location, contact_info FROM {table}
+                WHERE id > ? AND id <= ?
+                """,
+                (low, high),
+            )
+            conn.commit()
+
+    insert = """
+        INSERT INTO items_fts (rowid, name, location, contact_info)
+        VALUES (NEW.id, NEW.name, NEW.location, NEW.contact_info);
+    """
+    delete = """
+        INSERT INTO items_fts (items_fts, rowid, name, location, contact_info)
+        VALUES ('delete', OLD.id, OLD.name, OLD.location, OLD.contact_info);
+    """
+    conn.executescript(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_items_fts_insert
+        AFTER INSERT ON items
+        BEGIN {insert} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_items_fts_delete
+        AFTER DELETE ON items
+        BEGIN {delete} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_items_fts_update
+        AFTER UPDATE OF name, location, contact_info ON items
+        BEGIN {delete} {insert} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_items_fts_archive_insert
+        AFTER INSERT ON items_archive
+        BEGIN {insert} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_items_fts_archive_delete
+        AFTER DELETE ON items_archive
+        BEGIN {delete} END;
+        """)
+
+
+def _create_sort_indexes(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Creates the indexes backing sorted, keyset-paginated item listings.
+
+    There is one index per sort expression used by
+    :meth:`DatabaseManager.iter_items`; SQLite appends the rowid to every
+    index entry, so each one is already ordered by ``(sort value, id)``.  The
+    composite status and category indexes serve the common "filter by one,
+    newest first" listings.
+    """
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_items_sort_name
+        ON items (name COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_items_sort_category ON items (category);
+        CREATE INDEX IF NOT EXISTS idx_items_sort_date
+        ON items (COALESCE(date_num, 0));
+        CREATE INDEX IF NOT EXISTS idx_items_sort_location
+        ON items (location COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_items_sort_status ON items (status);
+        CREATE INDEX IF NOT EXISTS idx_items_sort_contact_info
+        ON items (contact_info COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_items_status_sort_date
+        ON items (status, COALESCE(date_num, 0));
+        CREATE INDEX IF NOT EXISTS idx_items_category_sort_date
+        ON items (category, COALESCE(date_num, 0));
+        """)
+
+
+CODED_COLUMNS = {"category": "categories", "status": "statuses"}
+"""Dictionary-encoded item columns and the lookup tables holding their names."""
+
+STATUS_NAMES = ("Lost", "Found", "Claimed")
+
+_OLD_STATS_GROUP = """
+    status = (SELECT name FROM statuses WHERE id = OLD.status_id)
+    AND category = (SELECT name FROM categories WHERE id = OLD.category_id)
+    AND date_num = COALESCE(OLD.date_num, 0)
+"""
+
+_STATS_DELETE = f"""
+    UPDATE item_stats SET count = count - 1 WHERE {_OLD_STATS_GROUP};
+    DELETE FROM item_stats WHERE {_OLD_STATS_GROUP} AND count <= 0;
+"""
+
+_STATS_INSERT = """
+    INSERT INTO item_stats (status, category, date_num, count)
+    VALUES (
+        (SELECT name FROM statuses WHERE id = NEW.status_id),
+        (SELECT name FROM categories WHERE id = NEW.category_id),
+        COALESCE(NEW.date_num, 0),
+        1
+    )
+    ON CONFLICT (status, category, date_num)
+    DO UPDATE SET count = count + 1;
+"""
+
+
+def _encode_category_and_status(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Replaces the free text category and status columns with integer codes.
+
+    The names move to the ``categories`` and ``statuses`` lookup tables and
+    items and items_archive store their ``category_id`` and ``status_id``
+    instead, which shrinks every row and turns filters into integer
+    comparisons.  The codes are backfilled in batches, then each table is
+    rebuilt without the text columns, also in batches (see
+    :func:`_rebuild_without_columns`).  item_stats stays keyed by name, its
+    triggers decode the codes.
+    """
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS statuses (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        """)
+    conn.executemany(
+        "INSERT OR IGNORE INTO statuses (name) VALUES (?)",
+        [(name,) for name in STATUS_NAMES],
+    )
+    conn.commit()
+
+    for table in ("items", "items_archive"):
+        if not _column_exists(conn, table, "category"):
+            continue
+        for column, lookup in CODED_COLUMNS.items():
+            if not _column_exists(conn, table, f"{column}_id"):
+                # Codes start at 1, so 0 marks rows not backfilled yet.
+                conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {column}_id "
+                    "INTEGER NOT NULL DEFAULT 0"
+                )
+            conn.execute(
+                f"INSERT OR IGNORE INTO {lookup} (name) "
+                f"SELECT DISTINCT {column} FROM {table} ORDER BY {column}"
+            )
+            conn.commit()
+        for low, high in iter_id_batches(
+            conn, table, batch_size, "category_id = 0 OR status_id = 0"
+        ):
+            conn.execute(
+                f"""
+                UPDATE {table} SET
+                    category_id = (SELECT id FROM categories WHERE name = category),
+                    status_id = (SELECT id FROM statuses WHERE name = status)
+                WHERE id > ? AND id <= ?
+                """,
+                (low, high),
+            )
+            conn.commit()
+
+    # Indexes and triggers naming the text columns cannot move to the rebuilt
+    # tables; they are recreated on the codes below.
+    conn.executescript("""
+        DROP TRIGGER IF EXISTS trg_item_stats_insert;
+        DROP TRIGGER IF EXISTS trg_item_stats_delete;
+        DROP TRIGGER IF EXISTS trg_item_stats_update;
+        DROP TRIGGER IF EXISTS trg_item_stats_archive_insert;
+        DROP TRIGGER IF EXISTS trg_item_stats_archive_delete;
+        DROP INDEX IF EXISTS idx_items_status_date_num;
+        DROP INDEX IF EXISTS idx_items_sort_category;
+        DROP INDEX IF EXISTS idx_items_sort_status;
+        DROP INDEX IF EXISTS idx_items_status_sort_date;
+        DROP INDEX IF EXISTS idx_items_category_sort_date;
+        """)
+    for table in ("items", "items_archive"):
+        _rebuild_without_columns(conn, table, list(CODED_COLUMNS), batch_size)
+
+    conn.executescript(f"""
+        CREATE INDEX IF NOT EXISTS idx_items_sort_category ON items (category_id);
+        CREATE INDEX IF NOT EXISTS idx_items_sort_status ON items (status_id);
+        CREATE INDEX IF NOT EXISTS idx_items_category_status
+        ON items (category_id, status_id);
+        CREATE INDEX IF NOT EXISTS idx_items_status_date_num
+        ON items (status_id, date_num);
+        CREATE INDEX IF NOT EXISTS idx_items_status_sort_date
+        ON items (status_id, COALESCE(date_num, 0));
+        CREATE INDEX IF NOT EXISTS idx_items_category_sort_date
+        ON items (category_id, COALESCE(date_num, 0));
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_insert
+        AFTER INSERT ON items
+        BEGIN {_STATS_INSERT} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_delete
+        AFTER DELETE ON items
+        BEGIN {_STATS_DELETE} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_update
+        AFTER UPDATE OF status_id, category_id, date_num ON items
+        BEGIN {_STATS_DELETE} {_STATS_INSERT} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_archive_insert
+        AFTER INSERT ON items_archive
+        BEGIN {_STATS_INSERT} END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_stats_archive_delete
+        AFTER DELETE ON items_archive
+        BEGIN {_STATS_DELETE} END;
+        """)
+
+
+def _add_duplicate_hash_column(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Adds the indexed duplicate_hash column and backfills it.
+
+    The column holds :func:`~src.utils.dedupe.duplicate_hash` of the item's
+    name, category, date and location, so likely duplicate reports are found
+    with a single index lookup.
+    """
+    if not _column_exists(conn, "items", "duplicate_hash"):
+        conn.execute("ALTER TABLE items ADD COLUMN duplicate_hash INTEGER")
+        conn.commit()
+
+    for low, high in iter_id_batches(
+        conn, "items", batch_size, "duplicate_hash IS NULL"
+    ):
+        rows = conn.execute(
+            """
+            SELECT items.id, items.name, categories.name, items.date, items.location
+            FROM items JOIN categories ON categories.id = items.category_id
+            WHERE items.id > ? AND items.id <= ?
+            """,
+            (low, high),
+        ).fetchall()
+        conn.executemany(
+            "UPDATE items SET duplicate_hash = ? WHERE id = ?",
+            [(duplicate_hash(*row[1:]), row[0]) for row in rows],
+        )
+        conn.commit()
+
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_items_duplicate_hash ON items (duplicate_hash)"
+    )
+
+
+def _create_change_log(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Creates the item_changes log and the triggers appending to it.
+
+    Every insert, update and delete of an item appends its ID under a new
+    AUTOINCREMENT sequence number, which is never reused, even after old
+    entries are pruned.  The log stores no item data: readers join the
+    current row, and a missing row means the item was deleted.  Existing
+    items are logged once in batches before the triggers are installed, so
+    syncing from sequence 0 yields every item.
+    """
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS item_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            item_id INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_item_changes_item_id
+        ON item_changes (item_id, seq);
+
+        CREATE TABLE IF NOT EXISTS change_log_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            pruned_seq INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO change_log_state (id, pruned_seq) VALUES (1, 0);
+        """)
+    logged = conn.execute(
+        "SELECT COALESCE(MAX(item_id), 0) FROM item_changes"
+    ).fetchone()[0]
+    for low, high in iter_id_batches(conn, "items", batch_size, f"id > {int(logged)}"):
+        conn.execute(
+            "INSERT INTO item_changes (item_id) SELECT id FROM items "
+            "WHERE id > ? AND id <= ? ORDER BY id",
+            (low, high),
+        )
+        conn.commit()
+
+    conn.executescript("""
+        CREATE TRIGGER IF NOT EXISTS trg_item_changes_insert
+        AFTER INSERT ON items
+        BEGIN
+            INSERT INTO item_changes (item_id) VALUES (NEW.id);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_changes_update
+        AFTER UPDATE ON items
+        BEGIN
+            INSERT INTO item_changes (item_id) VALUES (NEW.id);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_changes_delete
+        AFTER DELETE ON items
+        BEGIN
+            INSERT INTO item_changes (item_id) VALUES (OLD.id);
+        END;
+        """)
+
+
+def _log_archive_changes(conn: sqlite3.Connection, batch_size: int) -> None:
+    """
+    Extends the item_changes log to the archive.
+
+    Archiving an item logs its deletion from ``items`` and, through the new
+    triggers, its insertion into ``items_archive`` right after, so readers
+    find it archived rather than deleted.  Items archived before the log
+    existed are logged once in batches, so syncing from sequence 0 also
+    yields every archived item.
+    """
+    backfilled = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' "
+        "AND name = 'trg_item_changes_archive_insert'"
+    ).fetchone()
+    if backfilled is None:
+        for low, high in iter_id_batches(conn, "items_archive", batch_size):
+            conn.execute(
+                "INSERT INTO item_changes (item_id) SELECT id FROM items_archive "
+                "WHERE id > ? AND id <= ? ORDER BY id",
+                (low, high),
+            )
+            conn.commit()
+
+    conn.executescript("""
+        CREATE TRIGGER IF NOT EXISTS trg_item_changes_archive_insert
+        AFTER INSERT ON items_archive
+        BEGIN
+            INSERT INTO item_changes (item_id) VALUES (NEW.id);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_changes_archive_update
+        AFTER UPDATE ON items_archive
+        BEGIN
+            INSERT INTO item_changes (item_id) VALUES (NEW.id);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_item_changes_archive_delete
+        AFTER DELETE ON items_archive
+        BEGIN
+            INSERT INTO item_changes (item_id) VALUES (OLD.id);
+        END;
+        """)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Create the items table", _create_items_table),
+    Migration(2, "Add indexed integer day number column", _add_date_num_column),
+    Migration(3, "Add item_stats summary table", _create_item_stats),
+    Migration(4, "Add data_version change counter", _create_data_version),
+    Migration(5, "Add row version column", _add_version_column),
+    Migration(6, "Add items_archive table", _create_items_archive),
+    Migration(7, "Add trigram substring index", _create_trigram_index),
+    Migration(8, "Add sort indexes", _create_sort_indexes),
+    Migration(9, "Dictionary-encode category and status", _encode_category_and_status),
+    Migration(10, "Add duplicate report hash column", _add_duplicate_hash_column),
+    Migration(11, "Add item change log", _create_change_log),
+    Migration(12, "Log archived item changes", _log_archive_changes),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def migrate(conn: sqlite3.Connection, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Applies every pending migration to the database, in order.
+
+    Several processes may open an outdated database at once, e.g. the GUI and
+    the API server.  The version is checked under ``BEGIN IMMEDIATE`` and the
+    first process claims the ``schema_lock`` row in the same transaction; the
+    others wait until the row is released and then find the schema current.
+    A lock whose holder made no progress for MIGRATION_LOCK_TIMEOUT seconds,
+    e.g. because it crashed, is taken over.
+
+    Args:
+        conn (sqlite3.Connection): The open database connection.
+        batch_size (int, optional): Rows rewritten per committed batch.
+
+    Returns:
+        int: The schema version after migrating.
+
+    Raises:
+        RuntimeError: If the database was created by a newer schema version.
+    """
+    token = uuid.uuid4().hex
+    current = _acquire_migration_lock(conn, token)
+    if current == SCHEMA_VERSION:
+        return current
+    try:
+        for migration in MIGRATIONS:
+            if migration.version <= current:
+                continue
+            migration.apply(conn, batch_size)
+            conn.commit()
+            conn.execute("BEGIN IMMEDIATE")
+            _set_schema_version(conn, migration.version)
+            _refresh_migration_lock(conn)
+            conn.commit()
+            current = migration.version
+    finally:
+        conn.rollback()
+        conn.execute("DELETE FROM schema_lock WHERE token = ?", (token,))
+        conn.commit()
+    return current
+
+
+def _acquire_migration_lock(conn: sqlite3.Connection, token: str) -> int:
+    """
+    Waits until the schema is current or this process may migrate it.
+
+    Returns:
+        int: The schema version; below SCHEMA_VERSION only when the lock was
+        claimed under ``token``.
+    """
+    while True:
+        conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = get_schema_version(conn)
+            if current > SCHEMA_VERSION:
+                raise RuntimeError(
+                    f"Database schema version {current} is newer than the "
+                    f"supported version {SCHEMA_VERSION}"
+                )
+            claimed = current == SCHEMA_VERSION
+            if not claimed:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_lock (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        token TEXT NOT NULL,
+                        heartbeat REAL NOT NULL
+                    )
+                    """)
+                row = conn.execute(
+                    "SELECT heartbeat FROM schema_lock WHERE id = 1"
+                ).fetchone()
+                now = time.time()
+                if row is None or now - row[0] > MIGRATION_LOCK_TIMEOUT:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO schema_lock (id, token, heartbeat) "
+                        "VALUES (1, ?, ?)",
+                        (token, now),
+                    )
+                    claimed = True
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        if claimed:
+            return current
+        time.sleep(MIGRATION_LOCK_POLL)
+
+
+def _refresh_migration_lock(conn: sqlite3.Connection) -> None:
+    """Records progress on the migration lock, in the caller's transaction."""
+    conn.execute("UPDATE schema_lock SET heartbeat = ? WHERE id = 1", (time.time(),))
@@ -0,0 +1,130 @@
+"""Search results held as item IDs, with the items fetched lazily.
+
+A :class:`ResultSet` keeps the IDs of every result in an ``array('q')``, 8
+bytes per item, and fetches the results themselves, items together with
+their highlight spans, in small batches only when they are accessed.  The
+most recently used batches are cached, so memory stays bounded however large
+the result is, and scrolling back and forth over a screenful of results does
+not query the database again.
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+from src.models.search import SearchResult
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_CACHED_BATCHES = 8
+
+Fetch = Callable[[Sequence[int]], List[Optional[SearchResult]]]
+"""Fetches results by item ID, in order, with None for IDs no longer found."""
+
+
+class ResultSet:
+    """
+    An ordered list of item IDs whose search results are fetched on demand.
+
+    Items deleted after the IDs were collected are fetched as None and
+    skipped by :meth:`window` and iteration.
+
+    Attributes:
+        ids (array): The IDs of the results, in order.
+        batch_size (int): The number of items fetched at a time.
+        cached_batches (int): The number of batches kept in memory.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[int],
+        fetch: Fetch,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cached_batches: int = DEFAULT_CACHED_BATCHES,
+    ) -> None:
+        self.ids = ids if isinstance(ids, array) else array("q", ids)
+        self.batch_size = batch_size
+        self.cached_batches = cached_batches
+        self._fetch = fetch
+        self._batches: "OrderedDict[int, List[Optional[SearchResult]]]" = OrderedDict()
+
+    @classmethod
+    def from_results(
+        cls, results: Sequence[SearchResult], fetch: Fetch, **kwargs
+    ) -> "ResultSet":
+        """
+        Builds a result set from results already in memory, e.g. ranked ones.
+
+        The first batches are cached from ``results`` rather than fetched.
+
+        Args:
+            results (Sequence[SearchResult]): The results, in order.
+            fetch (Fetch): Fetches results evicted from the cache again.
+            **kwargs: ``batch_size`` and ``cached_batches``.
+
+        Returns:
+            ResultSet: The result set.
+        """
+        result_set = cls((result.item.id for result in results), fetch, **kwargs)
+        size = result_set.batch_size
+        for number in range(min(result_set._batch_count(), result_set.cached_batches)):
+            result_set._store(
+                number, list(results[number * size : (number + 1) * size])
+            )
+        return result_set
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Optional[SearchResult]:
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError("result index out of range")
+        return self._batch(index // self.batch_size)[index % self.batch_size]
+
+    def __iter__(self) -> Iterator[SearchResult]:
+        for number in range(self._batch_count()):
+            yield from (result for result in self._batch(number) if result is not None)
+
+    def window(self, start: int, stop: int) -> List[SearchResult]:
+        """
+        Returns the results at positions ``start`` to ``stop`` (exclusive).
+
+        Args:
+            start (int): The first position.
+            stop (int): The position after the last; clipped to the length.
+
+        Returns:
+            List[SearchResult]: The results whose items are still stored, in order.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self.ids))
+        results: List[SearchResult] = []
+        if start >= stop:
+            return results
+        for number in range(
+            start // self.batch_size, (stop - 1) // self.batch_size + 1
+        ):
+            offset = number * self.batch_size
+            batch = self._batch(number)[max(start - offset, 0) : stop - offset]
+            results.extend(result for result in batch if result is not None)
+        return results
+
+    def _batch_count(self) -> int:
+        return -(-len(self.ids) // self.batch_size)
+
+    def _batch(self, number: int) -> List[Optional[SearchResult]]:
+        batch = self._batches.get(number)
+        if batch is not None:
+            self._batches.move_to_end(number)
+            return batch
+        start = number * self.batch_size
+        batch = self._fetch(self.ids[start : start + self.batch_size])
+        self._store(number, batch)
+        return batch
+
+    def _store(self, number: int, batch: List[Optional[SearchResult]]) -> None:
+        """Caches a batch, evicting the least recently used beyond the limit."""
+        self._batches[number] = batch
+        self._batches.move_to_end(number)
+        while len(self._batches) > self.cached_batches:
+            self._batches.popitem(last=False)
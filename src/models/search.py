@@ -0,0 +1,90 @@
+"""Search results annotated with where the keyword matched."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.models.item import Item
+
+Span = Tuple[int, int]
+
+SEARCH_FIELDS = ("name", "location", "contact_info")
+"""The fields a keyword search matches against."""
+
+HIGHLIGHT_FIELDS = ("name", "category", "location", "status", "contact_info")
+"""The fields whose keyword occurrences are reported for highlighting."""
+
+
+@dataclass
+class SearchResult:
+    """
+    An item returned by a keyword search, with the spans that matched.
+
+    Attributes:
+        item (Item): The matching item.
+        spans (Dict[str, List[Span]]): Half-open ``(start, end)`` offsets of
+            every occurrence of the keyword, keyed by field name.  Fields
+            without an occurrence are omitted, so an empty keyword yields no
+            spans at all.
+    """
+
+    item: Item
+    spans: Dict[str, List[Span]] = field(default_factory=dict)
+
+    @property
+    def matched_fields(self) -> List[str]:
+        """The names of the fields containing the keyword."""
+        return list(self.spans)
+
+
+def find_spans(text_lower: str, keyword_lower: str) -> List[Span]:
+    """
+    Finds every non-overlapping occurrence of a keyword in a text.
+
+    Both arguments must already be lowercased.  Offsets index the lowercased
+    text, which matches the original except for the rare characters whose
+    lowercase form is longer.
+
+    Args:
+        text_lower (str): The text to search.
+        keyword_lower (str): The non-empty keyword.
+
+    Returns:
+        List[Span]: The occurrences, in order.
+    """
+    spans = []
+    start = text_lower.find(keyword_lower)
+    while start != -1:
+        end = start + len(keyword_lower)
+        spans.append((start, end))
+        start = text_lower.find(keyword_lower, end)
+    return spans
+
+
+def match_spans(
+    item: Item,
+    keyword_lower: str,
+    searched: Optional[Dict[str, List[Span]]] = None,
+) -> Dict[str, List[Span]]:
+    """
+    Finds the keyword in every highlighted field of an item.
+
+    Args:
+        item (Item): The item to search.
+        keyword_lower (str): The lowercased, non-empty keyword.
+        searched (Optional[Dict[str, List[Span]]], optional): The spans already
+            found in the SEARCH_FIELDS while verifying the match; those fields
+            are then not scanned again. Defaults to None.
+
+    Returns:
+        Dict[str, List[Span]]: The occurrences by field name; fields without
+        one are omitted.
+    """
+    spans = {}
+    for name in HIGHLIGHT_FIELDS:
+        if searched is not None and name in SEARCH_FIELDS:
+            found = searched.get(name, [])
+        else:
+            found = find_spans(getattr(item, name).lower(), keyword_lower)
+        if found:
+            spans[name] = found
+    return spans
@@ -0,0 +1,23 @@
+"""Aggregate item statistics for the Lost and Found Application."""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class ItemStats:
+    """
+    Item counts grouped by status, category and date.
+
+    Attributes:
+        total (int): The total number of items.
+        by_status (Dict[str, int]): Item counts keyed by status.
+        by_category (Dict[str, int]): Item counts keyed by category.
+        by_day (Dict[str, int]): Item counts keyed by date (YYYY-MM-DD), oldest
+            first. Items without a parseable date are not included.
+    """
+
+    total: int = 0
+    by_status: Dict[str, int] = field(default_factory=dict)
+    by_category: Dict[str, int] = field(default_factory=dict)
+    by_day: Dict[str, int] = field(default_factory=dict)
@@ -0,0 +1,150 @@
+"""Group-commit write queue for concurrent item submissions."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List, Optional, Tuple
+
+from src.models.database import DatabaseManager, WriteOperation
+from src.models.item import Item
+
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_DELAY = 0.0
+
+_Request = Tuple[WriteOperation, "Future[Any]"]
+
+
+class WriteQueue:
+    """
+    Funnels concurrent writes through a single writer thread.
+
+    Callers submit writes from any thread and immediately get a future.  The
+    writer thread collects pending writes into a batch until either
+    ``max_batch_size`` writes are waiting or ``max_delay`` seconds have passed
+    since the first one arrived.  It then applies the whole batch with
+    :meth:`DatabaseManager.write_batch`, i.e. in one transaction with one
+    commit.  Only one connection ever asks for SQLite's write lock, so
+    producers never pile up on it, and the cost of each commit and disk sync
+    is shared by the whole batch.
+
+    With the default ``max_delay`` of zero the writer never waits: a batch is
+    whatever queued up while the previous commit was running.  Batches are
+    then a single write when the load is light and grow on their own as the
+    load rises.  A small positive delay trades latency for larger batches.
+
+    Attributes:
+        db (DatabaseManager): The database receiving the writes.
+        max_batch_size (int): The maximum number of writes per commit.
+        max_delay (float): The longest time, in seconds, a write waits for
+            others to join its batch.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        self.db = db
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._requests: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._writer = threading.Thread(
+            target=self._run, name="lostfound-writer", daemon=True
+        )
+        self._writer.start()
+
+    def __enter__(self) -> "WriteQueue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def submit_add(self, item: Item) -> "Future[int]":
+        """Queues :meth:`DatabaseManager.add_item`; resolves to the new ID."""
+        return self._submit(("add", (item,)))
+
+    def submit_update(
+        self, item: Item, expected_version: Optional[int] = None
+    ) -> "Future[bool]":
+        """
+        Queues :meth:`DatabaseManager.update_item`; resolves to its result.
+
+        A version conflict is delivered as a ConflictError through the future.
+        """
+        return self._submit(("update", (item, expected_version)))
+
+    def submit_delete(self, item_id: int) -> "Future[bool]":
+        """Queues :meth:`DatabaseManager.delete_item`; resolves to its result."""
+        return self._submit(("delete", (item_id,)))
+
+    def close(self) -> None:
+        """Flushes every pending write and stops the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._writer.join()
+
+    def _submit(self, operation: WriteOperation) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WriteQueue is closed")
+            self._requests.put((operation, future))
+        return future
+
+    def _run(self) -> None:
+        """Writer thread main loop: gather a batch, commit it, repeat."""
+        while True:
+            first = self._requests.get()
+            if first is None:
+                return
+            batch, stop = self._gather(first)
+            self._commit(batch)
+            if stop:
+                return
+
+    def _gather(self, first: _Request) -> Tuple[List[_Request], bool]:
+        """Collects requests until the batch is full or the delay expires."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                request = (
+                    self._requests.get(timeout=remaining)
+                    if remaining > 0
+                    else self._requests.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _commit(self, batch: List[_Request]) -> None:
+        """Applies a batch and resolves each caller's future."""
+        live = [
+            (operation, future)
+            for operation, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not live:
+            return
+        try:
+            results = self.db.write_batch([operation for operation, _ in live])
+        except Exception as e:
+            for _, future in live:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(live, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,38 @@
+"""Date helpers shared by the models and the persistence layer."""
+
+from datetime import date, datetime
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def date_to_day_number(value: str) -> int:
+    """
+    Converts a YYYY-MM-DD string into an integer day number.
+
+    The day number is the proleptic Gregorian ordinal of the date, so two
+    dates can be compared, and their distance in days computed, with plain
+    integer arithmetic.
+
+    Args:
+        value (str): The date in YYYY-MM-DD format.
+
+    Returns:
+        int: The ordinal day number of the date.
+
+    Raises:
+        ValueError: If the value is not a valid YYYY-MM-DD date.
+    """
+    return datetime.strptime(value, DATE_FORMAT).date().toordinal()
+
+
+def day_number_to_date(day_number: int) -> str:
+    """
+    Converts an integer day number back into a YYYY-MM-DD string.
+
+    Args:
+        day_number (int): The ordinal day number.
+
+    Returns:
+        str: The date in YYYY-MM-DD format.
+    """
+    return date.fromordinal(day_number).strftime(DATE_FORMAT)
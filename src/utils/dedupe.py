@@ -0,0 +1,48 @@
+"""Normalised fingerprints for spotting duplicate item reports."""
+
+import hashlib
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalises free text so trivially different spellings compare equal.
+
+    Case, punctuation and runs of whitespace are ignored, so
+    ``"Blue  umbrella!"`` and ``"blue umbrella"`` normalise identically.
+
+    Args:
+        text (str): The text to normalise.
+
+    Returns:
+        str: The casefolded words of the text separated by single spaces.
+    """
+    return " ".join(_WORD.findall(text.casefold()))
+
+
+def duplicate_hash(name: str, category: str, date: str, location: str) -> int:
+    """
+    Computes the fingerprint shared by reports of the same item.
+
+    Args:
+        name (str): The item name.
+        category (str): The item category.
+        date (str): The date (YYYY-MM-DD).
+        location (str): Where the item was lost or found.
+
+    Returns:
+        int: A signed 64-bit hash of the normalised fields, which fits an
+        SQLite INTEGER column.
+    """
+    key = "\x1f".join(
+        (
+            normalize_text(name),
+            normalize_text(category),
+            date.strip(),
+            normalize_text(location),
+        )
+    )
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -0,0 +1,85 @@
+"""Approximate string matching helpers for typo-tolerant search."""
+
+from typing import List, Optional
+
+
+def trigrams(text: str) -> List[str]:
+    """
+    Returns the distinct three-character substrings of a text, in order.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        List[str]: The trigrams; empty if the text is shorter than three characters.
+    """
+    return list(dict.fromkeys(text[i : i + 3] for i in range(len(text) - 2)))
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Computes the Levenshtein distance between two strings.
+
+    With ``max_distance`` the computation stops as soon as the distance is
+    known to exceed it, which makes rejecting poor candidates cheap.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+        max_distance (Optional[int], optional): The largest distance of
+            interest. Defaults to None, which computes the exact distance.
+
+    Returns:
+        int: The edit distance, or ``max_distance + 1`` if it is larger than
+        ``max_distance``.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    limit = max_distance if max_distance is not None else len(a)
+    if len(a) - len(b) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def best_word_distance(
+    query: str, text: str, max_distance: Optional[int] = None
+) -> int:
+    """
+    Returns the smallest edit distance between a query and any run of words
+    in a text with the same number of words as the query.
+
+    A query contained in the text matches with distance 0, so exact
+    substring matches always rank before fuzzy ones.
+
+    Args:
+        query (str): The lowercase query.
+        text (str): The lowercase text to search.
+        max_distance (Optional[int], optional): See :func:`edit_distance`.
+
+    Returns:
+        int: The smallest distance found.
+    """
+    if query in text:
+        return 0
+    words = text.split()
+    size = max(len(query.split()), 1)
+    best = edit_distance(query, text, max_distance)
+    for start in range(max(len(words) - size + 1, 0)):
+        window = " ".join(words[start : start + size])
+        best = min(best, edit_distance(query, window, max_distance))
+    return best
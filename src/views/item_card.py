@@ -1,8 +1,9 @@
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import customtkinter as ctk
 
 from src.models.item import Item
+from src.models.search import Span
 from src.utils.theme import ThemeColors
 
 
@@ -12,7 +13,7 @@ class ItemCard(ctk.CTkFrame):
         self,
         master: Any,
         item: Item,
-        search_term: str,
+        spans: Optional[Dict[str, List[Span]]],
         edit_callback: Callable,
         delete_callback: Callable,
         selection_callback: Callable,
@@ -20,7 +21,7 @@ class ItemCard(ctk.CTkFrame):
     ) -> None:
         super().__init__(master, **kwargs)
         self.item = item
-        self.search_term = search_term.lower().strip()
+        self.spans = spans or {}
         self.edit_callback = edit_callback
         self.delete_callback = delete_callback
         self.selection_callback = selection_callback
@@ -36,7 +37,7 @@ class ItemCard(ctk.CTkFrame):
             self,
             text=self.item.name,
             font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self._get_color(self.item.name),
+            text_color=self._get_color("name"),
         )
         self.label_name.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 0))
 
@@ -44,14 +45,14 @@ class ItemCard(ctk.CTkFrame):
             self,
             text=f"[{self.item.status}]",
             font=ctk.CTkFont(weight="bold"),
-            text_color=self._get_color(self.item.status),
+            text_color=self._get_color("status"),
         )
         self.label_status.grid(row=0, column=1, sticky="e", padx=10, pady=(10, 0))
 
         self.label_category = ctk.CTkLabel(
             self,
             text=f"Category: {self.item.category}",
-            text_color=self._get_color(self.item.category),
+            text_color=self._get_color("category"),
         )
         self.label_category.grid(row=1, column=0, sticky="w", padx=10)
 
@@ -63,14 +64,14 @@ class ItemCard(ctk.CTkFrame):
         self.label_location = ctk.CTkLabel(
             self,
             text=f"Location: {self.item.location}",
-            text_color=self._get_color(self.item.location),
+            text_color=self._get_color("location"),
         )
         self.label_location.grid(row=2, column=0, sticky="w", padx=10, pady=(0, 10))
 
         self.label_contact = ctk.CTkLabel(
             self,
             text=f"Contact: {self.item.contact_info}",
-            text_color=self._get_color(self.item.contact_info),
+            text_color=self._get_color("contact_info"),
         )
         self.label_contact.grid(row=2, column=1, sticky="e", padx=10, pady=(0, 10))
 
@@ -102,8 +103,8 @@ class ItemCard(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
-    def _get_color(self, field_value: str) -> Optional[str]:
-        if self.search_term and self.search_term in field_value.lower():
+    def _get_color(self, field_name: str) -> Optional[str]:
+        if field_name in self.spans:
             return ThemeColors.HIGHLIGHT
         return None
 
@@ -122,7 +123,9 @@ class ItemCard(ctk.CTkFrame):
 
     def _toggle_selection(self, event) -> None:
         self.selected = not self.selected
-        new_color = ThemeColors.CARD_SELECTED if self.selected else self.default_fg_color
+        new_color = (
+            ThemeColors.CARD_SELECTED if self.selected else self.default_fg_color
+        )
         self.configure(fg_color=new_color)
 
         self.selection_callback()
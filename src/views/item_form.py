@@ -1,10 +1,14 @@
+from contextlib import nullcontext
+from tkinter import messagebox
 from typing import Callable, Optional
 
 import customtkinter as ctk
 
 from src.controllers.app_controller import AppController
-from src.models.item import Item, ValidationError
+from src.models.database import ConflictError
+from src.models.item import Item, ValidationError, merge_edits
 from src.utils.theme import ThemeColors
+from src.views.stall_monitor import StallMonitor
 
 
 class ItemFormWindow(ctk.CTkToplevel):
@@ -14,11 +18,13 @@ class ItemFormWindow(ctk.CTkToplevel):
         controller: AppController,
         on_success: Callable,
         item: Optional[Item] = None,
+        stall_monitor: Optional[StallMonitor] = None,
     ) -> None:
         super().__init__(master)
         self.controller = controller
         self.on_success = on_success
         self.item = item
+        self.stall_monitor = stall_monitor
 
         title_text = "Edit Item" if self.item else "Add New Item"
         self.title(title_text)
@@ -77,34 +83,120 @@ class ItemFormWindow(ctk.CTkToplevel):
         )
 
     def _prefill_data(self) -> None:
-        if self.item is None:
-            return
-        self.entry_name.insert(0, self.item.name)
-        self.opt_category.set(self.item.category)
-        self.entry_date.insert(0, self.item.date)
-        self.entry_location.insert(0, self.item.location)
-        self.opt_status.set(self.item.status)
-        self.entry_contact.insert(0, self.item.contact_info)
+        if self.item is not None:
+            self._fill_form(self.item)
 
     def _save_item(self) -> None:
-        try:
-            new_item_data = Item(
-                name=self.entry_name.get(),
-                category=self.opt_category.get(),
-                date=self.entry_date.get(),
-                location=self.entry_location.get(),
-                status=self.opt_status.get(),
-                contact_info=self.entry_contact.get(),
-            )
-
-            if self.item:
-                new_item_data.id = self.item.id
-                self.controller.update_item(new_item_data)
-            else:
-                self.controller.add_item(new_item_data)
-
-            self.on_success()
-            self.destroy()
+        tracking = (
+            self.stall_monitor.track("_save_item")
+            if self.stall_monitor
+            else nullcontext({})
+        )
+        with tracking as details:
+            details["edit"] = self.item is not None
+            try:
+                new_item_data = Item(
+                    name=self.entry_name.get(),
+                    category=self.opt_category.get(),
+                    date=self.entry_date.get(),
+                    location=self.entry_location.get(),
+                    status=self.opt_status.get(),
+                    contact_info=self.entry_contact.get(),
+                )
+
+                if self.item:
+                    new_item_data.id = self.item.id
+                    if not self.controller.update_item(
+                        new_item_data, expected_version=self.item.version
+                    ):
+                        self.label_error.configure(
+                            text="This item no longer exists. It may have been deleted."
+                        )
+                        return
+                else:
+                    if not self._confirm_not_duplicate(new_item_data):
+                        return
+                    self.controller.add_item(new_item_data)
+
+                self.on_success()
+                self.destroy()
+
+            except ValidationError as e:
+                self.label_error.configure(text=str(e))
+            except ConflictError as e:
+                self._resolve_conflict(new_item_data, e)
+
+    def _confirm_not_duplicate(self, new_item_data: Item) -> bool:
+        duplicates = self.controller.find_duplicates(new_item_data)
+        if not duplicates:
+            return True
+        listing = "\n".join(
+            f"- #{item.id} {item.name} ({item.status}, {item.contact_info})"
+            for item in duplicates[:3]
+        )
+        return messagebox.askyesno(
+            "Possible Duplicate",
+            "This item looks like a report that already exists:\n\n"
+            f"{listing}\n\nSave it anyway?",
+            parent=self,
+        )
 
-        except ValidationError as e:
-            self.label_error.configure(text=str(e))
+    def _resolve_conflict(self, new_item_data: Item, error: ConflictError) -> None:
+        answer = messagebox.askyesnocancel(
+            "Edit Conflict",
+            "This item was changed by someone else while you were editing it.\n\n"
+            "Yes: merge, keeping the fields you changed and their other changes\n"
+            "No: discard your changes and reload the latest version\n"
+            "Cancel: keep editing",
+            parent=self,
+        )
+        if answer is None:
+            return
+        if answer:
+            self._merge_item(new_item_data)
+        else:
+            self._reload_item()
+
+    def _merge_item(self, new_item_data: Item) -> None:
+        # The merged fields are shown for review; saving them is checked
+        # against the reloaded version like any other edit.
+        latest = self._latest_item()
+        if latest is None or self.item is None:
+            return
+        merged, conflicts = merge_edits(self.item, new_item_data, latest)
+        self.item = latest
+        self._fill_form(merged)
+        message = "Merged with the latest version. Review and save."
+        if conflicts:
+            message += f"\nYour values were kept for: {', '.join(conflicts)}."
+        self.label_error.configure(text=message)
+
+    def _reload_item(self) -> None:
+        latest = self._latest_item()
+        if latest is None:
+            return
+        self.item = latest
+        self._fill_form(latest)
+        self.label_error.configure(text="")
+
+    def _latest_item(self) -> Optional[Item]:
+        if self.item is None or self.item.id is None:
+            return None
+        latest = self.controller.get_item(self.item.id)
+        if latest is None:
+            self.label_error.configure(
+                text="This item no longer exists. It may have been deleted."
+            )
+        return latest
+
+    def _fill_form(self, item: Item) -> None:
+        self.entry_name.delete(0, "end")
+        self.entry_date.delete(0, "end")
+        self.entry_location.delete(0, "end")
+        self.entry_contact.delete(0, "end")
+        self.entry_name.insert(0, item.name)
+        self.opt_category.set(item.category)
+        self.entry_date.insert(0, item.date)
+        self.entry_location.insert(0, item.location)
+        self.opt_status.set(item.status)
+        self.entry_contact.insert(0, item.contact_info)
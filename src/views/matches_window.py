@@ -0,0 +1,50 @@
+from typing import List
+
+import customtkinter as ctk
+
+from src.models.item import Item
+from src.models.matching import Match
+
+
+class MatchesWindow(ctk.CTkToplevel):
+
+    def __init__(self, master, matches: List[Match]) -> None:
+        super().__init__(master)
+        self.matches = matches
+
+        self.title("Suggested Matches")
+        self.geometry("700x500")
+        self.transient(master)
+
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        frame = ctk.CTkScrollableFrame(self)
+        frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        if not self.matches:
+            ctk.CTkLabel(frame, text="No likely matches found.").pack(pady=20)
+            return
+
+        for match in self.matches:
+            row = ctk.CTkFrame(frame)
+            row.pack(fill="x", padx=5, pady=5)
+            ctk.CTkLabel(
+                row, text=f"{match.score:.0%}", width=50, font=("Arial", 14, "bold")
+            ).pack(side="left", padx=10)
+            ctk.CTkLabel(
+                row, text=self._describe("Lost", match.lost), justify="left", anchor="w"
+            ).pack(side="left", fill="x", expand=True, padx=10, pady=5)
+            ctk.CTkLabel(
+                row,
+                text=self._describe("Found", match.found),
+                justify="left",
+                anchor="w",
+            ).pack(side="left", fill="x", expand=True, padx=10, pady=5)
+
+    @staticmethod
+    def _describe(label: str, item: Item) -> str:
+        return (
+            f"{label} #{item.id}: {item.name}\n"
+            f"{item.date} at {item.location}\n{item.contact_info}"
+        )
@@ -0,0 +1,142 @@
+"""Snapshot of the main window state, saved on exit for a fast warm start.
+
+The snapshot records the filters, the first page of displayed items with
+their highlight spans, and the data version they were read at.  On the next
+launch the window renders it straight away and only queries the database
+afterwards, when the data version shows the page may be out of date.
+
+Snapshots are small JSON files with items stored as plain lists.  A missing,
+corrupt or incompatible snapshot, including one whose filters are incomplete or
+hold values the window does not offer, is ignored and the window starts cold.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+from src.models.item import Item, ValidationError
+from src.models.search import Span
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_ITEMS = 200
+
+ITEM_FIELDS = tuple(f.name for f in fields(Item))
+
+VIEW_MODES = ("Cards", "Table")
+SORT_COLUMNS = ("id", "name", "category", "date", "location", "status", "contact")
+FILTER_TYPES: Dict[str, type] = {
+    "search": str,
+    "start_date": str,
+    "end_date": str,
+    "category": str,
+    "status": str,
+    "view_mode": str,
+    "include_archive": bool,
+    "fuzzy_search": bool,
+    "sort_column": str,
+    "sort_descending": bool,
+}
+"""The type of every filter setting a snapshot must hold."""
+
+
+@dataclass
+class ViewSnapshot:
+    """
+    The state of the main window worth restoring on the next launch.
+
+    Attributes:
+        database (str): The absolute path of the database the items came from.
+        data_version (int): The data version the items were read at.
+        filters (Dict[str, Any]): The filter, view and sort settings by name.
+        items (List[Item]): The first displayed items, at most SNAPSHOT_ITEMS.
+        spans (Dict[int, Dict[str, List[Span]]]): Highlight spans by item ID.
+        complete (bool): Whether ``items`` is the whole result, not just its
+            first page.
+    """
+
+    database: str
+    data_version: int
+    filters: Dict[str, Any]
+    items: List[Item]
+    spans: Dict[int, Dict[str, List[Span]]] = field(default_factory=dict)
+    complete: bool = True
+
+    def save(self, path: str) -> None:
+        """
+        Writes the snapshot, replacing any previous one atomically.
+
+        Args:
+            path (str): The snapshot file.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        data = {
+            "format": SNAPSHOT_FORMAT,
+            "database": self.database,
+            "data_version": self.data_version,
+            "filters": self.filters,
+            "items": [
+                [getattr(item, name) for name in ITEM_FIELDS] for item in self.items
+            ],
+            "spans": {str(item_id): spans for item_id, spans in self.spans.items()},
+            "complete": self.complete,
+        }
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as target:
+            json.dump(data, target, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ViewSnapshot"]:
+        """
+        Reads a snapshot written by :meth:`save`.
+
+        Args:
+            path (str): The snapshot file.
+
+        Returns:
+            Optional[ViewSnapshot]: The snapshot, or None if the file is
+            missing, unreadable, from another snapshot format or holds
+            invalid filters.
+        """
+        try:
+            with open(path, encoding="utf-8") as source:
+                data = json.load(source)
+            if data.get("format") != SNAPSHOT_FORMAT or not _valid_filters(
+                data["filters"]
+            ):
+                return None
+            return cls(
+                database=data["database"],
+                data_version=data["data_version"],
+                filters=data["filters"],
+                items=[Item(*row) for row in data["items"]],
+                spans={
+                    int(item_id): {
+                        name: [tuple(span) for span in field_spans]
+                        for name, field_spans in spans.items()
+                    }
+                    for item_id, spans in data["spans"].items()
+                },
+                complete=data["complete"],
+            )
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+            AttributeError,
+            ValidationError,
+        ):
+            return None
+
+
+def _valid_filters(filters: Any) -> bool:
+    """Checks that every filter setting is present, well typed and offered."""
+    if not isinstance(filters, dict) or set(filters) != set(FILTER_TYPES):
+        return False
+    if not all(isinstance(filters[name], kind) for name, kind in FILTER_TYPES.items()):
+        return False
+    return filters["view_mode"] in VIEW_MODES and filters["sort_column"] in SORT_COLUMNS
@@ -0,0 +1,140 @@
+"""Watchdog measuring how long the Tk event loop is blocked.
+
+A heartbeat is scheduled with ``after`` every ``interval_ms``.  When the
+event loop is busy the heartbeat runs late, and the delay is exactly how long
+the window was frozen.  Handlers wrap their work in :meth:`StallMonitor.track`,
+so a late heartbeat can be attributed to the slowest handler that ran since
+the previous one.
+
+Stalls are appended to a JSON lines log, one object per stall, e.g.::
+
+    {"time": "2025-10-30T14:02:11", "stall_ms": 840.2,
+     "action": "_refresh_display", "action_ms": 812.7, "items": 5000}
+
+The module does not import Tk: the monitor only needs an object with
+``after`` and ``after_cancel``, such as the application window.
+"""
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Protocol
+
+DEFAULT_INTERVAL_MS = 100
+DEFAULT_THRESHOLD_MS = 200
+MAX_RECORDED_STALLS = 100
+
+
+class Scheduler(Protocol):
+    """The part of the Tk widget interface the monitor uses."""
+
+    def after(self, ms: int, func: Callable[[], None]) -> Any: ...
+
+    def after_cancel(self, after_id: Any) -> None: ...
+
+
+class StallMonitor:
+    """
+    Detects event loop stalls and attributes them to the handler responsible.
+
+    Tracking is free while the monitor is stopped, so handlers can always be
+    wrapped and the monitor switched on only when diagnosing a problem.
+
+    Attributes:
+        log_path (Optional[str]): The JSON lines file stalls are appended to,
+            or None to only keep them in :attr:`stalls`.
+        threshold_ms (float): The heartbeat delay reported as a stall.
+        interval_ms (int): The time between heartbeats.
+        stalls (Deque[Dict[str, Any]]): The most recent stall records.
+    """
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        log_path: Optional[str] = None,
+        threshold_ms: float = DEFAULT_THRESHOLD_MS,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.log_path = log_path
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=MAX_RECORDED_STALLS)
+        self._scheduler = scheduler
+        self._clock = clock
+        self._after_id: Any = None
+        self._expected = 0.0
+        self._actions: List[Dict[str, Any]] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether heartbeats are being scheduled."""
+        return self._after_id is not None
+
+    def start(self) -> None:
+        """Starts scheduling heartbeats; does nothing if already running."""
+        if not self.running:
+            self._actions = []
+            self._schedule()
+
+    def stop(self) -> None:
+        """Cancels the pending heartbeat."""
+        if self._after_id is not None:
+            self._scheduler.after_cancel(self._after_id)
+            self._after_id = None
+
+    @contextmanager
+    def track(self, action: str) -> Iterator[Dict[str, Any]]:
+        """
+        Times a handler so that stalls during it are attributed to it.
+
+        The yielded dict can be filled with details, such as the number of
+        items displayed, which are written to the log with the stall.
+
+        Args:
+            action (str): The handler name reported in the log.
+
+        Yields:
+            Dict[str, Any]: Details to record along with the handler.
+        """
+        details: Dict[str, Any] = {}
+        if not self.running:
+            yield details
+            return
+        started = self._clock()
+        try:
+            yield details
+        finally:
+            self._actions.append(
+                {
+                    "action": action,
+                    "action_ms": round((self._clock() - started) * 1000, 1),
+                    **details,
+                }
+            )
+
+    def _schedule(self) -> None:
+        self._expected = self._clock() + self.interval_ms / 1000
+        self._after_id = self._scheduler.after(self.interval_ms, self._heartbeat)
+
+    def _heartbeat(self) -> None:
+        stall_ms = (self._clock() - self._expected) * 1000
+        if stall_ms >= self.threshold_ms:
+            self._record(stall_ms)
+        self._actions = []
+        self._schedule()
+
+    def _record(self, stall_ms: float) -> None:
+        """Logs a stall with the slowest handler since the previous heartbeat."""
+        culprit = max(self._actions, key=lambda a: a["action_ms"], default=None)
+        record: Dict[str, Any] = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "stall_ms": round(stall_ms, 1),
+        }
+        record.update(culprit or {"action": None})
+        self.stalls.append(record)
+        if self.log_path is not None:
+            with open(self.log_path, "a", encoding="utf-8") as log:
+                log.write(json.dumps(record) + "\n")
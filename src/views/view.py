@@ -1,40 +1,95 @@
+import os
+import sqlite3
+import threading
 import tkinter as tk
-from tkinter import ttk
-from typing import List
+from concurrent.futures import Future
+from functools import partial
+from tkinter import messagebox, ttk
+from typing import Any, Callable, Dict, List, Optional
 import customtkinter as ctk
 
 from src.controllers.app_controller import AppController
-from src.models.database import DatabaseManager
+from src.models.database import ChangeLogExpiredError, DatabaseManager
 from src.models.item import Item
+from src.models.result_set import ResultSet
+from src.models.search import SearchResult
+from src.utils.dates import date_to_day_number
 from src.utils.theme import ThemeColors
 from src.views.confirm_delete import ConfirmDeleteWindow
 from src.views.item_card import ItemCard
 from src.views.item_form import ItemFormWindow
+from src.views.matches_window import MatchesWindow
+from src.views.snapshot import SNAPSHOT_ITEMS, VIEW_MODES, ViewSnapshot
+from src.views.stall_monitor import StallMonitor
+
+STATUS_BAR_POLL_MS = 5000
+SNAPSHOT_RECONCILE_MS = 50
+BACKGROUND_POLL_MS = 50
+PAGE_SIZE = 200
+
+TABLE_HEADINGS = {
+    "name": "Item Name",
+    "category": "Category",
+    "date": "Date",
+    "location": "Location",
+    "status": "Status",
+    "contact": "Contact",
+}
+SORT_KEYS_BY_COLUMN = {"contact": "contact_info"}
 
 
 class AppView(ctk.CTk):
-    def __init__(self, controller: AppController):
+    def __init__(
+        self,
+        controller: AppController,
+        stall_log: Optional[str] = None,
+        snapshot_path: Optional[str] = None,
+    ):
         super().__init__()
         self.controller = controller
+        self.stall_monitor = StallMonitor(self, stall_log)
+        self.snapshot_path = snapshot_path
 
         self.title("Lost and Found Application")
         self.geometry("800x600")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", self._on_filter_change)
-
+        self.start_date_var = tk.StringVar()
+        self.end_date_var = tk.StringVar()
         self.category_var = ctk.StringVar(value="All")
         self.status_var = ctk.StringVar(value="All")
         self.view_mode_var = ctk.StringVar(value="Cards")
+        self.include_archive_var = tk.BooleanVar(value=False)
+        self.fuzzy_search_var = tk.BooleanVar(value=False)
 
-        self._current_items: List[Item] = []
+        self._results = ResultSet((), self.controller.get_results)
+        self._rendered = 0
+        self._more_pending = False
+        self._sort_column = "id"
+        self._sort_descending = False
+        self._loaded_version = 0
+        self._matches_pending = False
 
         self._setup_menu()
         self._setup_control_panel()
         self._setup_main_display()
+        self._setup_status_bar()
         self._setup_action_panel()
 
-        self._refresh_display()
+        snapshot = ViewSnapshot.load(snapshot_path) if snapshot_path else None
+        if snapshot is not None and snapshot.database == os.path.abspath(
+            self.controller.db.db_name
+        ):
+            self._restore_snapshot(snapshot)
+        else:
+            self._refresh_display()
+        # Traced only now so that restoring the filters does not query.
+        for var in (self.search_var, self.start_date_var, self.end_date_var):
+            var.trace_add("write", self._on_filter_change)
+        self.after(STATUS_BAR_POLL_MS, self._poll_status_bar)
+        if stall_log is not None:
+            self.stall_monitor.start()
 
     def _setup_menu(self) -> None:
         menubar = tk.Menu(self)
@@ -42,7 +97,7 @@ class AppView(ctk.CTk):
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="Add New Item", command=self._mock_add_item)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
         menubar.add_cascade(label="File", menu=file_menu)
 
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -57,7 +112,21 @@ class AppView(ctk.CTk):
             label="Toggle Light/Dark Theme", command=self._toggle_theme
         )
         view_menu.add_separator()
+        view_menu.add_checkbutton(
+            label="Fuzzy Search",
+            variable=self.fuzzy_search_var,
+            command=self._on_fuzzy_toggle,
+        )
+        view_menu.add_checkbutton(
+            label="Include Archived Items",
+            variable=self.include_archive_var,
+            command=self._refresh_display,
+        )
         view_menu.add_command(label="Clear Filters", command=self._clear_filters)
+        view_menu.add_separator()
+        view_menu.add_command(
+            label="Suggested Matches", command=self._show_suggested_matches
+        )
         menubar.add_cascade(label="View", menu=view_menu)
 
         self.config(menu=menubar)
@@ -77,11 +146,27 @@ class AppView(ctk.CTk):
         view_toggle = ctk.CTkSegmentedButton(
             control_frame,
             variable=self.view_mode_var,
-            values=["Cards", "Table"],
+            values=list(VIEW_MODES),
             command=self._on_filter_change,
         )
         view_toggle.pack(side="left", padx=10, pady=10)
 
+        start_date_entry = ctk.CTkEntry(
+            control_frame,
+            textvariable=self.start_date_var,
+            placeholder_text="From YYYY-MM-DD",
+            width=120,
+        )
+        start_date_entry.pack(side="left", padx=(10, 5), pady=10)
+
+        end_date_entry = ctk.CTkEntry(
+            control_frame,
+            textvariable=self.end_date_var,
+            placeholder_text="To YYYY-MM-DD",
+            width=120,
+        )
+        end_date_entry.pack(side="left", padx=(5, 10), pady=10)
+
         status_menu = ctk.CTkOptionMenu(
             control_frame,
             variable=self.status_var,
@@ -129,15 +214,16 @@ class AppView(ctk.CTk):
 
         columns = ("id", "name", "category", "date", "location", "status", "contact")
         self.tree = ttk.Treeview(
-            self.display_container, columns=columns, show="headings"
+            self.display_container,
+            columns=columns,
+            show="headings",
+            yscrollcommand=self._on_tree_scroll,
         )
 
-        self.tree.heading("name", text="Item Name")
-        self.tree.heading("category", text="Category")
-        self.tree.heading("date", text="Date")
-        self.tree.heading("location", text="Location")
-        self.tree.heading("status", text="Status")
-        self.tree.heading("contact", text="Contact")
+        for column, text in TABLE_HEADINGS.items():
+            self.tree.heading(
+                column, text=text, command=lambda c=column: self._sort_table(c)
+            )
 
         self.tree.column("id", width=0, stretch=tk.NO)
         self.tree.column("name", width=150)
@@ -149,6 +235,28 @@ class AppView(ctk.CTk):
 
         self.tree.bind("<<TreeviewSelect>>", lambda e: self._on_selection_change())
 
+    def _setup_status_bar(self) -> None:
+        self.label_status_bar = ctk.CTkLabel(
+            self, text="", anchor="w", text_color=ThemeColors.TEXT_MUTED
+        )
+        self.label_status_bar.pack(side="bottom", fill="x", padx=20, pady=(0, 5))
+
+    def _refresh_status_bar(self) -> None:
+        stats = self.controller.stats()
+        counts = " | ".join(
+            f"{status}: {stats.by_status.get(status, 0)}"
+            for status in ("Lost", "Found", "Claimed")
+        )
+        self.label_status_bar.configure(text=f"Total: {stats.total} | {counts}")
+
+    def _poll_status_bar(self) -> None:
+        # Re-armed even if the refresh fails, so one error does not stop
+        # the status bar updating for the rest of the session.
+        try:
+            self._refresh_status_bar()
+        finally:
+            self.after(STATUS_BAR_POLL_MS, self._poll_status_bar)
+
     def _setup_action_panel(self) -> None:
         action_frame = ctk.CTkFrame(self, fg_color="transparent")
         action_frame.pack(side="bottom", fill="x", padx=10, pady=(0, 10))
@@ -177,42 +285,102 @@ class AppView(ctk.CTk):
         self.btn_delete_selected.pack(side="left", padx=10)
 
     def _on_filter_change(self, *args) -> None:
+        self._update_sort_headings()
         self._refresh_display()
 
     def _clear_filters(self) -> None:
         self.search_var.set("")
+        self.start_date_var.set("")
+        self.end_date_var.set("")
         self.category_var.set("All")
         self.status_var.set("All")
 
+    @staticmethod
+    def _get_date_filter(date_var: tk.StringVar) -> Optional[str]:
+        value = date_var.get().strip()
+        try:
+            date_to_day_number(value)
+        except ValueError:
+            return None
+        return value
+
     def _refresh_display(self) -> None:
+        with self.stall_monitor.track("_refresh_display") as details:
+            self._loaded_version = self.controller.data_version()
+            self._results = self._query_results()
+            self._more_pending = False
+            self._render_items()
+            details["items"] = len(self._results)
+            details["view"] = self.view_mode_var.get()
+
+    def _query_results(self) -> ResultSet:
+        return self._results_query()()
+
+    def _results_query(self) -> Callable[[], ResultSet]:
+        # Reads the filters on the Tk thread; the returned query only calls
+        # the controller, so it can also run on a worker thread. Only the IDs
+        # of the results are read by it; the items themselves are fetched a
+        # batch at a time as pages are rendered, see ResultSet.
         search_term = self.search_var.get()
         category = self.category_var.get() if self.category_var.get() != "All" else None
         status = self.status_var.get() if self.status_var.get() != "All" else None
+        include_archive = self.include_archive_var.get()
+        start_date = self._get_date_filter(self.start_date_var)
+        end_date = self._get_date_filter(self.end_date_var)
+        if self._fuzzy_ranked():
 
-        items = self.controller.search_items(search_term)
-        self._current_items = [
-            item
-            for item in items
-            if (category is None or item.category == category)
-            and (status is None or item.status == status)
-        ]
+            def fuzzy_query() -> ResultSet:
+                items = self.controller.fuzzy_search(
+                    search_term,
+                    category,
+                    status,
+                    include_archive=include_archive,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                return ResultSet.from_results(
+                    [SearchResult(item) for item in items],
+                    partial(
+                        self.controller.get_results, include_archive=include_archive
+                    ),
+                )
 
+            return fuzzy_query
+        sort_by = SORT_KEYS_BY_COLUMN.get(self._sort_column, self._sort_column)
+        descending = self._sort_descending
+
+        def query() -> ResultSet:
+            ids, spans = self.controller.search_spans(
+                search_term,
+                category,
+                status,
+                start_date,
+                end_date,
+                include_archive=include_archive,
+                sort_by=sort_by,
+                descending=descending,
+            )
+            return ResultSet(
+                ids,
+                partial(
+                    self.controller.get_results,
+                    keyword=search_term,
+                    include_archive=include_archive,
+                    spans=spans,
+                ),
+            )
+
+        return query
+
+    def _render_items(self) -> None:
+        self._rendered = 0
         if self.view_mode_var.get() == "Cards":
             self.tree.pack_forget()
             self.scroll_frame.pack(side="top", fill="both", expand=True)
 
             for widget in self.scroll_frame.winfo_children():
                 widget.destroy()
-            for item in self._current_items:
-                card = ItemCard(
-                    self.scroll_frame,
-                    item,
-                    search_term,
-                    edit_callback=self._open_edit_form,
-                    delete_callback=self._prompt_single_delete,
-                    selection_callback=self._on_selection_change,
-                )
-                card.pack(fill="x", padx=5, pady=5)
+            self._render_next_cards()
 
         else:
             self.scroll_frame.pack_forget()
@@ -220,23 +388,245 @@ class AppView(ctk.CTk):
 
             for row in self.tree.get_children():
                 self.tree.delete(row)
-            for item in self._current_items:
-                self.tree.insert(
-                    "",
-                    tk.END,
-                    values=(
-                        item.id,
-                        item.name,
-                        item.category,
-                        item.date,
-                        item.location,
-                        item.status,
-                        item.contact_info,
-                    ),
-                )
+            self._insert_next_table_rows()
 
+        self._refresh_status_bar()
         self._on_selection_change()
 
+    def _render_next_cards(self) -> None:
+        for result in self._next_page():
+            card = ItemCard(
+                self.scroll_frame,
+                result.item,
+                result.spans,
+                edit_callback=self._open_edit_form,
+                delete_callback=self._prompt_single_delete,
+                selection_callback=self._on_selection_change,
+            )
+            card.pack(fill="x", padx=5, pady=5)
+        remaining = len(self._results) - self._rendered
+        if remaining > 0 or self._more_pending:
+            btn_more = ctk.CTkButton(
+                self.scroll_frame,
+                text=f"Show more ({remaining} left)" if remaining else "Show more",
+            )
+            btn_more.configure(command=lambda: self._show_more_cards(btn_more))
+            btn_more.pack(pady=5)
+
+    def _show_more_cards(self, btn_more: ctk.CTkButton) -> None:
+        with self.stall_monitor.track("_show_more_cards") as details:
+            if not self._load_remaining_results():
+                return
+            btn_more.destroy()
+            shown = self._rendered
+            self._render_next_cards()
+            details["items"] = self._rendered - shown
+
+    def _next_page(self) -> List[SearchResult]:
+        start = self._rendered
+        self._rendered = min(start + PAGE_SIZE, len(self._results))
+        return self._results.window(start, self._rendered)
+
+    def _load_remaining_results(self) -> bool:
+        # A restored snapshot only holds the first page; the rest of the
+        # result is queried when it is first needed. Returns False if the
+        # data changed meanwhile and the display was refreshed instead.
+        if not self._more_pending or self._rendered < len(self._results):
+            return True
+        self._more_pending = False
+        if self.controller.data_version() != self._loaded_version:
+            self._refresh_display()
+            return False
+        self._results = self._query_results()
+        return True
+
+    def _filter_state(self) -> Dict[str, Any]:
+        return {
+            "search": self.search_var.get(),
+            "start_date": self.start_date_var.get(),
+            "end_date": self.end_date_var.get(),
+            "category": self.category_var.get(),
+            "status": self.status_var.get(),
+            "view_mode": self.view_mode_var.get(),
+            "include_archive": self.include_archive_var.get(),
+            "fuzzy_search": self.fuzzy_search_var.get(),
+            "sort_column": self._sort_column,
+            "sort_descending": self._sort_descending,
+        }
+
+    def _save_snapshot(self) -> None:
+        results = self._results.window(0, SNAPSHOT_ITEMS)
+        snapshot = ViewSnapshot(
+            database=os.path.abspath(self.controller.db.db_name),
+            data_version=self._loaded_version,
+            filters=self._filter_state(),
+            items=[result.item for result in results],
+            spans={result.item.id: result.spans for result in results if result.spans},
+            complete=len(self._results) <= SNAPSHOT_ITEMS,
+        )
+        snapshot.save(self.snapshot_path)
+
+    def _restore_snapshot(self, snapshot: ViewSnapshot) -> None:
+        filters = snapshot.filters
+        self.search_var.set(filters["search"])
+        self.start_date_var.set(filters["start_date"])
+        self.end_date_var.set(filters["end_date"])
+        self.category_var.set(filters["category"])
+        self.status_var.set(filters["status"])
+        self.view_mode_var.set(filters["view_mode"])
+        self.include_archive_var.set(filters["include_archive"])
+        self.fuzzy_search_var.set(filters["fuzzy_search"])
+        self._sort_column = filters["sort_column"]
+        self._sort_descending = filters["sort_descending"]
+        self._update_sort_headings()
+
+        self._loaded_version = snapshot.data_version
+        self._results = ResultSet.from_results(
+            [
+                SearchResult(item, snapshot.spans.get(item.id, {}))
+                for item in snapshot.items
+            ],
+            partial(
+                self.controller.get_results,
+                keyword="" if filters["fuzzy_search"] else filters["search"],
+                include_archive=filters["include_archive"],
+            ),
+        )
+        self._more_pending = not snapshot.complete
+        self._render_items()
+        self.after(SNAPSHOT_RECONCILE_MS, lambda: self._reconcile_snapshot(snapshot))
+
+    def _reconcile_snapshot(self, snapshot: ViewSnapshot) -> None:
+        # Runs once the restored window is drawn. A version lookup on a worker
+        # thread decides whether the snapshot is still what the query would
+        # return, and only if not is the query rerun there too, so the window
+        # stays usable meanwhile. An unchanged but incomplete snapshot is kept:
+        # the rest of the result is only queried once it is scrolled to.
+        filters = self._filter_state()
+        query = self._results_query()
+
+        def reconcile() -> Optional[tuple]:
+            version = self.controller.data_version()
+            if version == snapshot.data_version:
+                return None
+            return version, query()
+
+        self._run_in_background(
+            reconcile, partial(self._apply_reconciled, snapshot, filters)
+        )
+
+    def _apply_reconciled(
+        self, snapshot: ViewSnapshot, filters: Dict[str, Any], future: Future
+    ) -> None:
+        # Results for filters the user has changed since, or that a refresh
+        # already replaced, are stale and dropped. If the lookup failed the
+        # snapshot stays on screen until the next refresh.
+        try:
+            reconciled = future.result()
+        except sqlite3.Error:
+            return
+        if (
+            reconciled is None
+            or self._filter_state() != filters
+            or self._loaded_version != snapshot.data_version
+        ):
+            return
+        with self.stall_monitor.track("_apply_reconciled") as details:
+            self._loaded_version, self._results = reconciled
+            self._more_pending = False
+            self._render_items()
+            details["items"] = len(self._results)
+
+    def _run_in_background(
+        self, work: Callable[[], Any], done: Callable[[Future], None]
+    ) -> None:
+        # Runs work on a daemon thread and hands its finished future to done
+        # on the Tk thread, polling for it with after().
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(work())
+            except Exception as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=run, name="lostfound-background", daemon=True).start()
+        self.after(BACKGROUND_POLL_MS, partial(self._poll_background, future, done))
+
+    def _poll_background(self, future: Future, done: Callable[[Future], None]) -> None:
+        if not future.done():
+            self.after(BACKGROUND_POLL_MS, partial(self._poll_background, future, done))
+            return
+        done(future)
+
+    def _on_close(self) -> None:
+        if self.snapshot_path is not None:
+            try:
+                self._save_snapshot()
+            except OSError:
+                pass  # Without a snapshot the next launch is simply a cold start.
+        self.destroy()
+
+    def _insert_next_table_rows(self) -> None:
+        for result in self._next_page():
+            item = result.item
+            self.tree.insert(
+                "",
+                tk.END,
+                values=(
+                    item.id,
+                    item.name,
+                    item.category,
+                    item.date,
+                    item.location,
+                    item.status,
+                    item.contact_info,
+                ),
+            )
+
+    def _fuzzy_ranked(self) -> bool:
+        # Fuzzy results are always listed closest match first, so the column
+        # sort does not apply to them.
+        return self.fuzzy_search_var.get() and bool(self.search_var.get().strip())
+
+    def _on_fuzzy_toggle(self) -> None:
+        self._update_sort_headings()
+        self._refresh_display()
+
+    def _sort_table(self, column: str) -> None:
+        if self._fuzzy_ranked():
+            return
+        if column == self._sort_column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column = column
+            self._sort_descending = False
+        self._update_sort_headings()
+        self._refresh_display()
+
+    def _update_sort_headings(self) -> None:
+        ranked = self._fuzzy_ranked()
+        for name, text in TABLE_HEADINGS.items():
+            if ranked:
+                text += " (by relevance)" if name == "name" else ""
+            elif name == self._sort_column:
+                text += " \u25bc" if self._sort_descending else " \u25b2"
+            self.tree.heading(name, text=text)
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        if float(last) > 0.9:
+            self._load_next_table_page()
+
+    def _load_next_table_page(self) -> None:
+        if self.view_mode_var.get() != "Table" or not self._load_remaining_results():
+            return
+        if self._rendered >= len(self._results):
+            return
+        with self.stall_monitor.track("_load_next_table_page") as details:
+            shown = self._rendered
+            self._insert_next_table_rows()
+            details["items"] = self._rendered - shown
+
     def _mock_add_item(self) -> None:
         from datetime import datetime
 
@@ -252,11 +642,22 @@ class AppView(ctk.CTk):
         self._refresh_display()
 
     def _open_add_form(self) -> None:
-        ItemFormWindow(self, self.controller, on_success=self._refresh_display)
+        ItemFormWindow(
+            self,
+            self.controller,
+            on_success=self._refresh_display,
+            stall_monitor=self.stall_monitor,
+        )
 
     def _open_edit_form(self, item: Item) -> None:
+        if not self._writable_items([item]):
+            return
         ItemFormWindow(
-            self, self.controller, on_success=self._refresh_display, item=item
+            self,
+            self.controller,
+            on_success=self._refresh_display,
+            item=item,
+            stall_monitor=self.stall_monitor,
         )
 
     def _delete_item(self, item: Item) -> None:
@@ -276,10 +677,21 @@ class AppView(ctk.CTk):
             selected_db_ids = [
                 self.tree.item(row)["values"][0] for row in selected_rows
             ]
-            return [item for item in self._current_items if item.id in selected_db_ids]
+            items = self.controller.get_items(
+                selected_db_ids, self.include_archive_var.get()
+            )
+            return [item for item in items if item is not None]
 
     def _on_selection_change(self) -> None:
-        count = len(self._get_selected_items())
+        # Counted from the widgets so that selecting rows does not query.
+        if self.view_mode_var.get() == "Cards":
+            count = sum(
+                1
+                for card in self.scroll_frame.winfo_children()
+                if isinstance(card, ItemCard) and card.selected
+            )
+        else:
+            count = len(self.tree.selection())
         self.btn_edit_selected.configure(state="normal" if count == 1 else "disabled")
         self.btn_delete_selected.configure(state="normal" if count > 0 else "disabled")
 
@@ -289,18 +701,58 @@ class AppView(ctk.CTk):
             self._open_edit_form(selected[0])
 
     def _prompt_single_delete(self, item: Item) -> None:
-        ConfirmDeleteWindow(self, [item], on_confirm=self._execute_deletions)
+        if self._writable_items([item]):
+            ConfirmDeleteWindow(self, [item], on_confirm=self._execute_deletions)
 
     def _prompt_batch_delete(self) -> None:
-        selected = self._get_selected_items()
+        selected = self._writable_items(self._get_selected_items())
         if selected:
             ConfirmDeleteWindow(self, selected, on_confirm=self._execute_deletions)
 
+    def _writable_items(self, items: List[Item]) -> List[Item]:
+        # Archived items are shown with "Include Archived Items" but are
+        # read-only: edits and deletions only apply to the live table.
+        if not self.include_archive_var.get():
+            return items
+        archived = self.controller.archived_ids([item.id for item in items])
+        if archived:
+            messagebox.showinfo(
+                "Archived Items",
+                f"{len(archived)} of the selected items are archived and cannot "
+                "be edited or deleted.",
+                parent=self,
+            )
+        return [item for item in items if item.id not in archived]
+
     def _execute_deletions(self, item_to_delete: List[Item]) -> None:
-        for item in item_to_delete:
-            if item.id is not None:
-                self.controller.delete_item(item.id)
-        self._refresh_display()
+        with self.stall_monitor.track("_execute_deletions") as details:
+            details["items"] = len(item_to_delete)
+            for item in item_to_delete:
+                if item.id is not None:
+                    self.controller.delete_item(item.id)
+            self._refresh_display()
+
+    def _show_suggested_matches(self) -> None:
+        # The first call builds the match engine from every Lost and Found
+        # item, so it runs on a worker thread and the window polls for it.
+        if self._matches_pending:
+            return
+        self._matches_pending = True
+        self._run_in_background(self.controller.suggest_matches, self._on_matches_ready)
+
+    def _on_matches_ready(self, future: Future) -> None:
+        try:
+            matches = future.result()
+        except (sqlite3.Error, ValueError, ChangeLogExpiredError) as exc:
+            messagebox.showerror(
+                "Suggested Matches", f"Could not load matches: {exc}", parent=self
+            )
+            return
+        finally:
+            self._matches_pending = False
+        with self.stall_monitor.track("_show_suggested_matches") as details:
+            details["items"] = len(matches)
+            MatchesWindow(self, matches)
 
     def _set_view_mode(self, mode: str) -> None:
         self.view_mode_var.set(mode)
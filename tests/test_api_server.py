@@ -0,0 +1,258 @@
+from http.client import HTTPConnection
+import json
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, Generator, Optional, Tuple
+
+import pytest
+
+from src.api.server import ApiServer, create_server
+from src.models.item import Item
+
+
+@pytest.fixture(name="server")
+def api_server(tmp_path: Path) -> Generator[ApiServer, None, None]:
+    """
+    Fixture providing a running API server on a free port, backed by a
+    temporary database pre-populated with a few items.
+    """
+    server = create_server(str(tmp_path / "test_api.db"), port=0)
+    for name, location, status in [
+        ("Keys", "Library", "Lost"),
+        ("MacBook Pro", "Cafeteria", "Found"),
+        ("Green Jacket", "Gym", "Lost"),
+        ("Samsung Galaxy 8", "Library", "Claimed"),
+    ]:
+        server.controller.add_item(
+            Item(name, "Misc", "2025-10-01", location, status, "ann@university.ac.uk")
+        )
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(
+    server: ApiServer,
+    method: str,
+    path: str,
+    body: Optional[Any] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[int, Any]:
+    """Sends a request to the test server and decodes the JSON response."""
+    status, data, _ = raw_request(server, method, path, body, headers)
+    return status, data
+
+
+def raw_request(
+    server: ApiServer,
+    method: str,
+    path: str,
+    body: Optional[Any] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[int, Any, Dict[str, str]]:
+    """Sends a request and returns the status, decoded body and headers."""
+    conn = HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    payload = json.dumps(body) if body is not None else None
+    conn.request(method, path, body=payload, headers=headers or {})
+    response = conn.getresponse()
+    data = response.read()
+    conn.close()
+    return response.status, json.loads(data) if data else None, dict(response.headers)
+
+
+def test_list_items(server: ApiServer) -> None:
+    """Test that listing without a limit streams every item."""
+    status, body = request(server, "GET", "/items")
+    assert status == 200
+    assert len(body["items"]) == 4
+    assert body["next_after"] is None
+
+
+def test_list_items_search_and_filter(server: ApiServer) -> None:
+    """Test keyword search combined with a status filter."""
+    status, body = request(server, "GET", "/items?q=library&status=Claimed")
+    assert status == 200
+    assert [item["name"] for item in body["items"]] == ["Samsung Galaxy 8"]
+
+
+def test_list_items_pagination(server: ApiServer) -> None:
+    """Test that keyset pages cover every item exactly once."""
+    status, page = request(server, "GET", "/items?limit=3")
+    assert status == 200
+    assert len(page["items"]) == 3
+    assert page["next_after"] == page["items"][-1]["id"]
+
+    status, page_2 = request(
+        server, "GET", f"/items?limit=3&after={page['next_after']}"
+    )
+    assert [item["name"] for item in page_2["items"]] == ["Samsung Galaxy 8"]
+    assert page_2["next_after"] is None
+
+
+def test_list_items_invalid_parameters(server: ApiServer) -> None:
+    """Test that malformed query parameters are rejected with 400."""
+    assert request(server, "GET", "/items?limit=abc")[0] == 400
+    assert request(server, "GET", "/items?from=01-01-2025")[0] == 400
+
+
+def test_item_crud(server: ApiServer) -> None:
+    """Test creating, reading, updating and deleting an item over HTTP."""
+    new_item = {
+        "name": "Blue Umbrella",
+        "category": "Misc",
+        "date": "2025-11-02",
+        "location": "Main Hall",
+        "status": "Found",
+        "contact_info": "desk@university.ac.uk",
+    }
+    status, created = request(server, "POST", "/items", new_item)
+    assert status == 201
+    item_id = created["id"]
+
+    status, fetched = request(server, "GET", f"/items/{item_id}")
+    assert status == 200
+    assert fetched["name"] == "Blue Umbrella"
+
+    status, updated = request(
+        server, "PUT", f"/items/{item_id}", {**new_item, "status": "Claimed"}
+    )
+    assert status == 200
+    assert request(server, "GET", f"/items/{item_id}")[1]["status"] == "Claimed"
+
+    assert request(server, "DELETE", f"/items/{item_id}")[0] == 204
+    assert request(server, "GET", f"/items/{item_id}")[0] == 404
+
+
+def test_create_invalid_item(server: ApiServer) -> None:
+    """Test that validation errors are reported as 400 responses."""
+    status, body = request(server, "POST", "/items", {"name": "Pen"})
+    assert status == 400
+    assert "cannot be empty" in body["error"]
+
+
+def test_create_item_with_non_string_field(server: ApiServer) -> None:
+    """Test that wrongly typed fields are rejected instead of crashing."""
+    status, body = request(
+        server,
+        "POST",
+        "/items",
+        {
+            "name": 42,
+            "category": "Misc",
+            "date": "2025-10-01",
+            "location": "Gym",
+            "status": "Lost",
+            "contact_info": "a@b.c",
+        },
+    )
+    assert status == 400
+    assert body["error"] == "name must be a string"
+
+
+def test_unexpected_errors_are_json(
+    server: ApiServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that database failures produce a JSON 500 response."""
+
+    def locked() -> None:
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(server.controller, "stats", locked)
+    status, body = request(server, "GET", "/stats")
+    assert status == 500
+    assert body == {"error": "Internal server error"}
+    assert request(server, "GET", "/items/1")[0] == 200
+
+
+def test_unknown_item(server: ApiServer) -> None:
+    """Test that missing items produce 404 responses."""
+    assert request(server, "GET", "/items/999")[0] == 404
+    assert request(server, "DELETE", "/items/999")[0] == 404
+    assert request(server, "GET", "/unknown")[0] == 404
+
+
+def test_stats(server: ApiServer) -> None:
+    """Test the aggregate statistics endpoint."""
+    status, body = request(server, "GET", "/stats")
+    assert status == 200
+    assert body["total"] == 4
+    assert body["by_status"]["Lost"] == 2
+
+
+def test_listing_etag_not_modified(server: ApiServer, monkeypatch) -> None:
+    """Test that a matching If-None-Match is answered without running the query."""
+    status, _, headers = raw_request(server, "GET", "/items?q=library")
+    assert status == 200
+    etag = headers["ETag"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("query should not run for a 304 response")
+
+    monkeypatch.setattr(server.controller, "iter_search", fail)
+    status, body, headers = raw_request(
+        server, "GET", "/items?q=library", headers={"If-None-Match": etag}
+    )
+    assert status == 304
+    assert body is None
+    assert headers["ETag"] == etag
+
+
+def test_listing_etag_changes_with_data_and_query(server: ApiServer) -> None:
+    """Test that ETags differ between queries and change after a write."""
+    etag = raw_request(server, "GET", "/items")[2]["ETag"]
+    assert raw_request(server, "GET", "/items?q=gym")[2]["ETag"] != etag
+
+    request(server, "DELETE", "/items/1")
+    status, _, headers = raw_request(
+        server, "GET", "/items", headers={"If-None-Match": etag}
+    )
+    assert status == 200
+    assert headers["ETag"] != etag
+
+
+def test_stats_etag(server: ApiServer) -> None:
+    """Test conditional requests on the statistics endpoint."""
+    etag = raw_request(server, "GET", "/stats")[2]["ETag"]
+    status = raw_request(server, "GET", "/stats", headers={"If-None-Match": etag})[0]
+    assert status == 304
+
+
+def test_update_with_stale_version_conflicts(server: ApiServer) -> None:
+    """Test that a PUT based on an outdated version is rejected with 409."""
+    status, item = request(server, "GET", "/items/1")
+    assert item["version"] == 1
+
+    assert request(server, "PUT", "/items/1", {**item, "status": "Found"})[0] == 200
+    status, body = request(server, "PUT", "/items/1", {**item, "status": "Claimed"})
+    assert status == 409
+    assert request(server, "GET", "/items/1")[1]["status"] == "Found"
+
+
+def test_changes_feed(server: ApiServer) -> None:
+    """Test that clients can follow the change log with a cursor."""
+    status, data = request(server, "GET", "/changes?limit=3")
+    assert status == 200
+    assert [change["item"]["name"] for change in data["changes"]] == [
+        "Keys",
+        "MacBook Pro",
+        "Green Jacket",
+    ]
+    assert data["has_more"]
+
+    request(server, "DELETE", "/items/1")
+    status, data = request(server, "GET", f"/changes?since={data['next_since']}")
+    assert [(change["id"], change["item"]) for change in data["changes"]][-1] == (
+        1,
+        None,
+    )
+    assert not data["changes"][-1]["archived"]
+    assert not data["has_more"]
+
+    server.controller.db.prune_changes(data["next_since"])
+    status, data = request(server, "GET", "/changes?since=0")
+    assert status == 410
@@ -1,9 +1,10 @@
+from datetime import date
 from pathlib import Path
 from typing import Generator
 
 import pytest
 
-from src.controllers.app_controller import AppController
+from src.controllers.app_controller import FUZZY_CANDIDATES, AppController
 from src.models.database import DatabaseManager
 from src.models.item import Item
 
@@ -106,3 +107,269 @@ def test_filter_items_non_provided(controller: AppController) -> None:
     """Test that providing no filter arguments returns all items."""
     results = controller.filter_items()
     assert len(results) == 4
+
+
+def test_search_items_with_filters(controller: AppController) -> None:
+    """Test that keyword search combines with category, status and date filters."""
+    results = controller.search_items("library", status="Claimed")
+    assert [item.name for item in results] == ["Samsung Galaxy 8"]
+
+    results = controller.search_items(
+        "", start_date="2025-10-01", end_date="2025-12-31"
+    )
+    assert sorted(item.name for item in results) == ["Keys", "Samsung Galaxy 8"]
+
+
+def test_get_items_between(controller: AppController) -> None:
+    """Test retrieving items within an inclusive date range."""
+    results = controller.get_items_between("2024-01-01", "2025-10-01")
+    assert sorted(item.name for item in results) == ["Green Jacket", "Keys"]
+
+
+def test_get_items_from_last_days(controller: AppController) -> None:
+    """Test that only items dated within the window are returned."""
+    today = date.today().strftime("%Y-%m-%d")
+    controller.add_item(
+        Item("Water Bottle", "Misc", today, "Gym", "Found", "eve@university.ac.uk")
+    )
+
+    results = controller.get_items_from_last_days(7, status="Found")
+    assert [item.name for item in results] == ["Water Bottle"]
+
+
+def test_get_recent_items(controller: AppController) -> None:
+    """Test that the most recent items are returned newest first."""
+    results = controller.get_recent_items(2)
+    assert [item.name for item in results] == ["MacBook Pro", "Samsung Galaxy 8"]
+
+
+def test_stats(controller: AppController) -> None:
+    """Test that aggregate counts reflect the stored items."""
+    stats = controller.stats()
+    assert stats.total == 4
+    assert stats.by_status == {"Lost": 2, "Found": 1, "Claimed": 1}
+    assert stats.by_category["Electronics"] == 2
+
+
+def test_make_etag(controller: AppController) -> None:
+    """Test that ETags depend on the query and on the data version."""
+    etag = controller.make_etag("items", keyword="keys")
+    assert etag == controller.make_etag("items", keyword="keys", status=None)
+    assert etag != controller.make_etag("items", keyword="jacket")
+
+    controller.delete_item(1)
+    assert etag != controller.make_etag("items", keyword="keys")
+
+
+def test_indexed_search_matches_substring_scan(controller: AppController) -> None:
+    """Test that indexed searches return exactly the substring matches."""
+    items = controller.get_all_items()
+    for keyword in ["book", "BOOK", "ook p", "univ", "a@", "ca", "teria", "rsity.ac"]:
+        expected = [
+            item.id
+            for item in items
+            if keyword.lower() in item.name.lower()
+            or keyword.lower() in item.location.lower()
+            or keyword.lower() in item.contact_info.lower()
+        ]
+        assert [item.id for item in controller.search_items(keyword)] == expected
+
+
+def test_fuzzy_search_tolerates_typos(controller: AppController) -> None:
+    """Test that misspelt names and locations still find items."""
+    assert [item.name for item in controller.fuzzy_search("jackit")] == ["Green Jacket"]
+    assert [item.name for item in controller.fuzzy_search("macbok")] == ["MacBook Pro"]
+    assert [item.name for item in controller.fuzzy_search("cafetria")] == [
+        "MacBook Pro"
+    ]
+    assert controller.fuzzy_search("xylophone") == []
+
+
+def test_fuzzy_search_ranks_exact_matches_first(controller: AppController) -> None:
+    """Test that exact substring matches come before approximate ones."""
+    controller.add_item(
+        Item("Jacket", "Clothing", "2025-01-01", "Gym", "Lost", "d@uni.ac.uk")
+    )
+    controller.add_item(
+        Item("Jackel Toy", "Misc", "2025-01-01", "Gym", "Lost", "e@uni.ac.uk")
+    )
+    names = [item.name for item in controller.fuzzy_search("jacket")]
+    assert names == ["Green Jacket", "Jacket", "Jackel Toy"]
+    assert [
+        item.name for item in controller.fuzzy_search("jacket", category="Misc")
+    ] == ["Jackel Toy"]
+
+
+def test_fuzzy_search_filters_before_ranking(controller: AppController) -> None:
+    """Test that better ranked items of other categories do not hide a match."""
+    controller.db.add_items(
+        [
+            Item("Samsng", "Misc", "2025-01-01", "Samsng", "Lost", "x@uni.ac.uk")
+            for _ in range(FUZZY_CANDIDATES + 100)
+        ]
+    )
+    assert [
+        item.name for item in controller.fuzzy_search("samsng", category="Electronics")
+    ] == ["Samsung Galaxy 8"]
+
+
+def test_fuzzy_search_applies_date_range(controller: AppController) -> None:
+    """Test that fuzzy results honour the date filters, short keywords included."""
+    assert [
+        item.name for item in controller.fuzzy_search("jackit", start_date="2025-01-01")
+    ] == []
+    assert [
+        item.name
+        for item in controller.fuzzy_search(
+            "jackit", start_date="2024-09-01", end_date="2024-09-30"
+        )
+    ] == ["Green Jacket"]
+    assert [
+        item.name for item in controller.fuzzy_search("ke", end_date="2025-01-01")
+    ] == ["Green Jacket"]
+
+
+def search_results(controller: AppController, keyword: str, **filters) -> list:
+    """Runs a search the way the view does and fetches every result."""
+    ids, spans = controller.search_spans(keyword, **filters)
+    return controller.get_results(ids, keyword, spans=spans)
+
+
+def test_search_results_report_match_spans(controller: AppController) -> None:
+    """Test that results carry the offsets of every keyword occurrence."""
+    results = search_results(controller, "book")
+    assert [result.item.name for result in results] == ["MacBook Pro"]
+    assert results[0].spans == {"name": [(3, 7)]}
+
+    results = search_results(controller, "A", category="Clothing")
+    assert results[0].item.name == "Green Jacket"
+    assert results[0].spans["name"] == [(7, 8)]
+    assert results[0].spans["contact_info"][0] == (2, 3)
+    assert "category" not in results[0].spans
+    assert "status" not in results[0].matched_fields
+
+
+def test_search_results_agree_with_search_items(controller: AppController) -> None:
+    """Test that the annotated search returns the same items."""
+    for keyword in ["", "lib", "university", "ca", "zzz"]:
+        assert [
+            result.item for result in search_results(controller, keyword)
+        ] == controller.search_items(keyword)
+        assert list(controller.search_spans(keyword)[0]) == list(
+            controller.search_ids(keyword)
+        )
+
+
+def test_search_results_highlight_other_fields(controller: AppController) -> None:
+    """Test that category and status occurrences are reported for matches."""
+    controller.add_item(
+        Item("Lost and found box", "Misc", "2025-01-01", "Gym", "Lost", "x@uni.ac.uk")
+    )
+    (result,) = search_results(controller, "lost")
+    assert result.matched_fields == ["name", "status"]
+
+
+def test_spans_are_not_found_twice(controller: AppController) -> None:
+    """Test that fetching results reuses the spans found by the search."""
+    ids, spans = controller.search_spans("book")
+    spans[ids[0]]["name"] = [(0, 3)]
+    [result] = controller.get_results(ids, "book", spans=spans)
+    assert result.spans == {"name": [(0, 3)]}
+
+
+def test_search_ids_agree_with_iter_search(controller: AppController) -> None:
+    """Test that ID-only searches verify keywords and sort like full searches."""
+    for keyword in ["", "lib", "university", "ca", "zzz"]:
+        for sort_by in ("id", "name", "status"):
+            ids = controller.search_ids(keyword, sort_by=sort_by, descending=True)
+            assert ids.typecode == "q"
+            assert list(ids) == [
+                item.id
+                for item in controller.iter_search(
+                    keyword, sort_by=sort_by, descending=True
+                )
+            ]
+
+
+def test_get_items_keeps_order_and_marks_missing(controller: AppController) -> None:
+    """Test that items are returned in the requested order, None if deleted."""
+    controller.delete_item(2)
+    assert [item and item.name for item in controller.get_items([3, 2, 1])] == [
+        "Green Jacket",
+        None,
+        "Keys",
+    ]
+
+
+def test_get_results_carry_spans(controller: AppController) -> None:
+    """Test that lazily fetched results carry the same spans as a full search."""
+    [expected] = search_results(controller, "book")
+    ids = controller.search_ids("book")
+    assert controller.get_results(ids, "book") == [expected]
+    assert controller.get_results(ids)[0].spans == {}
+
+
+def test_search_page_sorted_by_name(controller: AppController) -> None:
+    """Test that sorted search pages can be chained with sort values."""
+    everything = sorted(controller.get_all_items(), key=lambda i: i.name.lower())
+    first = controller.search_page("", sort_by="name", limit=2)
+    assert first == everything[:2]
+    second = controller.search_page(
+        "",
+        sort_by="name",
+        limit=2,
+        after_id=first[-1].id,
+        after_value=controller.sort_value(first[-1], "name"),
+    )
+    assert second == everything[2:4]
+
+
+def test_suggest_matches_follows_writes(controller: AppController) -> None:
+    """Test that match suggestions track the controller's own and others' writes."""
+    found = Item(
+        "Keys on ring", "Misc", "2025-10-03", "Library", "Found", "e@uni.ac.uk"
+    )
+    controller.add_item(found)
+    [match] = controller.suggest_matches()
+    assert (match.lost.name, match.found.id) == ("Keys", found.id)
+
+    found.status = "Claimed"
+    controller.update_item(found)
+    assert controller.suggest_matches() == []
+
+    other_writer = DatabaseManager(db_name=controller.db.db_name)
+    other_writer.add_item(
+        Item("House keys", "Misc", "2025-10-02", "Library", "Found", "f@uni.ac.uk")
+    )
+    assert [m.found.name for m in controller.suggest_matches()] == ["House keys"]
+    assert controller.matches_for(match.lost.id)[0].found.name == "House keys"
+
+
+def test_suggest_matches_applies_changes_without_rebuilding(
+    controller: AppController, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the match engine is built once and then fed from the change log."""
+    builds = []
+    iter_items = controller.db.iter_items
+    monkeypatch.setattr(
+        controller.db, "iter_items", lambda **kw: builds.append(kw) or iter_items(**kw)
+    )
+    assert controller.suggest_matches() == []
+    assert len(builds) == 2  # One pass per matchable status.
+
+    other_writer = DatabaseManager(db_name=controller.db.db_name)
+    found_id = other_writer.add_item(
+        Item("House keys", "Misc", "2025-10-02", "Library", "Found", "f@uni.ac.uk")
+    )
+    assert [m.found.id for m in controller.suggest_matches()] == [found_id]
+    other_writer.delete_item(found_id)
+    assert controller.suggest_matches() == []
+    assert len(builds) == 2
+
+    controller.db.prune_changes(controller.db.change_cursor())
+    other_writer.add_item(
+        Item("Car keys", "Misc", "2025-10-02", "Library", "Found", "g@uni.ac.uk")
+    )
+    controller.db.prune_changes(controller.db.change_cursor())
+    assert [m.found.name for m in controller.suggest_matches()] == ["Car keys"]
+    assert len(builds) == 4
@@ -0,0 +1,137 @@
+import sqlite3
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.controllers.app_controller import AppController
+from src.controllers.archiver import Archiver
+from src.models.database import DatabaseManager
+from src.models.item import Item
+from src.utils.dates import DATE_FORMAT
+
+
+@pytest.fixture(name="controller")
+def controller_fixture(tmp_path: Path) -> AppController:
+    """Fixture providing an AppController on a temporary database."""
+    return AppController(DatabaseManager(db_name=str(tmp_path / "test_archive.db")))
+
+
+def days_ago(days: int) -> str:
+    """Returns the date ``days`` days before today."""
+    return (date.today() - timedelta(days=days)).strftime(DATE_FORMAT)
+
+
+def add(controller: AppController, name: str, status: str, age_days: int) -> Item:
+    """Adds an item with the given status and age."""
+    item = Item(name, "Keys", days_ago(age_days), "Library", status, "a@uni.ac.uk")
+    controller.add_item(item)
+    return item
+
+
+def test_archives_only_old_claimed_items(controller: AppController) -> None:
+    """Test that recent or unclaimed items stay in the live table."""
+    old_claimed = add(controller, "Old claimed", "Claimed", 800)
+    add(controller, "New claimed", "Claimed", 10)
+    add(controller, "Old lost", "Lost", 800)
+
+    assert Archiver(controller, max_age_days=365).archive_all() == 1
+
+    live = {item.name for item in controller.get_all_items()}
+    assert live == {"New claimed", "Old lost"}
+    assert controller.get_item(old_claimed.id) is None
+    archived = controller.get_item(old_claimed.id, include_archive=True)
+    assert archived is not None and archived.name == "Old claimed"
+
+
+def test_archive_is_opt_in_for_queries(controller: AppController) -> None:
+    """Test that searches and filters include archived items only on request."""
+    add(controller, "Blue umbrella", "Claimed", 800)
+    add(controller, "Red umbrella", "Claimed", 5)
+    Archiver(controller).archive_all()
+
+    assert [i.name for i in controller.search_items("umbrella")] == ["Red umbrella"]
+    assert [
+        i.name for i in controller.search_items("umbrella", include_archive=True)
+    ] == ["Blue umbrella", "Red umbrella"]
+    assert len(controller.filter_items(status="Claimed")) == 1
+    assert (
+        len(
+            controller.filter_items(
+                status="Claimed", end_date=days_ago(100), include_archive=True
+            )
+        )
+        == 1
+    )
+    assert len(controller.get_all_items(include_archive=True)) == 2
+
+
+def test_archives_in_batches(controller: AppController) -> None:
+    """Test that each batch moves at most batch_size items."""
+    for n in range(7):
+        add(controller, f"Item {n}", "Claimed", 400 + n)
+    archiver = Archiver(controller, batch_size=3)
+
+    assert archiver.archive_batch() == 3
+    assert len(controller.get_all_items()) == 4
+    assert archiver.archive_all() == 4
+    assert controller.get_all_items() == []
+
+
+def test_stats_count_archived_items(controller: AppController) -> None:
+    """Test that archiving does not change the aggregate counts."""
+    add(controller, "Old claimed", "Claimed", 800)
+    add(controller, "Lost", "Lost", 1)
+    before = controller.stats()
+
+    Archiver(controller).archive_all()
+
+    assert controller.stats() == before
+
+
+def test_background_thread_drains_backlog(controller: AppController) -> None:
+    """Test that a started archiver archives without explicit calls."""
+    for n in range(5):
+        add(controller, f"Item {n}", "Claimed", 500)
+
+    with Archiver(controller, batch_size=2, interval=0.01):
+        for _ in range(200):
+            if not controller.get_all_items():
+                break
+            time.sleep(0.01)
+
+    assert controller.get_all_items() == []
+    assert len(controller.get_all_items(include_archive=True)) == 5
+
+
+def test_background_thread_survives_database_errors(
+    controller: AppController, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed pass is retried on the next check."""
+    add(controller, "Old claimed", "Claimed", 800)
+    archive = controller.archive_claimed_items
+    failures = []
+
+    def flaky(older_than_days: int, limit: int) -> int:
+        if not failures:
+            failures.append(True)
+            raise sqlite3.OperationalError("database is locked")
+        return archive(older_than_days, limit)
+
+    monkeypatch.setattr(controller, "archive_claimed_items", flaky)
+    with Archiver(controller, interval=0.01):
+        for _ in range(200):
+            if not controller.get_all_items():
+                break
+            time.sleep(0.01)
+
+    assert failures and controller.get_all_items() == []
+
+
+def test_archived_ids(controller: AppController) -> None:
+    """Test that archived items can be told apart from live ones."""
+    old = add(controller, "Old claimed", "Claimed", 800)
+    live = add(controller, "Lost", "Lost", 800)
+    Archiver(controller).archive_all()
+    assert controller.archived_ids([old.id, live.id, 999]) == {old.id}
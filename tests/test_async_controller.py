@@ -0,0 +1,185 @@
+import asyncio
+from pathlib import Path
+import sqlite3
+import threading
+
+import pytest
+
+from src.controllers.app_controller import AppController
+from src.controllers.async_controller import AsyncAppController
+from src.models.database import DatabaseManager, DuplicateError
+from src.models.item import Item
+
+
+@pytest.fixture(name="controller")
+def app_controller(tmp_path: Path) -> AppController:
+    """Fixture providing an AppController on a temporary database with 25 items."""
+    controller = AppController(DatabaseManager(str(tmp_path / "test_async.db")))
+    for i in range(25):
+        location = "Library" if i % 2 else "Gym"
+        controller.add_item(
+            Item(f"Item {i}", "Misc", "2025-10-01", location, "Lost", "a@uni.ac.uk")
+        )
+    return controller
+
+
+def test_crud_and_search(controller: AppController) -> None:
+    """Test that awaitable CRUD and search calls reach the database."""
+
+    async def scenario() -> None:
+        async with AsyncAppController(controller, max_workers=2) as facade:
+            item = Item(
+                "Scarf", "Clothing", "2025-10-02", "Gym", "Found", "b@uni.ac.uk"
+            )
+            item_id = await facade.add_item(item)
+            assert (await facade.get_item(item_id)).name == "Scarf"
+
+            item.status = "Claimed"
+            assert await facade.update_item(item) is True
+            results = await facade.search_items("scarf", status="Claimed")
+            assert [found.id for found in results] == [item_id]
+
+            assert await facade.delete_item(item_id) is True
+            assert await facade.get_item(item_id) is None
+            assert (await facade.stats()).total == 25
+
+    asyncio.run(scenario())
+
+
+def test_stream_search_pages_through_results(controller: AppController) -> None:
+    """Test that streaming yields every match exactly once across pages."""
+
+    async def scenario() -> list:
+        async with AsyncAppController(controller) as facade:
+            return [
+                item.id async for item in facade.stream_search("library", page_size=4)
+            ]
+
+    ids = asyncio.run(scenario())
+    assert len(ids) == 12
+    assert ids == sorted(set(ids))
+
+
+def test_concurrent_calls_use_bounded_workers(controller: AppController) -> None:
+    """Test that many concurrent calls never run on more than max_workers threads."""
+    threads = set()
+    original = controller.search_items
+
+    def recording_search(*args, **kwargs):
+        threads.add(threading.get_ident())
+        return original(*args, **kwargs)
+
+    controller.search_items = recording_search
+
+    async def scenario() -> list:
+        async with AsyncAppController(controller, max_workers=3) as facade:
+            return await asyncio.gather(
+                *(facade.search_items("item") for _ in range(30))
+            )
+
+    results = asyncio.run(scenario())
+    assert all(len(result) == 25 for result in results)
+    assert 1 <= len(threads) <= 3
+    assert threading.get_ident() not in threads
+
+
+def test_cancelled_call_waiting_for_worker_never_runs(
+    controller: AppController,
+) -> None:
+    """Test that cancelling a queued call prevents it from running."""
+    release = threading.Event()
+    deleted = []
+
+    def blocking_get_all(include_archive=False):
+        release.wait(5)
+        return []
+
+    def recording_delete(item_id):
+        deleted.append(item_id)
+        return True
+
+    controller.get_all_items = blocking_get_all
+    controller.delete_item = recording_delete
+
+    async def scenario() -> None:
+        async with AsyncAppController(controller, max_workers=1) as facade:
+            busy = asyncio.create_task(facade.get_all_items())
+            await asyncio.sleep(0.05)
+            queued = asyncio.create_task(facade.delete_item(1))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            release.set()
+            await busy
+
+    asyncio.run(scenario())
+    assert deleted == []
+
+
+def test_facade_mirrors_controller_options(controller: AppController) -> None:
+    """Test that archive, sort and duplicate options reach the controller."""
+
+    async def scenario() -> None:
+        async with AsyncAppController(controller, max_workers=2) as facade:
+            duplicate = Item(
+                "Item 3", "Misc", "2025-10-01", "Library", "Lost", "c@uni.ac.uk"
+            )
+            with pytest.raises(DuplicateError):
+                await facade.add_item(duplicate, allow_duplicates=False)
+
+            streamed = [
+                item.name
+                async for item in facade.stream_search(
+                    "item", sort_by="name", descending=True, page_size=4
+                )
+            ]
+            assert streamed == [
+                item.name
+                for item in controller.iter_search(
+                    "item", sort_by="name", descending=True
+                )
+            ]
+
+            controller.update_item(
+                Item(
+                    "Item 0",
+                    "Misc",
+                    "2020-01-01",
+                    "Gym",
+                    "Claimed",
+                    "a@uni.ac.uk",
+                    id=1,
+                )
+            )
+            assert controller.db.archive_claimed_items("2021-01-01", 10) == 1
+            assert await facade.get_item(1) is None
+            assert (await facade.get_item(1, include_archive=True)).status == "Claimed"
+            page = await facade.search_page("item 0", include_archive=True)
+            assert [item.id for item in page] == [1]
+
+    asyncio.run(scenario())
+
+
+def test_aclose_closes_every_worker_connection(controller: AppController) -> None:
+    """Test that shutting down closes the connection of every worker thread."""
+    opened = []
+    connect = controller.db._connect
+
+    def recording_connect():
+        conn = connect()
+        opened.append(conn)
+        return conn
+
+    controller.db._connect = recording_connect
+
+    async def scenario() -> None:
+        facade = AsyncAppController(controller, max_workers=3)
+        await asyncio.gather(*(facade.search_items("item") for _ in range(12)))
+        await facade.aclose()
+
+    asyncio.run(scenario())
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
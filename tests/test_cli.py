@@ -0,0 +1,146 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from src import cli
+from src.models.database import DatabaseManager
+from src.models.item import Item
+
+
+@pytest.fixture(name="db_name")
+def db_name_fixture(tmp_path: Path) -> str:
+    """Fixture providing a database path with two stored items."""
+    db_name = str(tmp_path / "cli.db")
+    DatabaseManager(db_name).add_items(
+        [
+            Item(
+                "Blue Umbrella", "Misc", "2025-10-01", "Library", "Lost", "a@uni.ac.uk"
+            ),
+            Item(
+                "MacBook Pro",
+                "Electronics",
+                "2025-10-02",
+                "Gym",
+                "Found",
+                "b@uni.ac.uk",
+            ),
+        ]
+    )
+    return db_name
+
+
+def run(db_name: str, *args: str) -> str:
+    """Runs the CLI, asserts success and returns its output."""
+    out = io.StringIO()
+    assert cli.main(["--db", db_name, *args], stdout=out) == 0
+    return out.getvalue()
+
+
+def test_add_prints_new_id(db_name: str) -> None:
+    """Test that add stores an item and prints its ID."""
+    output = run(
+        db_name,
+        "add",
+        "--name",
+        "Keys",
+        "--category",
+        "Misc",
+        "--date",
+        "2025-01-01",
+        "--location",
+        "Gym",
+        "--status",
+        "Lost",
+        "--contact",
+        "c@uni.ac.uk",
+    )
+    assert DatabaseManager(db_name).get_item(int(output)).name == "Keys"
+
+
+def test_query_streams_matches(db_name: str) -> None:
+    """Test that query filters and formats the matching rows."""
+    lines = run(db_name, "query", "umbrella", "--format", "jsonl").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["Blue Umbrella"]
+
+    output = run(db_name, "query", "--sort", "date", "--desc", "--limit", "1")
+    assert output.split("\t")[1] == "MacBook Pro"
+
+
+def test_export_and_import_round_trip(db_name: str, tmp_path: Path) -> None:
+    """Test that an exported CSV imports into another database unchanged."""
+    export_path = tmp_path / "items.csv"
+    run(db_name, "export", str(export_path))
+    target = str(tmp_path / "target.db")
+
+    assert run(target, "import", str(export_path)) == "imported 2 items, skipped 0\n"
+    names = [item.name for item in DatabaseManager(target).get_all_items()]
+    assert names == ["Blue Umbrella", "MacBook Pro"]
+
+
+def test_import_rejects_or_skips_invalid_records(
+    db_name: str, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """Test that invalid records abort the import unless skipping is requested."""
+    path = tmp_path / "items.jsonl"
+    good = {
+        "name": "Hat",
+        "category": "Clothing",
+        "date": "2025-01-01",
+        "location": "Gym",
+        "status": "Lost",
+        "contact_info": "d@uni.ac.uk",
+    }
+    bad = [{**good, "status": "Stolen"}, {**good, "date": "01/01/2025"}]
+    path.write_text("".join(json.dumps(record) + "\n" for record in [good, *bad]))
+
+    assert cli.main(["--db", db_name, "import", str(path)], stdout=io.StringIO()) == 1
+    err = capsys.readouterr().err
+    assert "record 2" in err and "record 3" in err
+    assert "2 invalid records" in err
+
+    output = run(db_name, "import", str(path), "--skip-invalid")
+    assert output == "imported 1 items, skipped 2\n"
+
+
+def test_unreadable_database_is_reported(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """Test that a database that cannot be opened fails with an error message."""
+    path = tmp_path / "garbage.db"
+    path.write_bytes(b"not a database" * 100)
+    assert cli.main(["--db", str(path), "stats"], stdout=io.StringIO()) == 1
+    assert capsys.readouterr().err.startswith("lostfound: error: ")
+
+
+def test_import_can_skip_duplicates(db_name: str, tmp_path: Path) -> None:
+    """Test that records matching a stored report are skipped on request."""
+    path = tmp_path / "items.jsonl"
+    record = {
+        "name": "blue umbrella!",
+        "category": "Misc",
+        "date": "2025-10-01",
+        "location": "library",
+        "status": "Found",
+        "contact_info": "e@uni.ac.uk",
+    }
+    path.write_text(
+        json.dumps(record) + "\n" + json.dumps({**record, "name": "Hat"}) + "\n"
+    )
+
+    output = run(db_name, "import", str(path), "--skip-duplicates")
+    assert output == "imported 1 items, skipped 0, duplicates 1\n"
+    assert len(DatabaseManager(db_name).get_all_items()) == 3
+
+
+def test_stats_and_maintenance(db_name: str) -> None:
+    """Test the stats output and the maintenance tasks."""
+    assert json.loads(run(db_name, "stats", "--json"))["total"] == 2
+    assert "status:Lost\t1" in run(db_name, "stats")
+    assert run(db_name, "maintenance", "check") == "ok\n"
+    assert run(db_name, "maintenance", "archive", "--days", "0") == "archived 0 items\n"
+    run(db_name, "maintenance", "optimize")
+    run(db_name, "maintenance", "vacuum")
+    assert run(db_name, "maintenance", "checkpoint").startswith("checkpointed")
+    assert run(db_name, "maintenance", "changes") == "removed 0 change log entries\n"
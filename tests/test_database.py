@@ -4,7 +4,12 @@ from typing import Generator
 
 import pytest
 
-from src.models.database import DatabaseManager
+from src.models.database import (
+    ChangeLogExpiredError,
+    ConflictError,
+    DatabaseManager,
+    DuplicateError,
+)
 from src.models.item import Item
 
 
@@ -17,11 +22,11 @@ def db_fixture(tmp_path: Path) -> Generator[DatabaseManager, None, None]:
     Yields:
         Iterator[DatabaseManager]: An initialized database manager hooked to ':memory:'
     """
-    temp_db_path = tmp_path / 'test_lost_and_found.db'
-    
+    temp_db_path = tmp_path / "test_lost_and_found.db"
+
     manager = DatabaseManager(db_name=str(temp_db_path))
     yield manager
-    
+
 
 @pytest.fixture(name="item")
 def sample_item() -> Item:
@@ -32,21 +37,19 @@ def sample_item() -> Item:
         date="2025-11-25",
         location="Cafeteria",
         status="Lost",
-        contact_info="jane.doe@university.ac.uk"
+        contact_info="jane.doe@university.ac.uk",
     )
-    
+
 
 def test_database_initialization(db: DatabaseManager) -> None:
     """Test that hte database and items table are created correctly."""
-    with sqlite3.connect(db.db_name) as conn: # connect directly to schema
+    with sqlite3.connect(db.db_name) as conn:  # connect directly to schema
         cursor = conn.cursor()
-        cursor.execute(
-            """
+        cursor.execute("""
             SELECT name FROM sqlite_master
             WHERE type='table'
             AND name='items'
-            """
-        )
+            """)
         table_exists = cursor.fetchone()
         assert table_exists is not None, "The 'items' table was not properly created."
 
@@ -56,23 +59,23 @@ def test_add_and_get_item(db: DatabaseManager, item: Item) -> None:
     # Create
     item_id = db.add_item(item)
     assert item_id > 0, "add_item should return a valid database ID greater than 0"
-    
+
     # Read
     items = db.get_all_items()
     assert len(items) == 1
-    
+
     fetched_item = items[0]
     assert fetched_item.id == item_id
     assert fetched_item.name == item.name
     assert fetched_item.status == item.status
-    
+
 
 def test_get_all_items_empty(db: DatabaseManager) -> None:
     """Test fetching items from an empty database."""
     items = db.get_all_items()
     assert isinstance(items, list)
     assert len(items) == 0
-    
+
 
 def test_update_item_success(db: DatabaseManager, item: Item) -> None:
     """Test updating an existing item's details."""
@@ -81,35 +84,468 @@ def test_update_item_success(db: DatabaseManager, item: Item) -> None:
     item_to_update = db.get_all_items()[0]
     item_to_update.status = "Found"
     item_to_update.location = "Security Desk"
-    
+
     success = db.update_item(item_to_update)
     assert success is True, "update_item should return True on successful update."
-    
+
     updated_item = db.get_all_items()[0]
     assert updated_item.status == "Found"
     assert updated_item.location == "Security Desk"
-    
+
 
 def test_update_item_not_found(db: DatabaseManager, item: Item) -> None:
     """Test updating an item that odes not exist in the database."""
     item.id = 999
     success = db.update_item(item)
     assert success is False, "update_item should return False if the ID does not exist."
-    
+
 
 def test_delete_item_success(db: DatabaseManager, item: Item) -> None:
     """Test deleting an existing item."""
     item_id = db.add_item(item)
-    
+
     assert len(db.get_all_items()) == 1
-    
+
     success = db.delete_item(item_id)
     assert success is True
-    
+
     assert len(db.get_all_items()) == 0
-    
-    
+
+
 def test_delete_item_not_found(db: DatabaseManager) -> None:
     """Test deleting an item ID that does not exist."""
     success = db.delete_item(9999)
     assert success is False, "delete_item should return False if ID does not exist."
+
+
+def _add_dated_items(db: DatabaseManager) -> None:
+    """Inserts a small set of items spread over several dates."""
+    for name, date, status in [
+        ("Umbrella", "2025-01-05", "Lost"),
+        ("Scarf", "2025-02-10", "Found"),
+        ("Laptop", "2025-03-15", "Found"),
+        ("Wallet", "2025-03-20", "Claimed"),
+    ]:
+        db.add_item(Item(name, "Misc", date, "Library", status, "a@uni.ac.uk"))
+
+
+def test_filter_items_by_date_range(db: DatabaseManager) -> None:
+    """Test that date bounds are inclusive and combine with other filters."""
+    _add_dated_items(db)
+
+    results = db.filter_items(start_date="2025-02-10", end_date="2025-03-15")
+    assert [item.name for item in results] == ["Scarf", "Laptop"]
+
+    results = db.filter_items(status="Found", start_date="2025-03-01")
+    assert [item.name for item in results] == ["Laptop"]
+
+
+def test_filter_items_rejects_malformed_date(db: DatabaseManager) -> None:
+    """Test that a malformed date bound raises a ValueError."""
+    with pytest.raises(ValueError):
+        db.filter_items(start_date="10/02/2025")
+
+
+def test_get_recent_items(db: DatabaseManager) -> None:
+    """Test that the most recently dated items are returned newest first."""
+    _add_dated_items(db)
+
+    results = db.get_recent_items(2)
+    assert [item.name for item in results] == ["Wallet", "Laptop"]
+
+    results = db.get_recent_items(5, status="Lost")
+    assert [item.name for item in results] == ["Umbrella"]
+
+
+def test_date_queries_use_index(db: DatabaseManager) -> None:
+    """Test that range queries are planned against the day number index."""
+    with sqlite3.connect(db.db_name) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN "
+            "SELECT id FROM items WHERE date_num >= ? AND date_num <= ?",
+            (1, 2),
+        ).fetchall()
+    assert any("idx_items_date_num" in row[-1] for row in plan)
+
+
+def test_stats_follow_writes(db: DatabaseManager) -> None:
+    """Test that the summary counts are kept up to date by every write."""
+    _add_dated_items(db)
+    stats = db.stats()
+    assert stats.total == 4
+    assert stats.by_status == {"Lost": 1, "Found": 2, "Claimed": 1}
+    assert stats.by_category == {"Misc": 4}
+    assert stats.by_day["2025-03-15"] == 1
+
+    laptop = db.filter_items(start_date="2025-03-15", end_date="2025-03-15")[0]
+    laptop.status = "Claimed"
+    laptop.category = "Electronics"
+    db.update_item(laptop)
+    umbrella = db.filter_items(status="Lost")[0]
+    db.delete_item(umbrella.id)
+
+    stats = db.stats()
+    assert stats.total == 3
+    assert stats.by_status == {"Found": 1, "Claimed": 2}
+    assert stats.by_category == {"Misc": 2, "Electronics": 1}
+    assert "2025-01-05" not in stats.by_day
+
+
+def test_stats_empty(db: DatabaseManager) -> None:
+    """Test statistics for an empty database."""
+    stats = db.stats()
+    assert stats.total == 0
+    assert stats.by_status == {}
+    assert stats.by_day == {}
+
+
+def test_data_version_increases_on_every_write(db: DatabaseManager, item: Item) -> None:
+    """Test that inserts, updates and deletes each bump the data version."""
+    versions = [db.data_version()]
+    item_id = db.add_item(item)
+    versions.append(db.data_version())
+    item.status = "Found"
+    db.update_item(item)
+    versions.append(db.data_version())
+    db.delete_item(item_id)
+    versions.append(db.data_version())
+
+    assert versions == sorted(set(versions))
+    db.delete_item(item_id)
+    assert db.data_version() == versions[-1], "no-op writes keep the version"
+
+
+def test_update_increments_version(db: DatabaseManager, item: Item) -> None:
+    """Test that every update bumps the stored and in-memory row version."""
+    db.add_item(item)
+    assert item.version == 1
+
+    db.update_item(item)
+    db.update_item(item)
+    assert item.version == 3
+    assert db.get_item(item.id).version == 3
+
+
+def test_update_with_expected_version(db: DatabaseManager, item: Item) -> None:
+    """Test that a stale expected version raises a ConflictError."""
+    db.add_item(item)
+    first_copy = db.get_item(item.id)
+    second_copy = db.get_item(item.id)
+
+    first_copy.status = "Found"
+    assert db.update_item(first_copy, expected_version=first_copy.version) is True
+
+    second_copy.location = "Gym"
+    with pytest.raises(ConflictError) as excinfo:
+        db.update_item(second_copy, expected_version=second_copy.version)
+    assert excinfo.value.expected_version == 1
+    assert excinfo.value.current_version == 2
+
+    stored = db.get_item(item.id)
+    assert stored.status == "Found"
+    assert stored.location == "Cafeteria"
+
+
+def test_update_with_expected_version_missing_item(
+    db: DatabaseManager, item: Item
+) -> None:
+    """Test that a versioned update of a missing item returns False."""
+    item.id = 999
+    assert db.update_item(item, expected_version=1) is False
+
+
+def test_trigram_index_follows_writes(db: DatabaseManager, item: Item) -> None:
+    """Test that the contains filter sees inserts, updates and deletes."""
+    db.add_item(item)
+    assert [i.id for i in db.iter_items(contains="beanie")] == [item.id]
+    assert [i.id for i in db.iter_items(contains="feteri")] == [item.id]
+
+    item.name = "Red Scarf"
+    db.update_item(item)
+    assert list(db.iter_items(contains="beanie")) == []
+    assert [i.id for i in db.iter_items(contains="scarf")] == [item.id]
+
+    db.delete_item(item.id)
+    assert list(db.iter_items(contains="scarf")) == []
+
+
+def test_trigram_index_is_used_for_contains(db: DatabaseManager) -> None:
+    """Test that contains queries only read rows sharing the trigrams."""
+    db.add_items(
+        [
+            Item(f"Thing {n}", "Misc", "2025-10-01", "Gym", "Lost", "a@uni.ac.uk")
+            for n in range(50)
+        ]
+        + [Item("MacBook", "Electronics", "2025-10-01", "Gym", "Lost", "a@uni.ac.uk")]
+    )
+    with sqlite3.connect(db.db_name) as conn:
+        matches = conn.execute(
+            "SELECT rowid FROM items_fts WHERE items_fts MATCH ?", ('"book"',)
+        ).fetchall()
+    assert len(matches) == 1
+    assert [i.name for i in db.iter_items(contains="book")] == ["MacBook"]
+
+
+def test_short_or_non_ascii_contains_is_ignored(
+    db: DatabaseManager, item: Item
+) -> None:
+    """Test that texts the index cannot answer fall back to all candidates."""
+    db.add_item(item)
+    assert len(list(db.iter_items(contains="zz"))) == 1
+    assert len(list(db.iter_items(contains="ñandú"))) == 1
+
+
+@pytest.mark.parametrize(
+    "sort_by", ["name", "category", "date", "status", "contact_info", "id"]
+)
+@pytest.mark.parametrize("descending", [False, True])
+def test_sorted_keyset_pages_match_full_sort(
+    db: DatabaseManager, sort_by: str, descending: bool
+) -> None:
+    """Test that paging a sorted listing yields exactly the sorted items."""
+    names = ["delta", "Alpha", "charlie", "alpha", "Bravo", "echo", "bravo"]
+    db.add_items(
+        [
+            Item(
+                name,
+                ["Misc", "keys", "Bags", "misc"][n % 4],
+                f"2025-0{n % 3 + 1}-01",
+                "Gym",
+                ["Lost", "Found"][n % 2],
+                f"{name}@uni.ac.uk",
+            )
+            for n, name in enumerate(names)
+        ]
+    )
+
+    def key(item: Item):
+        value = DatabaseManager.sort_value(item, sort_by)
+        return (value.lower() if isinstance(value, str) else value, item.id)
+
+    expected = sorted(db.get_all_items(), key=key, reverse=descending)
+    assert list(db.iter_items(sort_by=sort_by, descending=descending)) == expected
+    assert (
+        list(db.iter_items(sort_by=sort_by, descending=descending, batch_size=2))
+        == expected
+    )
+
+    after = expected[2]
+    resumed = db.iter_items(
+        sort_by=sort_by,
+        descending=descending,
+        after_id=after.id,
+        after_value=DatabaseManager.sort_value(after, sort_by),
+    )
+    assert list(resumed) == expected[3:]
+
+
+def test_sorted_pages_seek_the_sort_index(db: DatabaseManager) -> None:
+    """Test that deep sorted pages are planned as index range searches."""
+    with sqlite3.connect(db.db_name) as conn:
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN SELECT id FROM items
+            WHERE COALESCE(date_num, 0) <= ? AND (COALESCE(date_num, 0), id) < (?, ?)
+            ORDER BY COALESCE(date_num, 0) DESC, id DESC LIMIT 10
+            """,
+            (1, 1, 1),
+        ).fetchall()
+    assert any("SEARCH" in row[-1] and "idx_items_sort_date" in row[-1] for row in plan)
+    assert not any("TEMP B-TREE" in row[-1] for row in plan)
+
+
+def test_category_and_status_are_stored_as_codes(
+    db: DatabaseManager, item: Item
+) -> None:
+    """Test that category and status live in lookup tables, not in every row."""
+    db.add_item(item)
+    with sqlite3.connect(db.db_name) as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(items)")]
+        category = conn.execute(
+            "SELECT name FROM categories WHERE id = (SELECT category_id FROM items)"
+        ).fetchone()[0]
+        statuses = [
+            row[0] for row in conn.execute("SELECT name FROM statuses ORDER BY id")
+        ]
+    assert "category" not in columns and "status" not in columns
+    assert category == "Accessories"
+    assert statuses == ["Lost", "Found", "Claimed"]
+    assert db.get_item(item.id) == item
+
+
+def test_code_filters_use_code_indexes(db: DatabaseManager) -> None:
+    """Test that category and status filters are integer index searches."""
+    with sqlite3.connect(db.db_name) as conn:
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN SELECT id FROM items
+            WHERE category_id = ? AND status_id = ? ORDER BY id
+            """,
+            (1, 1),
+        ).fetchall()
+    assert any(
+        "SEARCH" in row[-1] and "idx_items_category_status" in row[-1] for row in plan
+    )
+
+
+def test_new_codes_are_seen_by_other_managers(db: DatabaseManager, item: Item) -> None:
+    """Test that a cached code table reloads when another writer adds a name."""
+    other = DatabaseManager(db_name=db.db_name)
+    assert db.filter_items(category="Pets") == []
+    pet = Item("Cat", "Pets", "2025-10-01", "Quad", "Found", "a@b.c")
+    other.add_item(pet)
+    assert db.filter_items(category="Pets") == [pet]
+    assert db.get_item(pet.id).category == "Pets"
+
+
+def test_failed_write_does_not_cache_its_code(db: DatabaseManager, item: Item) -> None:
+    """Test that a code added by a rolled back write is never decoded."""
+    db.add_item(item)
+    item.category = "Pets"
+    [error] = db.write_batch([("update", (item, item.version + 1))])
+    assert isinstance(error, ConflictError)
+    assert db.filter_items(category="Pets") == []
+    keys = Item("Keys", "Keys", "2025-10-01", "Quad", "Lost", "a@b.c")
+    db.add_item(keys)
+    assert db.get_item(keys.id).category == "Keys"
+
+
+def test_find_duplicates_ignores_case_and_punctuation(db: DatabaseManager) -> None:
+    """Test that reports differing only in spelling details are duplicates."""
+    first = Item("Blue Umbrella", "Misc", "2025-10-01", "Main Hall", "Lost", "a@b.c")
+    db.add_item(first)
+    again = Item(
+        " blue  umbrella!", "misc", "2025-10-01", "main hall", "Found", "x@y.z"
+    )
+    other_day = Item(
+        "Blue Umbrella", "Misc", "2025-10-02", "Main Hall", "Lost", "a@b.c"
+    )
+
+    assert db.find_duplicates(again) == [first]
+    assert db.find_duplicates(first) == []
+    assert db.find_duplicates(other_day) == []
+
+
+def test_add_item_can_reject_duplicates(db: DatabaseManager, item: Item) -> None:
+    """Test that a duplicate is only refused when asked to."""
+    db.add_item(item)
+    copy = Item(item.name, item.category, item.date, item.location, "Found", "x@y.z")
+    with pytest.raises(DuplicateError) as excinfo:
+        db.add_item(copy, allow_duplicates=False)
+    assert excinfo.value.duplicate_ids == [item.id]
+    assert db.add_item(copy) > item.id
+
+
+def test_add_items_skips_duplicates_within_and_across_batches(
+    db: DatabaseManager, item: Item
+) -> None:
+    """Test that bulk imports can leave out stored and repeated reports."""
+    db.add_item(item)
+
+    def copy() -> Item:
+        return Item(item.name, item.category, item.date, item.location, "Lost", "x@y.z")
+
+    new = Item("Scarf", "Clothing", "2025-10-01", "Gym", "Found", "x@y.z")
+    again = Item("Scarf", "Clothing", "2025-10-01", "Gym", "Found", "x@y.z")
+    ids = db.add_items([copy(), new, again], skip_duplicates=True)
+    assert ids == [new.id]
+    assert again.id is None
+
+
+def test_duplicate_hash_follows_updates(db: DatabaseManager, item: Item) -> None:
+    """Test that an edited item is found under its new details."""
+    db.add_item(item)
+    item.name = "Gold Ring"
+    db.update_item(item)
+    probe = Item("gold ring", item.category, item.date, item.location, "Found", "x@y.z")
+    assert [found.id for found in db.find_duplicates(probe)] == [item.id]
+    with sqlite3.connect(db.db_name) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM items WHERE duplicate_hash = ?", (1,)
+        ).fetchall()
+    assert any("idx_items_duplicate_hash" in row[-1] for row in plan)
+
+
+def test_iter_items_rejects_unknown_sort_key(db: DatabaseManager) -> None:
+    """Test that only the supported sort keys are accepted."""
+    with pytest.raises(ValueError):
+        list(db.iter_items(sort_by="name; DROP TABLE items"))
+
+
+def test_changes_since_returns_latest_state_once(
+    db: DatabaseManager, item: Item
+) -> None:
+    """Test that a sync page lists each changed item once, as it is now."""
+    cursor = db.change_cursor()
+    other = Item("Scarf", "Clothing", "2025-10-01", "Gym", "Found", "x@y.z")
+    db.add_items([item, other])
+    item.location = "Library"
+    db.update_item(item)
+    db.delete_item(other.id)
+
+    change_set = db.changes_since(cursor)
+    assert [(c.item_id, c.deleted) for c in change_set.changes] == [
+        (item.id, False),
+        (other.id, True),
+    ]
+    assert change_set.changes[0].item == item
+    assert change_set.next_seq == db.change_cursor()
+    assert not change_set.has_more
+    assert db.changes_since(change_set.next_seq).changes == []
+
+
+def test_changes_since_pages_through_the_log(db: DatabaseManager) -> None:
+    """Test that following next_seq visits every change exactly once."""
+    ids = db.add_items(
+        [
+            Item(f"Item {i}", "Misc", "2025-10-01", "Gym", "Lost", "x@y.z")
+            for i in range(7)
+        ]
+    )
+    seen, since, has_more = [], 0, True
+    while has_more:
+        change_set = db.changes_since(since, limit=3)
+        seen += [change.item_id for change in change_set.changes]
+        since, has_more = change_set.next_seq, change_set.has_more
+    assert seen == ids
+
+
+def test_archived_items_are_logged_as_archived(db: DatabaseManager) -> None:
+    """Test that moving an item to the archive does not reach mirrors as a deletion."""
+    claimed = Item("Keys", "Keys", "2020-01-01", "Quad", "Claimed", "a@b.c")
+    db.add_item(claimed)
+    cursor = db.change_cursor()
+    assert db.archive_claimed_items("2021-01-01", 10) == 1
+    [change] = db.changes_since(cursor).changes
+    assert change.item == claimed and change.archived and not change.deleted
+    [change] = db.changes_since(0).changes
+    assert change.archived
+
+
+def test_compact_and_prune_changes(db: DatabaseManager, item: Item) -> None:
+    """Test that compaction keeps cursors valid and pruning expires old ones."""
+    db.add_item(item)
+    for location in ("Library", "Gym", "Quad"):
+        item.location = location
+        db.update_item(item)
+    before = db.changes_since(0)
+
+    assert db.compact_changes(batch_size=2) == 3
+    assert db.changes_since(0) == before
+    latest = db.change_cursor()
+    assert db.prune_changes(latest) == 1
+    assert db.change_cursor() == latest
+    assert db.changes_since(latest).changes == []
+    with pytest.raises(ChangeLogExpiredError):
+        db.changes_since(0)
+
+
+def test_iter_rows_reads_only_requested_fields(db: DatabaseManager, item: Item) -> None:
+    """Test that ID listings carry just the ID and the named fields."""
+    db.add_item(item)
+    assert list(db.iter_rows()) == [(item.id,)]
+    assert list(db.iter_rows(("name", "location"), sort_by="category")) == [
+        (item.id, item.name, item.location)
+    ]
+    with pytest.raises(ValueError):
+        list(db.iter_rows(("version",)))
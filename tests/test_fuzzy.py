@@ -0,0 +1,41 @@
+import pytest
+
+from src.utils.fuzzy import best_word_distance, edit_distance, trigrams
+
+
+def test_trigrams() -> None:
+    """Test that trigrams are distinct and kept in order."""
+    assert trigrams("samsng") == ["sam", "ams", "msn", "sng"]
+    assert trigrams("aaaa") == ["aaa"]
+    assert trigrams("ab") == []
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        ("", "", 0),
+        ("abc", "", 3),
+        ("samsng", "samsung", 1),
+        ("jackit", "jacket", 1),
+        ("kitten", "sitting", 3),
+        ("flaw", "lawn", 2),
+    ],
+)
+def test_edit_distance(a: str, b: str, expected: int) -> None:
+    """Test the Levenshtein distance on known pairs, in both orders."""
+    assert edit_distance(a, b) == expected
+    assert edit_distance(b, a) == expected
+
+
+def test_edit_distance_stops_at_max_distance() -> None:
+    """Test that distances beyond the bound are reported as bound + 1."""
+    assert edit_distance("kitten", "sitting", max_distance=1) == 2
+    assert edit_distance("a", "abcdef", max_distance=2) == 3
+    assert edit_distance("samsng", "samsung", max_distance=1) == 1
+
+
+def test_best_word_distance() -> None:
+    """Test matching a query against runs of words."""
+    assert best_word_distance("samsng", "samsung galaxy 8") == 1
+    assert best_word_distance("macbok pro", "black macbook pro") == 1
+    assert best_word_distance("book", "macbook pro") == 0
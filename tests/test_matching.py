@@ -0,0 +1,98 @@
+"""Unit tests for the Lost/Found matching engine."""
+
+import pytest
+
+from src.models.item import Item
+from src.models.matching import MatchEngine, tokenize
+
+
+def make_item(
+    item_id: int,
+    name: str,
+    status: str,
+    date: str = "2025-10-01",
+    category: str = "Misc",
+    location: str = "Library",
+) -> Item:
+    """Builds a stored item with the given ID."""
+    return Item(name, category, date, location, status, "a@uni.ac.uk", id=item_id)
+
+
+@pytest.fixture(name="engine")
+def engine_fixture() -> MatchEngine:
+    """Fixture providing an engine with a 14 day window."""
+    return MatchEngine(window_days=14)
+
+
+def test_tokenize() -> None:
+    """Test that names are split into distinct lowercase words."""
+    assert tokenize("Blue Umbrella, blue!") == {"blue", "umbrella"}
+    assert tokenize("A 4 x") == set()
+
+
+def test_lost_item_matches_found_item(engine: MatchEngine) -> None:
+    """Test that a similar Found item is suggested for a Lost report."""
+    lost = make_item(1, "Blue Umbrella", "Lost")
+    found = make_item(2, "Umbrella blue", "Found", date="2025-10-03")
+
+    assert engine.add(lost) == []
+    [match] = engine.add(found)
+
+    assert (match.lost, match.found) == (lost, found)
+    assert 0.9 < match.score <= 1
+    assert engine.matches_for(1) == [match]
+    assert engine.best_matches() == [match]
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        make_item(2, "Blue Umbrella", "Lost"),
+        make_item(2, "Blue Umbrella", "Claimed"),
+        make_item(2, "Blue Umbrella", "Found", category="Clothing"),
+        make_item(2, "Blue Umbrella", "Found", date="2025-11-01"),
+        make_item(2, "Red Scarf", "Found"),
+    ],
+)
+def test_items_outside_the_block_never_match(engine: MatchEngine, other: Item) -> None:
+    """Test that status, category, date window and name tokens block pairs."""
+    engine.add(make_item(1, "Blue Umbrella", "Lost"))
+    assert engine.add(other) == []
+    assert engine.best_matches() == []
+
+
+def test_matches_are_ranked(engine: MatchEngine) -> None:
+    """Test that closer names, dates and locations score higher."""
+    engine.add(make_item(1, "Black Leather Wallet", "Lost"))
+    engine.add(make_item(2, "Black Leather Wallet", "Found", date="2025-10-02"))
+    engine.add(
+        make_item(3, "Leather Wallet", "Found", date="2025-10-09", location="Gym")
+    )
+
+    assert [m.found.id for m in engine.matches_for(1)] == [2, 3]
+    assert [m.found.id for m in engine.matches_for(1, limit=1)] == [2]
+
+
+def test_updates_and_removals_are_incremental(engine: MatchEngine) -> None:
+    """Test that replacing or removing an item drops its stale matches."""
+    engine.add(make_item(1, "Blue Umbrella", "Lost"))
+    engine.add(make_item(2, "Blue Umbrella", "Found"))
+
+    engine.add(make_item(2, "Blue Umbrella", "Claimed"))
+    assert engine.best_matches() == []
+    assert len(engine) == 1
+
+    engine.add(make_item(3, "Blue Umbrella", "Found"))
+    engine.remove(1)
+    assert engine.best_matches() == []
+    assert engine.matches_for(3) == []
+
+
+def test_common_words_do_not_make_candidates() -> None:
+    """Test that words shared by too many items of a block are skipped."""
+    engine = MatchEngine(max_block_size=2)
+    for item_id, name in enumerate(["Black Phone", "Black Bag", "Black Coat"], start=1):
+        engine.add(make_item(item_id, name, "Found"))
+
+    assert [m.found.id for m in engine.add(make_item(4, "Black Coat", "Lost"))] == [3]
+    assert engine.add(make_item(5, "Black Hat", "Lost")) == []
@@ -0,0 +1,210 @@
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.models.database import DatabaseManager
+from src.models.item import Item
+from src.models.migrations import SCHEMA_VERSION, get_schema_version, migrate
+from src.utils.dates import date_to_day_number
+
+
+@pytest.fixture(name="legacy_db_path")
+def legacy_db_fixture(tmp_path: Path) -> str:
+    """
+    Fixture providing a database file created with the original, unversioned
+    schema and populated with a handful of rows.
+    """
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            date TEXT NOT NULL,
+            location TEXT NOT NULL,
+            status TEXT NOT NULL,
+            contact_info TEXT NOT NULL
+        )
+        """)
+    conn.executemany(
+        """
+        INSERT INTO items (name, category, date, location, status, contact_info)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (f"Item {i}", "Misc", f"2025-01-{i + 1:02d}", "Library", "Lost", "a@b.c")
+            for i in range(25)
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_new_database_is_at_latest_version(tmp_path: Path) -> None:
+    """Test that a fresh database is created at the current schema version."""
+    db = DatabaseManager(db_name=str(tmp_path / "fresh.db"))
+    with sqlite3.connect(db.db_name) as conn:
+        assert get_schema_version(conn) == SCHEMA_VERSION
+
+
+def test_legacy_database_is_migrated_in_batches(legacy_db_path: str) -> None:
+    """Test that an unversioned database is upgraded and fully backfilled."""
+    DatabaseManager(db_name=legacy_db_path, migration_batch_size=4)
+
+    with sqlite3.connect(legacy_db_path) as conn:
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        rows = conn.execute("SELECT date, date_num FROM items").fetchall()
+        indexes = [row[1] for row in conn.execute("PRAGMA index_list(items)")]
+
+    assert len(rows) == 25
+    for date, date_num in rows:
+        assert date_num == date_to_day_number(date)
+    assert "idx_items_date_num" in indexes
+
+
+def test_legacy_text_columns_are_encoded(legacy_db_path: str) -> None:
+    """Test that category and status text is moved into the lookup tables."""
+    db = DatabaseManager(db_name=legacy_db_path, migration_batch_size=4)
+
+    with sqlite3.connect(legacy_db_path) as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(items)")]
+        categories = conn.execute("SELECT name FROM categories").fetchall()
+
+    assert "category" not in columns and "category_id" in columns
+    assert categories == [("Misc",)]
+    items = db.filter_items(category="Misc", status="Lost")
+    assert [item.name for item in items] == [f"Item {i}" for i in range(25)]
+
+
+def test_encoded_tables_keep_ids_and_sequence(legacy_db_path: str) -> None:
+    """Test that rebuilding the tables keeps IDs and never reuses deleted ones."""
+    with sqlite3.connect(legacy_db_path) as conn:
+        conn.execute("DELETE FROM items WHERE id > 20")
+    db = DatabaseManager(db_name=legacy_db_path, migration_batch_size=4)
+
+    new_id = db.add_item(Item("Pen", "Misc", "2025-02-01", "Quad", "Lost", "a@b.c"))
+    with sqlite3.connect(legacy_db_path) as conn:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master")]
+        ids = [row[0] for row in conn.execute("SELECT id FROM items ORDER BY id")]
+
+    assert new_id == 26
+    assert ids == list(range(1, 21)) + [26]
+    assert "items_rebuild" not in tables and "items_archive_rebuild" not in tables
+    assert db.stats().total == 21
+
+
+def test_legacy_rows_get_duplicate_hashes(legacy_db_path: str) -> None:
+    """Test that existing rows are backfilled for duplicate detection."""
+    db = DatabaseManager(db_name=legacy_db_path, migration_batch_size=4)
+    probe = Item("item 3", "Misc", "2025-01-04", "library", "Found", "x@y.z")
+    assert [item.name for item in db.find_duplicates(probe)] == ["Item 3"]
+
+
+def test_legacy_rows_are_in_the_change_log(legacy_db_path: str) -> None:
+    """Test that syncing from the start of the log yields the existing items."""
+    db = DatabaseManager(db_name=legacy_db_path, migration_batch_size=4)
+    change_set = db.changes_since(0, limit=100)
+    assert [change.item_id for change in change_set.changes] == list(range(1, 26))
+    assert db.change_cursor() == 25
+
+
+def test_archived_rows_are_added_to_the_change_log(tmp_path: Path) -> None:
+    """Test that items archived before the archive was logged are backfilled."""
+    db = DatabaseManager(db_name=str(tmp_path / "archived.db"))
+    db.add_item(Item("Keys", "Keys", "2020-01-01", "Quad", "Claimed", "a@b.c"))
+    db.archive_claimed_items("2021-01-01", 10)
+    db.close()
+    with sqlite3.connect(db.db_name) as conn:
+        for event in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER trg_item_changes_archive_{event}")
+        conn.execute("DELETE FROM item_changes")
+        conn.execute("PRAGMA user_version = 11")
+
+    [change] = DatabaseManager(db_name=db.db_name).changes_since(0).changes
+    assert change.archived and change.item.name == "Keys"
+
+
+def test_migrate_is_idempotent(legacy_db_path: str) -> None:
+    """Test that re-running migrations on an up-to-date database is a no-op."""
+    conn = sqlite3.connect(legacy_db_path)
+    assert migrate(conn) == SCHEMA_VERSION
+    assert migrate(conn) == SCHEMA_VERSION
+    conn.close()
+
+
+def _hold_migration_lock(db_path: str, heartbeat: float) -> None:
+    """Records a migration lock as if another process were migrating."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE schema_lock "
+            "(id INTEGER PRIMARY KEY, token TEXT, heartbeat REAL)"
+        )
+        conn.execute("INSERT INTO schema_lock VALUES (1, 'other', ?)", (heartbeat,))
+    conn.close()
+
+
+def test_migrate_waits_for_another_process(
+    legacy_db_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a migration in progress elsewhere is waited for."""
+    monkeypatch.setattr("src.models.migrations.MIGRATION_LOCK_POLL", 0.01)
+    _hold_migration_lock(legacy_db_path, time.time())
+
+    versions = []
+    waiter = threading.Thread(
+        target=lambda: versions.append(migrate(sqlite3.connect(legacy_db_path)))
+    )
+    waiter.start()
+    waiter.join(0.3)
+    assert waiter.is_alive() and versions == []
+
+    with sqlite3.connect(legacy_db_path) as conn:
+        conn.execute("DELETE FROM schema_lock")
+    conn.close()
+    waiter.join(5)
+    assert versions == [SCHEMA_VERSION]
+
+
+def test_migrate_takes_over_a_stale_lock(legacy_db_path: str) -> None:
+    """Test that a lock left behind by a crashed process does not block forever."""
+    _hold_migration_lock(legacy_db_path, 0.0)
+    conn = sqlite3.connect(legacy_db_path)
+    assert migrate(conn) == SCHEMA_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM schema_lock").fetchone() == (0,)
+    conn.close()
+
+
+def test_migrate_rejects_newer_schema(tmp_path: Path) -> None:
+    """Test that a database from a newer release is not silently downgraded."""
+    conn = sqlite3.connect(str(tmp_path / "future.db"))
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    with pytest.raises(RuntimeError):
+        migrate(conn)
+    conn.close()
+
+
+def test_added_items_store_day_number(tmp_path: Path) -> None:
+    """Test that inserts and updates keep the day number column in sync."""
+    db = DatabaseManager(db_name=str(tmp_path / "days.db"))
+    item = Item("Keys", "Misc", "2025-10-01", "Library", "Lost", "ann@uni.ac.uk")
+    db.add_item(item)
+    item.date = "2025-10-05"
+    db.update_item(item)
+
+    with sqlite3.connect(db.db_name) as conn:
+        date_num = conn.execute("SELECT date_num FROM items").fetchone()[0]
+    assert date_num == date_to_day_number("2025-10-05")
+
+
+def test_legacy_rows_are_counted_in_stats(legacy_db_path: str) -> None:
+    """Test that the summary table is backfilled from existing rows."""
+    db = DatabaseManager(db_name=legacy_db_path, migration_batch_size=4)
+    stats = db.stats()
+    assert stats.total == 25
+    assert stats.by_status == {"Lost": 25}
+    assert len(stats.by_day) == 25
@@ -4,7 +4,7 @@ from datetime import date, timedelta
 
 import pytest
 
-from src.models.item import Item, ValidationError
+from src.models.item import Item, ValidationError, merge_edits, validate_batch
 
 
 @pytest.fixture(name="valid_item")
@@ -21,14 +21,14 @@ def valid_item_data() -> dict:
         "date": "2023-10-25",
         "location": "Library",
         "status": "Found",
-        "contact_info": "john.doe@university.ac.uk"
+        "contact_info": "john.doe@university.ac.uk",
     }
-    
+
 
 def test_create_valid_item(valid_item: dict) -> None:
     """Test that an Item can be created with valid data."""
     item = Item(**valid_item)
-    
+
     assert item.name == "Black iPhone 13"
     assert item.category == "Electronics"
     assert item.date == "2023-10-25"
@@ -37,9 +37,9 @@ def test_create_valid_item(valid_item: dict) -> None:
     assert item.contact_info == "john.doe@university.ac.uk"
 
 
-@pytest.mark.parametrize("missing_field", [
-    "name", "category", "date", "location", "status", "contact_info"
-])
+@pytest.mark.parametrize(
+    "missing_field", ["name", "category", "date", "location", "status", "contact_info"]
+)
 def test_item_missing_required_fields(valid_item: dict, missing_field: str) -> None:
     """
     Test that missing or empty required fields raise a ValidationError
@@ -48,23 +48,30 @@ def test_item_missing_required_fields(valid_item: dict, missing_field: str) -> N
         valid_item (dict): The valid item data fixture.
         missing_field (str): The field to empty out for the test.
     """
-    valid_item[missing_field] = "   " # Test with empty string
-    with pytest.raises(ValidationError, match=f"Field '{missing_field}' cannot be empty"):
+    valid_item[missing_field] = "   "  # Test with empty string
+    with pytest.raises(
+        ValidationError, match=f"Field '{missing_field}' cannot be empty"
+    ):
         Item(**valid_item)
-        
-    valid_item[missing_field] = None # Test with None
-    with pytest.raises(ValidationError, match=f"Field '{missing_field}' cannot be empty"):
+
+    valid_item[missing_field] = None  # Test with None
+    with pytest.raises(
+        ValidationError, match=f"Field '{missing_field}' cannot be empty"
+    ):
         Item(**valid_item)
-    
-
-@pytest.mark.parametrize("invalid_date", [
-    "25-10-2023", # Wrong format (DD-MM-YYYY)
-    "2023/10/25", # Wrong separator
-    "Not a date", # Arbitrary string
-    "2023-13-10", # Invalid month
-    "2023-12-45", # Invalid day
-    "2023-43-41", # Invalid month and day
-])    
+
+
+@pytest.mark.parametrize(
+    "invalid_date",
+    [
+        "25-10-2023",  # Wrong format (DD-MM-YYYY)
+        "2023/10/25",  # Wrong separator
+        "Not a date",  # Arbitrary string
+        "2023-13-10",  # Invalid month
+        "2023-12-45",  # Invalid day
+        "2023-43-41",  # Invalid month and day
+    ],
+)
 def test_item_invalid_date_format(valid_item: dict, invalid_date: str) -> None:
     """
     Test that invalid date formats raise a ValidationError.
@@ -82,16 +89,19 @@ def test_item_future_date_invalid(valid_item: dict) -> None:
     """Tes that providing a date in the future raises a ValidationError."""
     future_date = (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")
     valid_item["date"] = future_date
-    
+
     with pytest.raises(ValidationError, match=f"Date cannot be in the future"):
         Item(**valid_item)
-        
 
-@pytest.mark.parametrize("invalid_status", [
-    "Stolen",
-    "Pending",
-    "RandomStatus",
-])
+
+@pytest.mark.parametrize(
+    "invalid_status",
+    [
+        "Stolen",
+        "Pending",
+        "RandomStatus",
+    ],
+)
 def test_item_invalid_status(valid_item: dict, invalid_status: str) -> None:
     """
     Test that invalid statuses raises a ValidationError.
@@ -102,5 +112,60 @@ def test_item_invalid_status(valid_item: dict, invalid_status: str) -> None:
         invalid_status (str): An unrecognised status.
     """
     valid_item["status"] = invalid_status
-    with pytest.raises(ValidationError, match="Status must be 'Lost', 'Found', or 'Claimed'"):
+    with pytest.raises(
+        ValidationError, match="Status must be 'Lost', 'Found', or 'Claimed'"
+    ):
         Item(**valid_item)
+
+
+def test_validate_batch_matches_item_rules(valid_item: dict) -> None:
+    """Test that batch validation reports exactly the errors Item raises."""
+    tomorrow = (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")
+    rows = [
+        dict(valid_item),
+        dict(valid_item, name="  "),
+        dict(valid_item, date="2023-1-5"),
+        dict(valid_item, date="2023-02-30"),
+        dict(valid_item, date=tomorrow),
+        dict(valid_item, status="Stolen"),
+        dict(valid_item, date="bad", status="Stolen"),
+        {k: v for k, v in valid_item.items() if k != "contact_info"},
+        dict(valid_item, date="2023-02-30"),
+    ]
+
+    expected = {}
+    for index, row in enumerate(rows):
+        try:
+            Item(**{"contact_info": None, **row})
+        except ValidationError as e:
+            expected[index] = str(e)
+
+    assert validate_batch(rows) == expected
+    assert sorted(expected) == [1, 3, 4, 5, 6, 7, 8]
+
+
+def test_validate_batch_of_valid_rows_is_empty(valid_item: dict) -> None:
+    """Test that a batch without errors yields an empty report."""
+    assert validate_batch([valid_item] * 1000) == {}
+    assert validate_batch([]) == {}
+
+
+def test_merge_edits_keeps_both_sides(valid_item: dict) -> None:
+    """Test that a merge keeps the user's edited fields over the stored row."""
+    base = Item(**valid_item, id=4, version=2)
+    edited = Item(
+        **{**valid_item, "name": "Red Scarf", "location": "Gym"}, id=4, version=2
+    )
+    latest = Item(
+        **{**valid_item, "status": "Claimed", "location": "Cafeteria"}, id=4, version=3
+    )
+
+    merged, conflicts = merge_edits(base, edited, latest)
+
+    assert (merged.name, merged.location, merged.status) == (
+        "Red Scarf",
+        "Gym",
+        "Claimed",
+    )
+    assert (merged.id, merged.version) == (4, 3)
+    assert conflicts == ["location"]
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from src.models.database import DatabaseManager
+from src.models.profiles import PROFILES, resolve_pragmas
+
+
+def pragma(db: DatabaseManager, name: str) -> int:
+    """Reads a pragma from the calling thread's connection."""
+    return db._connect().execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def test_profile_is_applied_to_connections(tmp_path: Path) -> None:
+    """Test that every connection gets the profile's pragmas."""
+    db = DatabaseManager(str(tmp_path / "profile.db"), profile="server")
+    assert pragma(db, "cache_size") == PROFILES["server"]["cache_size"]
+    assert pragma(db, "busy_timeout") == PROFILES["server"]["busy_timeout"]
+    assert pragma(db, "synchronous") == 1
+    assert pragma(db, "temp_store") == 2
+
+
+def test_overrides_replace_profile_values(tmp_path: Path) -> None:
+    """Test that individual pragmas can be overridden."""
+    db = DatabaseManager(
+        str(tmp_path / "override.db"),
+        profile="bulk-load",
+        pragmas={"cache_size": -1000, "synchronous": "FULL"},
+    )
+    assert pragma(db, "cache_size") == -1000
+    assert pragma(db, "synchronous") == 2
+    assert pragma(db, "temp_store") == 2
+
+
+def test_read_only_manager_applies_profile(tmp_path: Path) -> None:
+    """Test that read-only connections are configured too."""
+    db_name = str(tmp_path / "ro.db")
+    DatabaseManager(db_name)
+    reader = DatabaseManager(db_name, read_only=True, pragmas={"mmap_size": 0})
+    assert pragma(reader, "mmap_size") == 0
+    assert pragma(reader, "cache_size") == PROFILES["desktop"]["cache_size"]
+
+
+@pytest.mark.parametrize(
+    "profile, overrides",
+    [
+        ("turbo", None),
+        ("desktop", {"journal_mode": "DELETE"}),
+        ("desktop", {"synchronous": "OFF; DROP TABLE items"}),
+        ("desktop", {"cache_size": 1.5}),
+    ],
+)
+def test_invalid_configuration_is_rejected(profile: str, overrides: dict) -> None:
+    """Test that unknown profiles, pragmas and unsafe values raise ValueError."""
+    with pytest.raises(ValueError):
+        resolve_pragmas(profile, overrides)
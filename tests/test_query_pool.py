@@ -0,0 +1,77 @@
+from pathlib import Path
+import sqlite3
+from typing import Generator
+
+import pytest
+
+from src.controllers.app_controller import AppController
+from src.controllers.query_pool import QueryPool
+from src.models.database import DatabaseManager
+from src.models.item import Item
+
+
+@pytest.fixture(name="controller")
+def app_controller(tmp_path: Path) -> AppController:
+    """Fixture providing a populated controller on a temporary database."""
+    controller = AppController(DatabaseManager(str(tmp_path / "test_pool.db")))
+    for i in range(10):
+        location = "Library" if i % 2 else "Gym"
+        status = "Found" if i < 5 else "Lost"
+        controller.add_item(
+            Item(f"Item {i}", "Misc", "2025-10-01", location, status, "a@uni.ac.uk")
+        )
+    return controller
+
+
+@pytest.fixture(name="pool")
+def query_pool(controller: AppController) -> Generator[QueryPool, None, None]:
+    """Fixture providing a two-process query pool on the same database."""
+    with QueryPool(controller.db.db_name, workers=2) as pool:
+        yield pool
+
+
+def test_search_matches_controller(controller: AppController, pool: QueryPool) -> None:
+    """Test that pool searches return the same results as the controller."""
+    expected = controller.search_items("library", status="Lost")
+    assert pool.search_items("library", status="Lost") == expected
+
+
+def test_search_rows_are_compact_tuples(pool: QueryPool) -> None:
+    """Test that rows come back as plain tuples, with keyset paging."""
+    rows = pool.search_rows("item", limit=3)
+    assert [row[0] for row in rows] == [1, 2, 3]
+    assert rows[0] == (
+        1,
+        "Item 0",
+        "Misc",
+        "2025-10-01",
+        "Gym",
+        "Found",
+        "a@uni.ac.uk",
+        1,
+    )
+
+    rows = pool.search_rows("item", after_id=8, limit=3)
+    assert [row[0] for row in rows] == [9, 10]
+
+
+def test_filter_rows(pool: QueryPool) -> None:
+    """Test filtering through the pool."""
+    rows = pool.filter_rows(status="Found")
+    assert len(rows) == 5
+
+
+def test_workers_see_new_writes(controller: AppController, pool: QueryPool) -> None:
+    """Test that read-only workers observe rows committed by the writer."""
+    controller.add_item(
+        Item("Umbrella", "Misc", "2025-10-02", "Gym", "Found", "b@uni.ac.uk")
+    )
+    assert [row[1] for row in pool.search_rows("umbrella")] == ["Umbrella"]
+
+
+def test_read_only_manager_rejects_writes(controller: AppController) -> None:
+    """Test that a read-only DatabaseManager cannot modify the database."""
+    reader = DatabaseManager(controller.db.db_name, read_only=True)
+    assert len(reader.get_all_items()) == 10
+    with pytest.raises(sqlite3.OperationalError):
+        reader.delete_item(1)
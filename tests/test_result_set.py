@@ -0,0 +1,72 @@
+"""Unit tests for lazily fetched result sets."""
+
+from typing import List, Optional, Sequence
+
+import pytest
+
+from src.models.item import Item
+from src.models.result_set import ResultSet
+from src.models.search import SearchResult
+
+
+class FakeStore:
+    """Serves items by ID and records every fetch."""
+
+    def __init__(self, count: int) -> None:
+        self.items = {
+            i: Item(f"Item {i}", "Misc", "2025-10-01", "Gym", "Lost", "a@b.c", id=i)
+            for i in range(1, count + 1)
+        }
+        self.fetches: List[List[int]] = []
+
+    def fetch(self, ids: Sequence[int]) -> List[Optional[SearchResult]]:
+        self.fetches.append(list(ids))
+        return [
+            SearchResult(self.items[item_id]) if item_id in self.items else None
+            for item_id in ids
+        ]
+
+
+@pytest.fixture(name="store")
+def store_fixture() -> FakeStore:
+    """Fixture providing 25 items."""
+    return FakeStore(25)
+
+
+def test_items_are_fetched_in_batches_on_demand(store: FakeStore) -> None:
+    """Test that only the batches covering a window are fetched."""
+    results = ResultSet(range(25, 0, -1), store.fetch, batch_size=10)
+    assert len(results) == 25 and store.fetches == []
+
+    assert [r.item.id for r in results.window(8, 12)] == [17, 16, 15, 14]
+    assert store.fetches == [list(range(25, 15, -1)), list(range(15, 5, -1))]
+    assert results[-1].item.id == 1
+    assert results[9].item.id == 16
+    assert len(store.fetches) == 3
+
+
+def test_cache_is_bounded(store: FakeStore) -> None:
+    """Test that old batches are evicted and fetched again when revisited."""
+    results = ResultSet(range(1, 26), store.fetch, batch_size=5, cached_batches=2)
+    assert [result.item.id for result in results] == list(range(1, 26))
+    assert len(results._batches) == 2
+    results.window(0, 5)
+    assert store.fetches[-1] == [1, 2, 3, 4, 5]
+    assert len(store.fetches) == 6
+
+
+def test_deleted_items_are_skipped(store: FakeStore) -> None:
+    """Test that items deleted since the search are left out of windows."""
+    results = ResultSet([1, 2, 3], store.fetch)
+    del store.items[2]
+    assert results[1] is None
+    assert [result.item.id for result in results.window(0, 10)] == [1, 3]
+
+
+def test_from_results_caches_the_given_results(store: FakeStore) -> None:
+    """Test that results already in memory are not fetched again."""
+    ranked = [SearchResult(store.items[i], {"name": [(0, 4)]}) for i in (7, 3, 9)]
+    results = ResultSet.from_results(ranked, store.fetch, batch_size=2)
+    assert list(results.ids) == [7, 3, 9]
+    assert results.window(0, 3) == ranked
+    assert store.fetches == []
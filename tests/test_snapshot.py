@@ -0,0 +1,108 @@
+"""Unit tests for the persisted view snapshot."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.models.item import Item
+from src.views.snapshot import ViewSnapshot
+
+FILTERS = {
+    "search": "umb",
+    "start_date": "",
+    "end_date": "",
+    "category": "All",
+    "status": "Lost",
+    "view_mode": "Cards",
+    "include_archive": False,
+    "fuzzy_search": False,
+    "sort_column": "name",
+    "sort_descending": False,
+}
+
+
+@pytest.fixture(name="snapshot")
+def snapshot_fixture() -> ViewSnapshot:
+    """Fixture providing a snapshot of a filtered card view."""
+    item = Item(
+        "Blue Umbrella",
+        "Misc",
+        "2025-10-01",
+        "Library",
+        "Lost",
+        "a@uni.ac.uk",
+        id=7,
+        version=3,
+    )
+    return ViewSnapshot(
+        database="/data/lost_and_found.db",
+        data_version=42,
+        filters=dict(FILTERS),
+        items=[item],
+        spans={7: {"name": [(5, 8)]}},
+        complete=False,
+    )
+
+
+def test_snapshot_round_trip(snapshot: ViewSnapshot, tmp_path: Path) -> None:
+    """Test that a saved snapshot loads back unchanged."""
+    path = str(tmp_path / "view.json")
+    snapshot.save(path)
+    assert ViewSnapshot.load(path) == snapshot
+    assert not Path(f"{path}.tmp").exists()
+
+
+def test_missing_snapshot_is_ignored(tmp_path: Path) -> None:
+    """Test that a first launch without a snapshot starts cold."""
+    assert ViewSnapshot.load(str(tmp_path / "view.json")) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        '{"format": 1}',
+        '{"format": 99, "items": []}',
+    ],
+)
+def test_invalid_snapshot_is_ignored(tmp_path: Path, content: str) -> None:
+    """Test that corrupt or incompatible snapshots are ignored."""
+    path = tmp_path / "view.json"
+    path.write_text(content)
+    assert ViewSnapshot.load(str(path)) is None
+
+
+def test_snapshot_with_invalid_item_is_ignored(
+    snapshot: ViewSnapshot, tmp_path: Path
+) -> None:
+    """Test that a snapshot holding an item that no longer validates is ignored."""
+    path = tmp_path / "view.json"
+    snapshot.save(str(path))
+    data = json.loads(path.read_text())
+    data["items"][0][4] = "Stolen"
+    path.write_text(json.dumps(data))
+    assert ViewSnapshot.load(str(path)) is None
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {name: value for name, value in FILTERS.items() if name != "fuzzy_search"},
+        {**FILTERS, "include_archive": "yes"},
+        {**FILTERS, "view_mode": "Gallery"},
+        {**FILTERS, "sort_column": "colour"},
+        {**FILTERS, "search": None},
+    ],
+)
+def test_snapshot_with_invalid_filters_is_ignored(
+    snapshot: ViewSnapshot, tmp_path: Path, filters: dict
+) -> None:
+    """Test that snapshots with missing or unexpected filter settings are ignored."""
+    path = tmp_path / "view.json"
+    snapshot.save(str(path))
+    data = json.loads(path.read_text())
+    data["filters"] = filters
+    path.write_text(json.dumps(data))
+    assert ViewSnapshot.load(str(path)) is None
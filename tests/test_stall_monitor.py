@@ -0,0 +1,132 @@
+"""Unit tests for the event loop stall monitor."""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+import pytest
+
+from src.views.stall_monitor import StallMonitor
+
+
+class FakeScheduler:
+    """Stands in for a Tk widget, firing heartbeats on demand."""
+
+    def __init__(self) -> None:
+        self.pending: Optional[Callable[[], None]] = None
+        self.cancelled: List[Any] = []
+
+    def after(self, ms: int, func: Callable[[], None]) -> Any:
+        self.pending = func
+        return "after#1"
+
+    def after_cancel(self, after_id: Any) -> None:
+        self.cancelled.append(after_id)
+        self.pending = None
+
+    def fire(self) -> None:
+        func, self.pending = self.pending, None
+        func()
+
+
+class FakeClock:
+    """A manually advanced clock, in seconds."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="scheduler")
+def scheduler_fixture() -> FakeScheduler:
+    """Fixture providing a fake Tk scheduler."""
+    return FakeScheduler()
+
+
+@pytest.fixture(name="clock")
+def clock_fixture() -> FakeClock:
+    """Fixture providing a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture(name="monitor")
+def monitor_fixture(
+    scheduler: FakeScheduler, clock: FakeClock, tmp_path: Path
+) -> StallMonitor:
+    """Fixture providing a started monitor logging to a temporary file."""
+    monitor = StallMonitor(
+        scheduler,
+        str(tmp_path / "stalls.jsonl"),
+        threshold_ms=200,
+        interval_ms=100,
+        clock=clock,
+    )
+    monitor.start()
+    return monitor
+
+
+def test_stall_is_attributed_to_slowest_handler(
+    monitor: StallMonitor, scheduler: FakeScheduler, clock: FakeClock
+) -> None:
+    """Test that a late heartbeat is logged with the handler that blocked."""
+    with monitor.track("_on_selection_change"):
+        clock.now += 0.01
+    with monitor.track("_refresh_display") as details:
+        clock.now += 0.5
+        details["items"] = 5000
+    clock.now = 0.6
+    scheduler.fire()
+
+    [record] = [
+        json.loads(line) for line in Path(monitor.log_path).read_text().splitlines()
+    ]
+    assert record["stall_ms"] == pytest.approx(500)
+    assert record["action"] == "_refresh_display"
+    assert record["action_ms"] == pytest.approx(500)
+    assert record["items"] == 5000
+    assert list(monitor.stalls) == [record]
+
+
+def test_short_delays_are_not_stalls(
+    monitor: StallMonitor, scheduler: FakeScheduler, clock: FakeClock
+) -> None:
+    """Test that heartbeats within the threshold are not logged."""
+    with monitor.track("_refresh_display"):
+        clock.now += 0.05
+    clock.now = 0.25
+    scheduler.fire()
+
+    assert not monitor.stalls
+    assert not Path(monitor.log_path).exists()
+    assert scheduler.pending is not None
+
+
+def test_handlers_are_forgotten_after_each_heartbeat(
+    monitor: StallMonitor, scheduler: FakeScheduler, clock: FakeClock
+) -> None:
+    """Test that a stall is not blamed on a handler from an earlier interval."""
+    with monitor.track("_execute_deletions"):
+        clock.now += 0.05
+    clock.now = 0.1
+    scheduler.fire()
+    clock.now = 0.7
+    scheduler.fire()
+
+    assert [record["action"] for record in monitor.stalls] == [None]
+
+
+def test_stopped_monitor_does_not_track(
+    scheduler: FakeScheduler, clock: FakeClock
+) -> None:
+    """Test that tracking is a no-op until the monitor is started."""
+    monitor = StallMonitor(scheduler, clock=clock)
+    with monitor.track("_refresh_display") as details:
+        details["items"] = 1
+    assert scheduler.pending is None
+
+    monitor.start()
+    monitor.stop()
+    assert scheduler.cancelled == ["after#1"]
+    assert not monitor.running
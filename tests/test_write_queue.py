@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from src.models.database import ConflictError, DatabaseManager
+from src.models.item import Item
+from src.models.write_queue import WriteQueue
+
+
+@pytest.fixture(name="db")
+def db_fixture(tmp_path: Path) -> DatabaseManager:
+    """Fixture providing a DatabaseManager on a temporary database."""
+    return DatabaseManager(db_name=str(tmp_path / "test_write_queue.db"))
+
+
+@pytest.fixture(name="write_queue")
+def write_queue_fixture(db: DatabaseManager) -> Generator[WriteQueue, None, None]:
+    """Fixture providing a running WriteQueue."""
+    with WriteQueue(db, max_batch_size=16, max_delay=0.01) as write_queue:
+        yield write_queue
+
+
+def make_item(n: int) -> Item:
+    """Builds a valid item with a distinct name."""
+    return Item(f"Item {n}", "Misc", "2025-10-01", "Library", "Lost", "a@uni.ac.uk")
+
+
+def test_futures_resolve_to_results(
+    write_queue: WriteQueue, db: DatabaseManager
+) -> None:
+    """Test that each caller receives the result of its own write."""
+    item = make_item(1)
+    item_id = write_queue.submit_add(item).result(timeout=5)
+    assert item_id == item.id
+
+    item.status = "Found"
+    assert write_queue.submit_update(item).result(timeout=5) is True
+    assert db.get_item(item_id).status == "Found"
+
+    assert write_queue.submit_delete(item_id).result(timeout=5) is True
+    assert write_queue.submit_delete(item_id).result(timeout=5) is False
+
+
+def test_concurrent_producers(write_queue: WriteQueue, db: DatabaseManager) -> None:
+    """Test that concurrent submissions are all committed with unique IDs."""
+    with ThreadPoolExecutor(max_workers=8) as producers:
+        futures = list(
+            producers.map(lambda n: write_queue.submit_add(make_item(n)), range(200))
+        )
+    ids = [future.result(timeout=5) for future in futures]
+
+    assert len(set(ids)) == 200
+    assert db.stats().total == 200
+
+
+def test_failing_write_does_not_abort_batch(db: DatabaseManager) -> None:
+    """Test that one failing operation only fails its own future."""
+    bad = make_item(2)
+    bad.date = "not a date"
+    results = db.write_batch(
+        [("add", (make_item(1),)), ("add", (bad,)), ("add", (make_item(3),))]
+    )
+
+    assert isinstance(results[1], ValueError)
+    assert [item.name for item in db.get_all_items()] == ["Item 1", "Item 3"]
+
+
+def test_error_is_reported_through_future(write_queue: WriteQueue) -> None:
+    """Test that exceptions are delivered to the submitting caller."""
+    bad = make_item(1)
+    bad.date = "not a date"
+    with pytest.raises(ValueError):
+        write_queue.submit_add(bad).result(timeout=5)
+
+
+def test_close_flushes_pending_writes(db: DatabaseManager) -> None:
+    """Test that closing the queue commits everything already submitted."""
+    write_queue = WriteQueue(db, max_delay=1.0)
+    futures = [write_queue.submit_add(make_item(n)) for n in range(5)]
+    write_queue.close()
+
+    assert all(future.done() for future in futures)
+    assert len(db.get_all_items()) == 5
+    with pytest.raises(RuntimeError):
+        write_queue.submit_add(make_item(6))
+
+
+def test_update_conflict_through_queue(
+    write_queue: WriteQueue, db: DatabaseManager
+) -> None:
+    """Test that optimistic update conflicts reach the submitting caller."""
+    item = make_item(1)
+    write_queue.submit_add(item).result(timeout=5)
+    stale = db.get_item(item.id)
+    assert write_queue.submit_update(item, expected_version=1).result(timeout=5)
+
+    with pytest.raises(ConflictError):
+        write_queue.submit_update(stale, expected_version=stale.version).result(
+            timeout=5
+        )